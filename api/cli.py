@@ -0,0 +1,80 @@
+"""
+Maintenance commands for the API database.
+
+Usage:
+    python -m api.cli rebuild-order-stats [--company-id ID]
+    python -m api.cli purge-refresh-tokens [--older-than-days N]
+"""
+
+# Import standard library modules
+import argparse
+import sys
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+# Import database session factory and maintenance operations
+from api.db.db_engine import SessionLocal
+from api.db.order_stats_db import rebuild_order_status_counts
+from api.db.refresh_token_db import purge_refresh_tokens
+
+
+def rebuild_order_stats(company_id: Optional[int]) -> int:
+    """Recompute the order status rollup in its own transaction."""
+    db = SessionLocal()
+    try:
+        rows = rebuild_order_status_counts(db, company_id=company_id)
+        db.commit()
+        return rows
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def purge_expired_refresh_tokens(older_than_days: int) -> int:
+    """Delete refresh tokens that expired more than older_than_days ago."""
+    db = SessionLocal()
+    try:
+        rows = purge_refresh_tokens(db, datetime.utcnow() - timedelta(days=older_than_days))
+        db.commit()
+        return rows
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m api.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-order-stats",
+        help="Backfill or repair the order status rollup from the orders table",
+    )
+    rebuild.add_argument("--company-id", type=int, default=None, help="Only this company")
+
+    purge = commands.add_parser(
+        "purge-refresh-tokens",
+        help="Delete expired refresh tokens",
+    )
+    purge.add_argument(
+        "--older-than-days", type=int, default=1, help="Keep tokens that expired more recently",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild-order-stats":
+        rows = rebuild_order_stats(args.company_id)
+        print(f"Rebuilt order status counts ({rows} rows)")
+    elif args.command == "purge-refresh-tokens":
+        rows = purge_expired_refresh_tokens(args.older_than_days)
+        print(f"Purged {rows} expired refresh tokens")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
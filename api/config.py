@@ -17,8 +17,112 @@ GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
 GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI")
 
+# GitHub HTTP client: base URLs (point both at a stub server in tests),
+# connect/read timeouts (seconds), retries of requests that are safe to
+# repeat, and pooled keep-alive connections per worker
+GITHUB_OAUTH_URL = os.getenv("GITHUB_OAUTH_URL", "https://github.com")
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_CONNECT_TIMEOUT = float(os.getenv("GITHUB_CONNECT_TIMEOUT", "3"))
+GITHUB_READ_TIMEOUT = float(os.getenv("GITHUB_READ_TIMEOUT", "10"))
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "2"))
+GITHUB_POOL_MAXSIZE = int(os.getenv("GITHUB_POOL_MAXSIZE", "20"))
+
+# Async engine driver for read endpoints (empty disables the async engine;
+# requests then fall back to the sync engine in the thread pool)
+DB_ASYNC_DRIVER = os.getenv("DB_ASYNC_DRIVER", "asyncpg")
+
+# Connection pools per database node and worker process. Budget per worker
+# and node: DB_POOL_SIZE + DB_MAX_OVERFLOW (sync engine), plus
+# DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW when DB_ASYNC_DRIVER is set.
+# Multiplied by the number of workers this must stay below the server's
+# max_connections (PostgreSQL default 100) minus admin/migration slots.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", str(DB_POOL_SIZE)))
+DB_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+
+# Read replicas for read-only endpoints (comma-separated host[:port] list;
+# empty routes every read to the primary)
+DB_REPLICA_HOSTS = [h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()]
+DB_REPLICA_EJECT_SECONDS = float(os.getenv("DB_REPLICA_EJECT_SECONDS", "30"))
+# Reads of a client that just wrote go to the primary for this long (seconds)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+# Authenticated principal cache (seconds; 0 disables caching). Invalidation
+# on logout, deactivation or role change only reaches the worker that made
+# the change, so the TTL is how long other workers may still accept a revoked
+# session: keep it short (PRINCIPAL_CACHE_MAX_REVOCATION_SECONDS)
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+PRINCIPAL_CACHE_MAX_REVOCATION_SECONDS = 60
+
+# Search totals: above this planner row estimate the estimate is returned
+# instead of an exact count (PostgreSQL only; 0 disables estimation)
+PAGINATION_APPROX_TOTAL_THRESHOLD = int(os.getenv("PAGINATION_APPROX_TOTAL_THRESHOLD", "0"))
+
+# Search filters on unindexed columns are rejected above this planner row
+# estimate (PostgreSQL only; 0 allows them on any table size)
+FILTER_UNINDEXED_MAX_ROWS = int(os.getenv("FILTER_UNINDEXED_MAX_ROWS", "100000"))
+
+# Exports: rows fetched per round trip from the server-side cursor
+EXPORT_FETCH_SIZE = int(os.getenv("EXPORT_FETCH_SIZE", "1000"))
+
+# Password hashing: werkzeug method for new hashes (older hashes are upgraded
+# on login), worker processes (0 hashes inline), jobs queued or running at
+# once, and seconds a request waits for a slot before failing with 503
+PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+
+# Refresh tokens: lifetime (seconds) and how long an already rotated token is
+# still accepted (parallel requests refreshing at once) before reuse is
+# treated as theft and the whole session is revoked
+REFRESH_TOKEN_TTL_SECONDS = int(os.getenv("REFRESH_TOKEN_TTL_SECONDS", str(14 * 24 * 3600)))
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = float(os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "30"))
+
+# OAuth flow store for state and exchange codes: "memory" (per process, one
+# worker only) or "database" (oauth_flow_entries, shared by workers and
+# hosts); OAUTH_FLOW_STORE_URL puts the table in a separate database, e.g.
+# sqlite:////var/lib/app/oauth_flows.db for the workers of a single host
+OAUTH_FLOW_STORE = os.getenv("OAUTH_FLOW_STORE", "memory")
+OAUTH_FLOW_STORE_URL = os.getenv("OAUTH_FLOW_STORE_URL", "")
+OAUTH_FLOW_STORE_MAX_SIZE = int(os.getenv("OAUTH_FLOW_STORE_MAX_SIZE", "10000"))
+
+# Dashboard snapshot cache per tenant and role (seconds; 0 disables caching)
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "10"))
+DASHBOARD_CACHE_MAX_SIZE = int(os.getenv("DASHBOARD_CACHE_MAX_SIZE", "1000"))
+
+
+def db_connection_budget() -> int:
+    """Most connections one worker may open to one database node."""
+    budget = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    if DB_ASYNC_DRIVER:
+        budget += DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW
+    return budget
+
 
 def validate_config() -> None:
+    if OAUTH_FLOW_STORE not in ("memory", "database"):
+        raise RuntimeError("OAUTH_FLOW_STORE must be 'memory' or 'database'")
+
+    # PostgreSQL's default max_connections; one worker alone must fit well below it
+    if db_connection_budget() > 100:
+        logger.warning(
+            "One worker may open up to %s connections per database node "
+            "(DB_POOL_SIZE/DB_MAX_OVERFLOW + DB_ASYNC_POOL_SIZE/DB_ASYNC_MAX_OVERFLOW); "
+            "check it against max_connections times the number of workers.",
+            db_connection_budget(),
+        )
+
+    if PRINCIPAL_CACHE_TTL_SECONDS > PRINCIPAL_CACHE_MAX_REVOCATION_SECONDS:
+        logger.warning(
+            "PRINCIPAL_CACHE_TTL_SECONDS=%s: revoked sessions stay valid in other "
+            "workers for up to that long; keep it at or below %s seconds.",
+            PRINCIPAL_CACHE_TTL_SECONDS,
+            PRINCIPAL_CACHE_MAX_REVOCATION_SECONDS,
+        )
+
     if IS_PRODUCTION:
         required = {
             "JWT_SECRET": JWT_SECRET,
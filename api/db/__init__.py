@@ -19,6 +19,10 @@ from api.db.item_db import *
 from api.db.company_db import *
 from api.db.order_items_db import *
 from api.db.order_db import *
+from api.db.order_stats_db import *
 from api.db.user_db import *
 from api.db.role_db import *
-from api.db.oauth_db import *
\ No newline at end of file
+from api.db.oauth_db import *
+from api.db.refresh_token_db import *
+from api.db.oauth_flow_db import *
+from api.db.async_db import *
\ No newline at end of file
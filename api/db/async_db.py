@@ -0,0 +1,187 @@
+"""
+Async versions of the read repository functions.
+
+Each function runs the corresponding sync repository function through
+``AsyncSession.run_sync``: the ORM code executes in a greenlet while the
+driver (asyncpg) waits on the event loop, so an in-flight query does not
+occupy a thread. There is a single query implementation per repository
+function; the async functions only change how it is awaited.
+
+All wrapped functions eager-load every relationship their callers read, so
+returned entities can be used after the await without lazy loading (lazy
+loads outside run_sync raise MissingGreenlet).
+
+Usage:
+    page = await paginate_items_async(db, filters={}, company_id=1, limit=10, offset=0)
+
+When no async driver is configured, get_async_db yields a SyncSessionRunner
+instead of an AsyncSession; it offers the same run_sync coroutine but runs
+the function on the sync engine in the thread pool.
+"""
+
+# Import standard library modules
+from datetime import date
+from typing import Callable, Optional, Sequence, Set, Tuple, TypeVar
+
+# Import FastAPI helper for running blocking code off the event loop
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+# Import sync repository functions wrapped below
+from api.db.company_db import paginate_companies
+from api.db.item_db import paginate_items
+from api.db.order_db import paginate_order
+from api.db.order_items_db import paginate_order_items
+from api.db.order_stats_db import sum_order_status_counts
+from api.db.user_db import count_users, get_oauth_providers, get_user_data_by_id, paginate_users
+
+T = TypeVar("T")
+
+
+class SyncSessionRunner:
+    """
+    AsyncSession-compatible facade over a sync Session.
+
+    Used by get_async_db when no async engine is configured (local runs
+    without asyncpg, tests on SQLite). Exposes the subset of the AsyncSession
+    API used by async repositories and get_async_db.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def run_sync(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    def in_transaction(self) -> bool:
+        return self.sync_session.in_transaction()
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+# --- Item Reads ---
+
+async def paginate_items_async(
+    db,
+    filters: dict,
+    company_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+    q: Optional[str] = None,
+):
+    """Async paginate_items (company eager-loaded, optional fuzzy search). Returns Page."""
+    return await db.run_sync(
+        paginate_items, filters, company_id, limit, offset, after=after, sort=sort, q=q
+    )
+
+
+# --- Company Reads ---
+
+async def paginate_companies_async(
+    db,
+    filters: dict,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+):
+    """Async paginate_companies. Returns Page."""
+    return await db.run_sync(
+        paginate_companies, filters, limit, offset, after=after, sort=sort
+    )
+
+
+# --- Order Reads ---
+
+async def paginate_order_async(
+    db,
+    filters: dict,
+    company_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+):
+    """Async paginate_order (company eager-loaded, display dates added). Returns Page."""
+    return await db.run_sync(
+        paginate_order, filters, company_id, limit, offset, after=after, sort=sort
+    )
+
+
+async def paginate_order_items_async(
+    db,
+    order_id: int,
+    company_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+):
+    """Async paginate_order_items (rows are plain tuples). Returns Page."""
+    return await db.run_sync(
+        paginate_order_items, order_id, company_id, limit, offset, after=after, sort=sort
+    )
+
+
+async def sum_order_status_counts_async(
+    db,
+    company_id: Optional[int],
+    is_superadmin: bool,
+    from_day: date,
+    to_day: date,
+    order_type: Optional[str] = None,
+):
+    """Async sum_order_status_counts. Returns (status, count) rows."""
+    return await db.run_sync(
+        sum_order_status_counts, company_id, is_superadmin, from_day, to_day, order_type
+    )
+
+
+# --- User Reads ---
+
+async def get_user_data_by_id_async(db, user_id: int):
+    """Async get_user_data_by_id (role and company eager-loaded)."""
+    return await db.run_sync(get_user_data_by_id, user_id)
+
+
+async def get_oauth_providers_async(db, user_id: int) -> Set[str]:
+    """Async get_oauth_providers."""
+    return await db.run_sync(get_oauth_providers, user_id)
+
+
+async def paginate_users_async(
+    db,
+    filters: dict,
+    allowed_roles: Optional[Set[str]],
+    company_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    exclude_user_id: Optional[int] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+):
+    """Async paginate_users (role and company eager-loaded). Returns Page."""
+    return await db.run_sync(
+        paginate_users, filters, allowed_roles, company_id, limit, offset,
+        after=after, exclude_user_id=exclude_user_id, sort=sort,
+    )
+
+
+async def count_users_async(db, company_id=None, online_only=False) -> int:
+    """Async count_users."""
+    return await db.run_sync(count_users, company_id=company_id, online_only=online_only)
+
+# --- Async Repository Design Notes ---
+# Only read paths have async versions; writes keep using the sync session
+# run_sync keeps one SQL implementation for both engines (no drift between paths)
+# Callers must not touch unloaded relationships after the await
+# SyncSessionRunner keeps async routes working without an async driver
@@ -1,8 +1,23 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from api.models.company import Company
+from api.db.filters import EQ, IN, PREFIX, FilterField, FilterSpec
+from api.db.pagination import SortSpec, fetch_page
+
+# Filterable company fields for company searches
+COMPANY_FILTERS = FilterSpec(
+    Company,
+    [
+        FilterField("id", EQ | IN),
+        FilterField("name", EQ | PREFIX),
+        FilterField("field", EQ | IN),
+    ],
+)
+
+# Client-selectable orderings (name has a unique index)
+COMPANY_SORT = SortSpec({"name": Company.name}, tie_breaker=Company.id)
 
 def get_company_data_by_id(db: Session, company_id: Optional[int]) -> Optional[Company]:
     """
@@ -166,6 +181,37 @@ def company_exists_by_name(db: Session, name: str):
         .first()
     )
 
+def paginate_companies(
+    db: Session,
+    filters: dict,
+    limit: int,
+    offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+):
+    """
+    Get paginated list of companies with declared filters.
+    
+    Args:
+        db (Session): Database session
+        filters (dict): Criteria declared in COMPANY_FILTERS (unknown keys rejected)
+        limit (int): Maximum companies per page
+        offset (int): Companies to skip for pagination
+        after (Optional[str]): Keyset cursor from the previous page (replaces offset)
+        sort (Sequence[Tuple[str, str]]): Requested (field, direction) ordering;
+            fields are whitelisted in COMPANY_SORT, id is always the final tie-breaker
+        
+    Returns:
+        Page: Companies of the page with total count and next cursor
+        
+    Used for: Superadmin company administration, dashboard
+    """
+    query = COMPANY_FILTERS.apply(db, db.query(Company), filters)
+
+    return fetch_page(
+        query, sort=COMPANY_SORT.keys(sort), limit=limit, offset=offset, after=after
+    )
+
 # --- Multi-Tenant Company Design Notes ---
 # Companies serve as top-level tenant containers for data isolation
 # Company names must be unique across the entire system
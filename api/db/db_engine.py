@@ -1,11 +1,59 @@
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from api.config import dbname, host, password, user
+from api.config import (
+    DB_ASYNC_DRIVER,
+    DB_ASYNC_MAX_OVERFLOW,
+    DB_ASYNC_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_REPLICA_EJECT_SECONDS,
+    DB_REPLICA_HOSTS,
+    READ_YOUR_WRITES_SECONDS,
+    dbname,
+    host,
+    password,
+    user,
+)
+from api.db.replicas import DatabaseNode, ReplicaRouter
 
 DB: Optional[Engine] = None
+ASYNC_DB: Optional[AsyncEngine] = None
+PRIMARY: Optional[DatabaseNode] = None
+REPLICAS: List[DatabaseNode] = []
+
+
+def _build_node(node_host: str, is_primary: bool = False) -> DatabaseNode:
+    db_string = "postgresql://{2}:{3}@{0}/{1}".format(node_host, dbname, user, password)
+    engine = create_engine(
+        db_string,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=not is_primary,  # Detect dead replica connections before use
+    )
+
+    async_engine = None
+    if DB_ASYNC_DRIVER:
+        # Event-loop driven engine for async endpoints (no thread per in-flight query)
+        async_db_string = "postgresql+{4}://{2}:{3}@{0}/{1}".format(
+            node_host, dbname, user, password, DB_ASYNC_DRIVER
+        )
+        async_engine = create_async_engine(
+            async_db_string,
+            pool_size=DB_ASYNC_POOL_SIZE,       # Same budget as the sync pool by default
+            max_overflow=DB_ASYNC_MAX_OVERFLOW,
+            pool_timeout=30,
+            pool_recycle=3600,
+            pool_pre_ping=not is_primary,
+        )
+
+    return DatabaseNode(node_host, engine, async_engine, is_primary=is_primary)
+
 
 if any(db_info is None for db_info in [host, dbname, user, password]):
     db_info = [
@@ -17,14 +65,22 @@ if any(db_info is None for db_info in [host, dbname, user, password]):
     none_variables = [name for name, value in db_info if value is None]
     print(f"The following variables are None: {', '.join(none_variables)}")
 else:
-    db_string = "postgresql://{2}:{3}@{0}/{1}".format(host, dbname, user, password)
-    DB = create_engine(
-        db_string,
-        pool_size=10,
-        max_overflow=20,
-        pool_timeout=30,
-        pool_recycle=3600,
-    )
+    PRIMARY = _build_node(host, is_primary=True)
+    DB, ASYNC_DB = PRIMARY.engine, PRIMARY.async_engine
+    REPLICAS = [_build_node(replica_host) for replica_host in DB_REPLICA_HOSTS]
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=DB)
+AsyncSessionLocal = (
+    async_sessionmaker(ASYNC_DB, autoflush=False, expire_on_commit=False)
+    if ASYNC_DB is not None
+    else None
+)
 Base = declarative_base()
+
+# Routes read-only requests to replicas (everything goes to PRIMARY without replicas)
+replica_router = ReplicaRouter(
+    PRIMARY,
+    REPLICAS,
+    eject_seconds=DB_REPLICA_EJECT_SECONDS,
+    pin_seconds=READ_YOUR_WRITES_SECONDS,
+)
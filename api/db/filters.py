@@ -0,0 +1,332 @@
+"""
+Declarative filters for search endpoints.
+
+Each entity declares which fields clients may filter on and with which
+operators. The declaration is compiled once (column, value coercion,
+allowed operators, index coverage) and turns PaginationRequest.filters into
+SQL expressions:
+
+    {"status": "online"}                               -> status = 'online'  (eq shorthand)
+    {"status": {"in": ["online", "away"]}}             -> status IN (...)
+    {"created_at": {"range": ["2024-01-01", None]}}    -> created_at >= '2024-01-01'
+    {"sku": {"prefix": "AB-"}}                         -> sku LIKE 'AB-%'
+    {"completed_at": {"is_null": True}}                -> completed_at IS NULL
+
+range is half-open [from, to); either bound may be null. Unknown fields or
+operators are rejected with ValidationError (HTTP 422).
+
+Filters without a supporting index are rejected once the table is estimated
+to hold more than FILTER_UNINDEXED_MAX_ROWS rows, so a client cannot trigger
+a sequential scan of a large table. Coverage is tracked per operator: prefix
+needs a pattern index (text_pattern_ops / varchar_pattern_ops or C
+collation), because a btree under the default collation cannot serve LIKE.
+
+Usage:
+    ITEM_FILTERS = FilterSpec(Item, [FilterField("sku", EQ | PREFIX)], scope_column="company_id")
+    query = ITEM_FILTERS.apply(db, query, filters, scoped=company_id is not None)
+"""
+
+# Import standard library modules
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence
+
+# Import SQLAlchemy components for expressions and table metadata
+from sqlalchemy import and_, text
+from sqlalchemy.orm import Query, Session
+
+# Import threshold configuration, cache and domain exceptions (mapped to HTTP 422)
+from api.config import FILTER_UNINDEXED_MAX_ROWS
+from api.domain.exceptions import ValidationError
+from api.utils.cache_utils import TTLCache
+
+# --- Operators ---
+
+EQ = frozenset({"eq"})
+IN = frozenset({"in"})
+RANGE = frozenset({"range"})
+PREFIX = frozenset({"prefix"})
+IS_NULL = frozenset({"is_null"})
+
+MAX_IN_VALUES = 500  # Upper bound for IN lists (keeps statements and plans small)
+
+# Index operator classes / collations under which a btree serves LIKE 'x%'
+PATTERN_OPS = frozenset({"text_pattern_ops", "varchar_pattern_ops", "bpchar_pattern_ops"})
+PATTERN_COLLATIONS = frozenset({"C", "POSIX"})
+
+# Planner row estimates per table (refreshed every few minutes)
+_row_estimates: TTLCache = TTLCache(ttl_seconds=300, max_size=100)
+
+
+@dataclass(frozen=True)
+class FilterField:
+    """
+    One filterable field of an entity.
+
+    Args:
+        name: Public filter name (also the model attribute, unless column is given)
+        operators: Allowed operators (EQ | IN | RANGE | PREFIX | IS_NULL)
+        column: Column attribute when it differs from getattr(model, name)
+    """
+    name: str
+    operators: FrozenSet[str] = EQ
+    column: Any = None
+
+
+@dataclass(frozen=True)
+class _CompiledField:
+    name: str
+    column: Any
+    operators: FrozenSet[str]
+    coerce: Callable[[str, Any], Any]
+    indexed: FrozenSet[str]         # Operators served by an index regardless of tenant scope
+    indexed_scoped: FrozenSet[str]  # Operators served when the query is filtered by the tenant column
+
+
+class FilterSpec:
+    """
+    Compiled whitelist of filterable fields for one entity.
+
+    Args:
+        model: Mapped entity class
+        fields: Filterable fields
+        scope_column: Tenant column every scoped query filters on (e.g.
+            company_id); indexes led by it also serve the next column
+    """
+
+    def __init__(self, model, fields: Sequence[FilterField], scope_column: Optional[str] = None):
+        self.model = model
+        self.table = model.__table__
+        index_prefixes = _index_prefixes(self.table)
+
+        self.fields: Dict[str, _CompiledField] = {}
+        for field in fields:
+            column = field.column if field.column is not None else getattr(model, field.name)
+            column_name = column.property.columns[0].name
+            scoped_prefix = (scope_column, column_name) if scope_column is not None else None
+            self.fields[field.name] = _CompiledField(
+                name=field.name,
+                column=column,
+                operators=field.operators,
+                coerce=_coercer_for(column.property.columns[0].type.python_type),
+                indexed=_covered_operators(field.operators, index_prefixes.get((column_name,))),
+                indexed_scoped=_covered_operators(field.operators, index_prefixes.get(scoped_prefix)),
+            )
+
+    def compile(
+        self,
+        filters: Dict[str, Any],
+        scoped: bool = False,
+        table_rows: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Translate request filters into SQL expressions.
+
+        Args:
+            filters: PaginationRequest.filters (special keys removed by caller)
+            scoped: Query is restricted by the tenant column
+            table_rows: Row estimate of the table (None = unknown, treated as small)
+
+        Returns:
+            list: WHERE clauses to AND together
+
+        Raises:
+            ValidationError: Unknown field/operator, invalid value, or an
+                unindexed filter on a large table
+        """
+        clauses = []
+        for name, raw in filters.items():
+            field = self.fields.get(name)
+            if field is None:
+                raise ValidationError(f"Filtering on '{name}' is not supported")
+
+            conditions = raw if isinstance(raw, dict) else {"eq": raw}
+            if not conditions:
+                raise ValidationError(f"Filter '{name}' has no operator")
+
+            for operator, value in conditions.items():
+                if operator not in field.operators:
+                    raise ValidationError(f"Operator '{operator}' is not supported for '{name}'")
+                self._check_index(field, operator, scoped, table_rows)
+                clauses.append(_OPERATORS[operator](field, value))
+        return clauses
+
+    def apply(self, db: Session, query: Query, filters: Dict[str, Any], scoped: bool = False) -> Query:
+        """Filter query by request filters (see compile)."""
+        if not filters:
+            return query
+        clauses = self.compile(filters, scoped, table_row_estimate(db, self.table.name))
+        return query.filter(and_(*clauses))
+
+    def _check_index(
+        self,
+        field: _CompiledField,
+        operator: str,
+        scoped: bool,
+        table_rows: Optional[int],
+    ) -> None:
+        if FILTER_UNINDEXED_MAX_ROWS <= 0 or table_rows is None:
+            return
+        if operator in field.indexed or (scoped and operator in field.indexed_scoped):
+            return
+        if table_rows > FILTER_UNINDEXED_MAX_ROWS:
+            raise ValidationError(
+                f"Filter '{operator}' on '{field.name}' is not available for this dataset size"
+            )
+
+
+def table_row_estimate(db: Session, table_name: str) -> Optional[int]:
+    """
+    Planner estimate of a table's row count (PostgreSQL pg_class.reltuples).
+
+    Returns:
+        Optional[int]: Estimated rows, or None on databases without statistics
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    estimate = _row_estimates.get(table_name)
+    if estimate is None:
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": table_name},
+        ).scalar() or 0
+        _row_estimates.set(table_name, estimate)
+    return estimate
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards in user input (use with escape="\\")."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# --- Compilation Helpers ---
+
+def _index_prefixes(table) -> Dict[tuple, bool]:
+    """
+    Leading one- and two-column prefixes of the table's full (non-partial)
+    indexes, each mapped to whether its last column can serve LIKE 'x%'.
+    """
+    # (column names, names of columns indexed with a pattern operator class)
+    column_lists: List[tuple] = [([column.name for column in table.primary_key.columns], set())]
+
+    for index in table.indexes:
+        is_partial = any(
+            options.get("where") is not None for options in index.dialect_options.values()
+        )
+        if not is_partial:
+            ops = index.dialect_options["postgresql"]["ops"] or {}
+            pattern_columns = {name for name, opclass in ops.items() if opclass in PATTERN_OPS}
+            column_lists.append(([column.name for column in index.columns], pattern_columns))
+
+    for constraint in table.constraints:
+        if constraint.__class__.__name__ == "UniqueConstraint":
+            column_lists.append(([column.name for column in constraint.columns], set()))
+
+    prefixes: Dict[tuple, bool] = {}
+    for names, pattern_columns in column_lists:
+        for length in (1, 2):
+            if len(names) >= length:
+                last = names[length - 1]
+                serves_like = last in pattern_columns or _has_pattern_collation(table.c[last])
+                prefix = tuple(names[:length])
+                prefixes[prefix] = prefixes.get(prefix, False) or serves_like
+    return prefixes
+
+
+def _has_pattern_collation(column) -> bool:
+    return getattr(column.type, "collation", None) in PATTERN_COLLATIONS
+
+
+def _covered_operators(operators: FrozenSet[str], serves_like: Optional[bool]) -> FrozenSet[str]:
+    # serves_like is None when no index starts with the column
+    if serves_like is None:
+        return frozenset()
+    return operators if serves_like else operators - PREFIX
+
+
+def _coercer_for(python_type) -> Callable[[str, Any], Any]:
+    def coerce(name: str, value: Any) -> Any:
+        try:
+            if python_type is bool:
+                if isinstance(value, bool):
+                    return value
+            elif python_type is int:
+                if isinstance(value, int) and not isinstance(value, bool):
+                    return value
+                if isinstance(value, str) and value.lstrip("-").isdigit():
+                    return int(value)
+            elif python_type is Decimal:
+                if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+                    return Decimal(str(value))
+            elif python_type is datetime:
+                if isinstance(value, datetime):
+                    return value
+                if isinstance(value, str):
+                    return datetime.fromisoformat(value)
+            elif python_type is date:
+                if isinstance(value, str):
+                    return date.fromisoformat(value)
+            elif isinstance(value, python_type):
+                return value
+        except (ValueError, InvalidOperation):
+            pass
+        raise ValidationError(f"Invalid value for filter '{name}'")
+    return coerce
+
+
+def _eq(field: _CompiledField, value):
+    return field.column == field.coerce(field.name, value)
+
+
+def _in(field: _CompiledField, values):
+    if not isinstance(values, list) or not values or len(values) > MAX_IN_VALUES:
+        raise ValidationError(
+            f"Filter '{field.name}' expects a list of 1 to {MAX_IN_VALUES} values"
+        )
+    return field.column.in_([field.coerce(field.name, value) for value in values])
+
+
+def _range(field: _CompiledField, bounds):
+    if not isinstance(bounds, list) or len(bounds) != 2 or bounds == [None, None]:
+        raise ValidationError(f"Filter '{field.name}' expects [from, to] with at least one bound")
+
+    low, high = bounds
+    clauses = []
+    if low is not None:
+        clauses.append(field.column >= field.coerce(field.name, low))
+    if high is not None:
+        clauses.append(field.column < field.coerce(field.name, high))
+    return and_(*clauses)
+
+
+def _prefix(field: _CompiledField, value):
+    value = field.coerce(field.name, value)
+    if not isinstance(value, str) or not value:
+        raise ValidationError(f"Filter '{field.name}' expects a non-empty prefix")
+    return field.column.like(f"{escape_like(value)}%", escape="\\")
+
+
+def _is_null(field: _CompiledField, value):
+    if not isinstance(value, bool):
+        raise ValidationError(f"Filter '{field.name}' expects true or false")
+    return field.column.is_(None) if value else field.column.is_not(None)
+
+
+_OPERATORS = {
+    "eq": _eq,
+    "in": _in,
+    "range": _range,
+    "prefix": _prefix,
+    "is_null": _is_null,
+}
+
+# --- Filter Design Notes ---
+# Only whitelisted columns are filterable; relationships and secrets never are
+# Specs are compiled at import time, requests only look up precompiled fields
+# Index coverage is derived from the model's indexes (partial indexes excluded),
+# so adding an index in the model makes the filter available on large tables
+# PostgreSQL prefix filters use an index only with C collation or text_pattern_ops,
+# so prefix coverage requires such an index (see migration 009)
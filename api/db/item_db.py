@@ -1,9 +1,47 @@
-from typing import Optional
+from dataclasses import replace
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Float, Integer, case, cast, column, func, literal, select, union_all, update, values
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import asc
-from api.models.item import Item
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from api.config import EXPORT_FETCH_SIZE
+from api.db.filters import EQ, IN, PREFIX, RANGE, FilterField, FilterSpec, escape_like
+from api.db.pagination import SortKey, SortSpec, fetch_page
+from api.domain.order import StockAdjustment
+from api.models.item import Item, item_search_text
 
-LOW_STOCK_THRESHOLD = 20
+LOW_STOCK_THRESHOLD = 20  # Also the predicate of partial index ix_items_low_stock
+STOCK_ADJUSTMENT_BATCH_SIZE = 500  # Items per UPDATE (SQLite compound SELECT limit)
+UPSERT_BATCH_SIZE = 500  # Rows per INSERT ... ON CONFLICT (SQLite compound SELECT limit)
+ITEM_SEARCH_MAX_TERMS = 8  # Words of a search query that are matched (rest ignored)
+
+# Exported item columns (name/sku/price/quantity match the import format)
+ITEM_EXPORT_COLUMNS = ("id", "sku", "name", "price", "quantity", "is_active")
+
+# Filterable item fields (low_stock is handled separately by paginate_items)
+ITEM_FILTERS = FilterSpec(
+    Item,
+    [
+        FilterField("id", EQ | IN),
+        FilterField("name", EQ | PREFIX),
+        FilterField("sku", EQ | IN | PREFIX),
+        FilterField("is_active"),
+        FilterField("quantity", EQ | RANGE),
+        FilterField("price", EQ | RANGE),
+    ],
+    scope_column="company_id",
+)
+
+# Client-selectable orderings (each backed by an index led by company_id)
+ITEM_SORT = SortSpec(
+    {
+        "name": Item.name,        # ix_items_company_name
+        "sku": Item.sku,          # uniq_company_sku
+        "price": Item.price,      # ix_items_company_price
+    },
+    tie_breaker=Item.id,
+)
 
 def insert_item(db: Session, item: Item):
     """
@@ -19,20 +57,150 @@ def insert_item(db: Session, item: Item):
     db.add(item)
     db.flush()  # Persist to get item.id without committing transaction
 
-def apply_stock_change(db: Session, item: Item, delta: int):
+def upsert_items(db: Session, rows: Sequence[dict]) -> int:
+    """
+    Insert items or update existing ones with the same (company_id, sku).
+    
+    Args:
+        db (Session): Database session
+        rows (Sequence[dict]): Item values (name, sku, price, quantity, company_id);
+            a SKU should appear once per call (PostgreSQL rejects updating a row twice)
+        
+    Returns:
+        int: Number of rows written (inserted or updated)
+        
+    Used for: Bulk catalog imports (onboarding, supplier price lists)
+    Performance: One multi-row INSERT ... ON CONFLICT per batch of
+    UPSERT_BATCH_SIZE rows, resolved through the uniq_company_sku index; rows
+    are not loaded into the session, so memory does not grow with the import
+    Note: Existing items keep their id, is_active flag and order history
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = insert(Item).values(list(rows[start:start + UPSERT_BATCH_SIZE]))
+        statement = statement.on_conflict_do_update(
+            index_elements=[Item.company_id, Item.sku],  # uniq_company_sku
+            set_={
+                "name": statement.excluded.name,
+                "price": statement.excluded.price,
+                "quantity": statement.excluded.quantity,
+            },
+        )
+        db.execute(statement)
+    return len(rows)
+
+def insert_new_items(db: Session, rows: Sequence[dict]) -> List[dict]:
+    """
+    Insert items whose (company_id, sku) is not taken yet; never update.
+
+    Args:
+        db (Session): Database session
+        rows (Sequence[dict]): Item values (name, sku, price, quantity, company_id)
+
+    Returns:
+        List[dict]: Rows that were not inserted because their SKU already
+        exists in the company (caller picks another SKU or reports them)
+
+    Used for: Bulk imports of rows without a SKU (generated SKUs must never
+    overwrite an existing item)
+    Performance: One multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING
+    per batch of UPSERT_BATCH_SIZE rows
     """
-    Adjust item inventory quantity (positive or negative changes).
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    inserted = set()
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = (
+            insert(Item)
+            .values(list(rows[start:start + UPSERT_BATCH_SIZE]))
+            .on_conflict_do_nothing(index_elements=[Item.company_id, Item.sku])  # uniq_company_sku
+            .returning(Item.sku)
+        )
+        inserted.update(db.execute(statement).scalars())
+    return [row for row in rows if row["sku"] not in inserted]
+
+def apply_stock_adjustments(db: Session, adjustments: Sequence[StockAdjustment]) -> Dict[int, int]:
+    """
+    Apply inventory changes for many items in one conditional UPDATE.
     
     Args:
         db (Session): Database session
-        item (Item): Item to adjust inventory for
-        delta (int): Change in quantity (positive = increase, negative = decrease)
+        adjustments (Sequence[StockAdjustment]): Per-item quantity changes
+            (positive = increase, negative = decrease); repeated items are summed
+        
+    Returns:
+        Dict[int, int]: New quantity per successfully adjusted item id.
+        Items missing from the result were not changed because the
+        adjustment would make their stock negative (or the item is gone).
         
-    Used for: Order fulfillment (negative), restocking (positive), inventory adjustments
-    Note: Caller responsible for validation and business logic
+    Used for: Order fulfillment (negative), restocking (positive), cancellations
+    Concurrency: The stock check happens inside the UPDATE, so parallel orders
+    for the same item can never oversell it (no read-modify-write window)
+    Note: Caller decides what to do with failed items (usually roll back)
     """
-    item.quantity += delta  # Apply inventory change
-    db.flush()              # Persist change immediately
+    # Combine repeated lines for the same item (UPDATE ... FROM applies one match per row)
+    deltas: Dict[int, int] = {}
+    for adjustment in adjustments:
+        deltas[adjustment.item_id] = deltas.get(adjustment.item_id, 0) + adjustment.delta
+
+    rows = list(deltas.items())
+    applied: Dict[int, int] = {}
+    for start in range(0, len(rows), STOCK_ADJUSTMENT_BATCH_SIZE):
+        batch = rows[start:start + STOCK_ADJUSTMENT_BATCH_SIZE]
+        source = _adjustment_source(db, batch)
+
+        statement = (
+            update(Item)
+            .where(
+                Item.id == source.c.item_id,
+                Item.quantity + source.c.delta >= 0,  # Never go below zero
+            )
+            .values(quantity=Item.quantity + source.c.delta)
+            .returning(Item.id, Item.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        for item_id, quantity in db.execute(statement):
+            applied[item_id] = quantity
+
+            # Keep already loaded items in sync with the database
+            loaded = db.identity_map.get(identity_key(Item, item_id))
+            if loaded is not None:
+                set_committed_value(loaded, "quantity", quantity)
+
+    return applied
+
+def _adjustment_source(db: Session, rows: List[Tuple[int, int]]):
+    """
+    Build the (item_id, delta) row source joined by apply_stock_adjustments.
+    
+    PostgreSQL gets a VALUES list; SQLite cannot name VALUES columns in FROM,
+    so it gets the equivalent UNION ALL of literal rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return values(
+            column("item_id", Integer),
+            column("delta", Integer),
+            name="adjustments",
+        ).data(rows)
+
+    return union_all(
+        *[
+            select(
+                literal(item_id, Integer).label("item_id"),
+                literal(delta, Integer).label("delta"),
+            )
+            for item_id, delta in rows
+        ]
+    ).subquery("adjustments")
 
 def get_item_data_by_id(db: Session, item_id: int):
     """
@@ -57,6 +225,39 @@ def get_item_data_by_id(db: Session, item_id: int):
         .first()
     )
 
+def get_items_by_ids(
+    db: Session,
+    item_ids: Sequence[int],
+    for_update: bool = False,
+) -> Dict[int, Item]:
+    """
+    Retrieve many items in a single query keyed by item ID.
+    
+    Args:
+        db (Session): Database session
+        item_ids (Sequence[int]): Item identifiers (duplicates allowed)
+        for_update (bool): Lock the rows (SELECT ... FOR UPDATE) until commit
+        
+    Returns:
+        Dict[int, Item]: Found items by ID; missing IDs are simply absent
+        
+    Used for: Order creation, bulk operations over many items
+    Concurrency: Rows are locked in ID order so concurrent orders touching
+    the same items cannot deadlock each other
+    """
+    if not item_ids:
+        return {}
+
+    query = (
+        db.query(Item)
+        .filter(Item.id.in_(set(item_ids)))
+        .order_by(Item.id)  # Deterministic lock order
+    )
+    if for_update:
+        query = query.with_for_update()
+
+    return {item.id: item for item in query.all()}
+
 def edit_item(
     db: Session,
     item_id: int,
@@ -115,6 +316,9 @@ def paginate_items(
     company_id: int,
     limit: int,
     offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+    q: Optional[str] = None,
 ):
     """
     Get paginated list of items with filtering and special sorting options.
@@ -123,17 +327,24 @@ def paginate_items(
         db (Session): Database session
         filters (dict): Search and filter criteria including:
             - low_stock: Show only items with quantity <= LOW_STOCK_THRESHOLD
-            - name: Partial name matching
-            - is_active: Active/inactive status
-            - Other item fields for exact matching
+            - Fields declared in ITEM_FILTERS (see api.db.filters for operators)
         company_id (int): Company context for multi-tenant filtering
         limit (int): Maximum items per page
         offset (int): Items to skip for pagination
+        after (Optional[str]): Keyset cursor from the previous page (replaces offset)
+        sort (Sequence[Tuple[str, str]]): Requested (field, direction) ordering;
+            fields are whitelisted in ITEM_SORT, id is always the final tie-breaker
+        q (Optional[str]): Fuzzy search text; every word must occur in the
+            item's name or SKU, results are ranked by relevance (see search_items_query)
         
     Returns:
-        tuple: (total_count, items_list) for pagination and results
+        Page: Items of the page with total count and next cursor
+        
+    Raises:
+        ValidationError: Unsupported filter field, operator or value
         
     Special Features: Low stock items are sorted by quantity ascending for priority
+    unless the client requests another ordering; searches are ranked by relevance first
     """
     # Base query with efficient company data loading
     query = (
@@ -143,34 +354,112 @@ def paginate_items(
         )
     )
 
+    default_sort = []
+
     # Special handling for low stock filter with priority sorting
     if filters.get("low_stock"):
-        query = (
-            query
-            .filter(
-                Item.quantity <= LOW_STOCK_THRESHOLD,  # Low stock threshold
-                Item.is_active == True                 # Only active items
-            )
-            .order_by(asc(Item.quantity))             # Lowest stock first
+        query = query.filter(
+            Item.quantity <= LOW_STOCK_THRESHOLD,  # Low stock threshold
+            Item.is_active == True                 # Only active items
         )
+        default_sort = [SortKey("quantity", Item.quantity)]  # Lowest stock first
 
     # Apply remaining filters (skip special filters already handled)
-    for key, value in filters.items():
-        if key in {"low_stock"}:  # Skip already processed filters
-            continue
-
-        if hasattr(Item, key):
-            query = query.filter(getattr(Item, key) == value)
+    field_filters = {key: value for key, value in filters.items() if key != "low_stock"}
+    query = ITEM_FILTERS.apply(db, query, field_filters, scoped=company_id is not None)
 
     # Multi-tenant security: restrict to user's company
     if company_id is not None:
         query = query.filter(Item.company_id == company_id)
 
-    # Get count and paginated results
-    total = query.count()
-    results = query.offset(offset).limit(limit).all()
+    terms = _search_terms(q)
+    if not terms:
+        # Get page and total count in a single statement (id breaks ties)
+        return fetch_page(
+            query,
+            sort=ITEM_SORT.keys(sort, default=default_sort),
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    # Fuzzy search: rows become (Item, relevance); sort keys read the item from row[0]
+    query, relevance = search_items_query(db, query, terms)
+    relevance_key = SortKey("relevance", relevance, descending=True, value_of=attrgetter("relevance"))
+    sort_keys = [
+        key if key is relevance_key else replace(key, value_of=_item_value_of(key))
+        for key in ITEM_SORT.keys(sort, default=[relevance_key] + default_sort)
+    ]
+
+    page = fetch_page(query, sort=sort_keys, limit=limit, offset=offset, after=after)
+    return replace(page, rows=[row[0] for row in page.rows])
+
+def stream_items(db: Session, company_id: int):
+    """
+    Iterate over all items of a company for export.
+    
+    Args:
+        db (Session): Database session (kept open while rows are consumed)
+        company_id (int): Company whose catalog is exported
+        
+    Returns:
+        Iterator[tuple]: Rows with the ITEM_EXPORT_COLUMNS values, ordered by id
+        
+    Memory: Only the listed columns are selected (no entities, no identity map)
+    and rows arrive EXPORT_FETCH_SIZE at a time through a server-side cursor
+    (stream_results on PostgreSQL), so catalog size does not affect memory
+    Used for: CSV/NDJSON catalog export
+    """
+    query = (
+        db.query(*(getattr(Item, name) for name in ITEM_EXPORT_COLUMNS))
+        .filter(Item.company_id == company_id)
+        .order_by(Item.id)
+        .yield_per(EXPORT_FETCH_SIZE)
+    )
+    return iter(query)
+
+def search_items_query(db: Session, query, terms: Sequence[str]):
+    """
+    Restrict an item query to fuzzy matches of the search terms.
+    
+    Args:
+        db (Session): Database session (the dialect selects the ranking function)
+        query: Item query (already tenant-scoped)
+        terms (Sequence[str]): Lower-cased search words
+        
+    Returns:
+        tuple: (query returning (Item, relevance) rows, relevance expression)
+        
+    Matching: Every term must be a substring of lower(name || ' ' || sku);
+    on PostgreSQL the trigram index ix_items_search serves these LIKE filters
+    Ranking: Exact SKU match > text starting with the query > other matches;
+    PostgreSQL adds pg_trgm word_similarity so closer matches rank higher
+    (SQLite, used in tests, has no trigram functions and ranks by the bonus only)
+    """
+    for term in terms:
+        query = query.filter(item_search_text.like(f"%{escape_like(term)}%", escape="\\"))
+
+    phrase = " ".join(terms)
+    relevance = case(
+        (func.lower(Item.sku) == phrase, 2.0),
+        (item_search_text.like(f"{escape_like(phrase)}%", escape="\\"), 1.0),
+        else_=0.0,
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        relevance = relevance + func.word_similarity(phrase, item_search_text)
+
+    # Double precision so cursor values round-trip exactly through JSON
+    relevance = cast(relevance, Float).label("relevance")
+    return query.add_columns(relevance), relevance
+
+def _search_terms(q: Optional[str]) -> List[str]:
+    if not q:
+        return []
+    return q.lower().split()[:ITEM_SEARCH_MAX_TERMS]
 
-    return total, results
+def _item_value_of(key: SortKey):
+    getter = key.value_of or attrgetter(key.name)
+    return lambda row: getter(row[0])
 
 # --- Item Management Design Notes ---
 # Item lifecycle: active (available) ↔ inactive (hidden from catalog)
@@ -179,3 +468,8 @@ def paginate_items(
 # Multi-tenant isolation through company_id filtering
 # Soft delete preserves data integrity for historical orders
 # Special sorting for operational priorities (low stock first)
+# Keyset cursors (after/next_cursor) keep deep pages as cheap as the first one
+# Bulk imports upsert on (company_id, sku) without loading entities into the session
+# Exports stream projected columns through a server-side cursor (yield_per)
+# Fuzzy search uses one expression (item_search_text) for index and query; keep them identical
+# Stock changes are set-based and conditional (quantity + delta >= 0) to prevent overselling
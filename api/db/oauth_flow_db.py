@@ -0,0 +1,149 @@
+# Import standard library modules
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+# Import SQLAlchemy components for statements and standalone engines
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session, sessionmaker
+
+# Import OAuth flow model and store interface
+from api.models.oauth_flow import OAuthFlowEntry
+from api.utils.flow_store import FlowStore
+
+def insert_flow_entry(db: Session, key: str, payload: str, expires_at: datetime) -> None:
+    """
+    Store an OAuth flow value.
+    
+    Args:
+        db (Session): Database session
+        key (str): Namespaced random key ("state:...", "code:...")
+        payload (str): JSON document
+        expires_at (datetime): UTC expiry
+        
+    Used for: Starting a GitHub login/link, handing a login to the web app
+    """
+    db.add(OAuthFlowEntry(key=key, payload=payload, expires_at=expires_at))
+    db.flush()
+
+def take_flow_entry(db: Session, key: str, now: datetime) -> Optional[str]:
+    """
+    Delete an OAuth flow value and return it if it has not expired.
+    
+    Args:
+        db (Session): Database session
+        key (str): Entry key
+        now (datetime): Current time (UTC)
+        
+    Returns:
+        Optional[str]: JSON payload, or None when missing or expired
+        
+    Concurrency: DELETE ... RETURNING, so only one caller gets the value
+    """
+    row = db.execute(
+        delete(OAuthFlowEntry)
+        .where(OAuthFlowEntry.key == key)
+        .returning(OAuthFlowEntry.payload, OAuthFlowEntry.expires_at)
+    ).first()
+    if row is None or row.expires_at <= now:
+        return None
+    return row.payload
+
+def purge_flow_entries(db: Session, now: datetime) -> int:
+    """
+    Delete expired OAuth flow values (abandoned flows).
+    
+    Args:
+        db (Session): Database session
+        now (datetime): Current time (UTC)
+        
+    Returns:
+        int: Number of deleted rows
+        
+    Performance: Range delete on ix_oauth_flow_entries_expires_at
+    """
+    result = db.execute(delete(OAuthFlowEntry).where(OAuthFlowEntry.expires_at <= now))
+    return result.rowcount
+
+
+class DatabaseFlowStore(FlowStore):
+    """
+    Flow store backed by the oauth_flow_entries table (shared by all workers).
+
+    Args:
+        session_factory: Creates sessions on the database holding the table
+            (default: application database)
+        sweep_interval: Minimum seconds between expiry sweeps of this process
+        clock: Monotonic time source for sweep scheduling (injectable for tests)
+
+    Each operation runs in its own short transaction, independent of the
+    request's session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        sweep_interval: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if session_factory is None:
+            from api.db.db_engine import SessionLocal
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._sweep_interval = sweep_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "DatabaseFlowStore":
+        """Store on a separate database (e.g. sqlite:////var/lib/app/oauth.db); creates the table."""
+        engine = create_engine(url)
+        OAuthFlowEntry.__table__.create(engine, checkfirst=True)
+        return cls(sessionmaker(autocommit=False, autoflush=False, bind=engine), **kwargs)
+
+    def put(self, key: str, value: dict, ttl_seconds: float) -> None:
+        now = datetime.utcnow()
+        sweep = self._sweep_due()
+        with self._transaction() as db:
+            if sweep:
+                purge_flow_entries(db, now)
+            insert_flow_entry(db, key, json.dumps(value), now + timedelta(seconds=ttl_seconds))
+
+    def pop(self, key: str) -> Optional[dict]:
+        with self._transaction() as db:
+            payload = take_flow_entry(db, key, datetime.utcnow())
+        return json.loads(payload) if payload is not None else None
+
+    def purge(self) -> int:
+        with self._transaction() as db:
+            return purge_flow_entries(db, datetime.utcnow())
+
+    def _sweep_due(self) -> bool:
+        # Abandoned flows are removed on writes, at most once per interval per process
+        with self._lock:
+            now = self._clock()
+            if now < self._next_sweep:
+                return False
+            self._next_sweep = now + self._sweep_interval
+            return True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[Session]:
+        db = self._session_factory()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+# --- OAuth Flow Storage Design Notes ---
+# Values are consumed with DELETE ... RETURNING (PostgreSQL, SQLite >= 3.35):
+# a state or exchange code can be redeemed once even across hosts
+# Expiry is also checked on read, so unswept rows are never accepted
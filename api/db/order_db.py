@@ -1,10 +1,43 @@
 # Import type hints and SQLAlchemy components
-from typing import Optional
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from typing import Dict, Optional, Sequence, Tuple
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+
+# Import export cursor configuration
+from api.config import EXPORT_FETCH_SIZE
+
+# Import shared keyset pagination and filter helpers
+from api.db.filters import EQ, IN, IS_NULL, RANGE, FilterField, FilterSpec
+from api.db.pagination import SortSpec, fetch_page
 
 # Import models for orders and related entities
-from api.models import Order, User
+from api.models import Item, Order, OrderItem, User
+
+# Exported order columns
+ORDER_EXPORT_COLUMNS = ("id", "status", "order_type", "user_id", "created_at", "completed_at")
+
+# Filterable order fields for order searches
+ORDER_FILTERS = FilterSpec(
+    Order,
+    [
+        FilterField("id", EQ | IN),
+        FilterField("status", EQ | IN),
+        FilterField("order_type", EQ | IN),
+        FilterField("user_id", EQ | IN),
+        FilterField("created_at", RANGE),
+        FilterField("completed_at", RANGE | IS_NULL),
+    ],
+    scope_column="company_id",
+)
+
+# Client-selectable orderings (each backed by an index led by company_id)
+ORDER_SORT = SortSpec(
+    {
+        "created_at": Order.created_at,  # ix_orders_company_created (NOT NULL since migration 008)
+        "status": Order.status,          # ix_orders_company_status
+    },
+    tie_breaker=Order.id,
+)
 
 def paginate_order(
     db: Session,
@@ -12,19 +45,27 @@ def paginate_order(
     company_id: int,
     limit: int,
     offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ):
     """
     Get paginated list of orders with filtering and formatted display data.
     
     Args:
         db (Session): Database session for query execution
-        filters (dict): Search criteria including status, date ranges, customer info
+        filters (dict): Search criteria declared in ORDER_FILTERS (status, date ranges, customer)
         company_id (int): Company context for multi-tenant filtering
         limit (int): Maximum orders per page
         offset (int): Number of orders to skip for pagination
+        after (Optional[str]): Keyset cursor from the previous page (replaces offset)
+        sort (Sequence[Tuple[str, str]]): Requested (field, direction) ordering;
+            fields are whitelisted in ORDER_SORT, id is always the final tie-breaker
         
     Returns:
-        tuple: (total_count, orders_list) with formatted datetime fields added
+        Page: Orders of the page (with formatted datetime fields added), total and next cursor
+        
+    Raises:
+        ValidationError: Unsupported filter field, operator or value
         
     Post-processing: Adds human-readable formatted dates for UI display
     """
@@ -36,21 +77,20 @@ def paginate_order(
         )
     )
 
-    # Apply dynamic filters based on search criteria
-    for key, value in filters.items():
-        if hasattr(Order, key):
-            query = query.filter(getattr(Order, key) == value)
+    # Apply declared filters (unknown fields are rejected)
+    query = ORDER_FILTERS.apply(db, query, filters, scoped=company_id is not None)
 
     # Multi-tenant security: restrict to user's company
     if company_id is not None:
         query = query.filter(Order.company_id == company_id)
 
-    # Get count and paginated results
-    total = query.count()
-    results = query.offset(offset).limit(limit).all()
+    # Get page and total count in a single statement
+    page = fetch_page(
+        query, sort=ORDER_SORT.keys(sort), limit=limit, offset=offset, after=after
+    )
 
     # Add formatted datetime fields for UI display (non-persistent)
-    for order in results:
+    for order in page.rows:
         # Format creation date for display (DD.MM.YYYY HH:MM)
         order.created_at_fmt = (
             order.created_at.strftime("%d.%m.%Y %H:%M")
@@ -62,7 +102,30 @@ def paginate_order(
             if order.completed_at else None
         )
 
-    return total, results
+    return page
+
+def stream_orders(db: Session, company_id: int):
+    """
+    Iterate over all orders of a company for export.
+    
+    Args:
+        db (Session): Database session (kept open while rows are consumed)
+        company_id (int): Company whose orders are exported
+        
+    Returns:
+        Iterator[tuple]: Rows with the ORDER_EXPORT_COLUMNS values, ordered by id
+        
+    Memory: Projected columns through a server-side cursor fetching
+    EXPORT_FETCH_SIZE rows at a time; millions of orders stream in constant memory
+    Used for: CSV/NDJSON order export
+    """
+    query = (
+        db.query(*(getattr(Order, name) for name in ORDER_EXPORT_COLUMNS))
+        .filter(Order.company_id == company_id)
+        .order_by(Order.id)
+        .yield_per(EXPORT_FETCH_SIZE)
+    )
+    return iter(query)
 
 def insert_order(db: Session, order: Order):
     """
@@ -100,6 +163,85 @@ def get_order_by_id(db: Session, order_id: int) -> Optional[Order]:
         .first()
     )
 
+def get_order_with_lines(db: Session, order_id: int) -> Optional[Order]:
+    """
+    Retrieve an order together with its lines and the names of their items.
+    
+    Args:
+        db (Session): Database session
+        order_id (int): Unique order identifier
+        
+    Returns:
+        Optional[Order]: Order with order.items (lines) and each line's item
+        already loaded, or None if not found
+        
+    Used for: Cancelling and completing orders (stock adjustments need every line)
+    Performance: Two queries regardless of line count - the order, then all
+    lines joined with their items (avoids one lazy item SELECT per line)
+    """
+    return (
+        db.query(Order)
+        .options(
+            selectinload(Order.items)                   # All lines in one query
+            .joinedload(OrderItem.item)                 # Item joined into the same query
+            .options(load_only(Item.name)),             # Only the name is needed
+        )
+        .filter(Order.id == order_id)
+        .first()
+    )
+
+def get_orders_with_lines(db: Session, order_ids: Sequence[int]) -> Dict[int, Order]:
+    """
+    Retrieve many orders together with their lines and item names.
+    
+    Args:
+        db (Session): Database session
+        order_ids (Sequence[int]): Order identifiers (unknown ids are skipped)
+        
+    Returns:
+        Dict[int, Order]: Found orders by id, lines loaded as in get_order_with_lines
+        
+    Used for: Bulk complete/cancel
+    Performance: Two queries for any number of orders - the orders, then all
+    of their lines joined with their items
+    """
+    if not order_ids:
+        return {}
+
+    orders = (
+        db.query(Order)
+        .options(
+            selectinload(Order.items)                   # All lines of all orders in one query
+            .joinedload(OrderItem.item)                 # Item joined into the same query
+            .options(load_only(Item.name)),             # Only the name is needed
+        )
+        .filter(Order.id.in_(list(order_ids)))
+        .all()
+    )
+    return {order.id: order for order in orders}
+
+def change_orders_status(db: Session, order_ids: Sequence[int], status: str):
+    """
+    Set the status of many orders in one UPDATE.
+    
+    Args:
+        db (Session): Database session
+        order_ids (Sequence[int]): Orders to update
+        status (str): New status
+        
+    Note: Orders already loaded in the session are updated in place
+    Used for: Bulk complete/cancel
+    """
+    if not order_ids:
+        return
+
+    db.execute(
+        update(Order)
+        .where(Order.id.in_(list(order_ids)))
+        .values(status=status)
+        .execution_options(synchronize_session="evaluate")
+    )
+
 def change_order_status(order: Order, status: str):
     """
     Update order status for workflow management.
@@ -208,4 +350,6 @@ def count_orders_grouped_by_status(
 # Alternative flows: created/processing -> cancelled
 # Status changes should trigger business logic (inventory, notifications)
 # Multi-tenant security enforced at database level
-# Formatted dates added for UI without modifying core data
\ No newline at end of file
+# Formatted dates added for UI without modifying core data
+# Exports stream projected columns through a server-side cursor (yield_per)
+# Bulk status changes load all orders and lines in two queries and update in one
\ No newline at end of file
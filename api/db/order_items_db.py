@@ -1,17 +1,35 @@
 # Import SQLAlchemy ORM components for database operations and relationship loading
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import asc
+
+# Import shared keyset pagination helpers
+from api.db.pagination import SortSpec, fetch_page
 
 # Import models for order items and related entities
 from api.models.order_item import OrderItem
 from api.models.item import Item
 
+# Client-selectable orderings of an order's lines (bounded by ix_order_items_order_id)
+ORDER_LINE_SORT = SortSpec(
+    {
+        "name": Item.name,
+        "ordered_quantity": OrderItem.quantity,
+        "unit_price": OrderItem.unit_price,
+    },
+    tie_breaker=OrderItem.id,
+    tie_breaker_name="order_item_id",
+    value_of={"name": lambda row: row[0].name},
+)
+
 def paginate_order_items(
     db: Session,
     order_id: int,
     company_id: int,
     limit: int,
     offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ):
     """
     Get paginated list of items within a specific order with pricing details.
@@ -22,12 +40,16 @@ def paginate_order_items(
         company_id (int): Company context for multi-tenant security
         limit (int): Maximum number of items per page
         offset (int): Number of items to skip for pagination
+        after (Optional[str]): Keyset cursor from the previous page (replaces offset)
+        sort (Sequence[Tuple[str, str]]): Requested (field, direction) ordering;
+            fields are whitelisted in ORDER_LINE_SORT, order_item_id breaks ties
         
     Returns:
-        tuple: (total_count, results) where results contain:
+        Page: Total count, next cursor and rows containing:
             - Item: Product information (name, description, etc.)
             - ordered_quantity: Quantity ordered for this specific order
             - unit_price: Price per unit at time of order (historical pricing)
+            - order_item_id: Order line id (stable page ordering)
             
     Used for: Order detail views, invoice generation, order editing interfaces
     Security: Company-based filtering ensures multi-tenant data isolation
@@ -38,6 +60,7 @@ def paginate_order_items(
             Item,                                          # Product details
             OrderItem.quantity.label("ordered_quantity"),  # Quantity in this order
             OrderItem.unit_price.label("unit_price"),      # Historical price
+            OrderItem.id.label("order_item_id"),           # Stable page ordering
         )
         .join(OrderItem, OrderItem.item_id == Item.id)    # Join items with order_items
         .options(joinedload(Item.company))                # Load company info efficiently
@@ -48,11 +71,14 @@ def paginate_order_items(
     if company_id is not None:
         query = query.filter(Item.company_id == company_id)
 
-    # Get total count and paginated results
-    total = query.count()
-    results = query.offset(offset).limit(limit).all()
-
-    return total, results
+    # Get page and total count in a single statement
+    return fetch_page(
+        query,
+        sort=ORDER_LINE_SORT.keys(sort),
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
 
 def insert_order_item(db: Session, order_item: OrderItem):
     """
@@ -72,6 +98,23 @@ def insert_order_item(db: Session, order_item: OrderItem):
     db.add(order_item)
     db.flush()  # Persist to database but don't commit transaction
 
+def insert_order_items(db: Session, order_items: List[dict]):
+    """
+    Add many lines to an order with a single multi-row INSERT.
+    
+    Args:
+        db (Session): Database session
+        order_items (List[dict]): Line values with order_id, item_id,
+            quantity and unit_price keys
+            
+    Note: Executed as one executemany batch, so round trips do not grow
+    with the number of lines; ORM objects are not created for the rows
+    Used for: Order creation with many lines
+    """
+    if not order_items:
+        return
+    db.execute(insert(OrderItem), order_items)
+
 def get_order_items(db: Session, order_id: int):
     """
     Retrieve all items associated with a specific order.
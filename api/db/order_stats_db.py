@@ -0,0 +1,195 @@
+# Import standard library modules
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Import SQLAlchemy components for upserts and aggregation
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+# Import models for orders and the statistics rollup
+from api.models.order import Order
+from api.models.order_status_count import OrderStatusCount
+
+_BUCKET_KEYS = ["company_id", "day", "order_type", "status"]
+
+def _upsert_counts(db: Session, rows: List[dict]):
+    """
+    Add order_count deltas to counter rows, creating missing rows.
+    
+    Args:
+        db (Session): Database session
+        rows (List[dict]): Bucket keys plus order_count delta (distinct buckets)
+        
+    Note: Single INSERT ... ON CONFLICT DO UPDATE statement, atomic under
+    concurrent order traffic (no read-modify-write)
+    """
+    dialect = db.get_bind().dialect.name
+    dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+
+    statement = dialect_insert(OrderStatusCount).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=_BUCKET_KEYS,
+        set_={"order_count": OrderStatusCount.order_count + statement.excluded.order_count},
+    )
+    db.execute(statement)
+
+def record_order_status(
+    db: Session,
+    order: Order,
+    previous_status: Optional[str] = None,
+):
+    """
+    Update the statistics rollup for a new order or an order status change.
+    
+    Args:
+        db (Session): Database session (same transaction as the order change)
+        order (Order): Order with its current (new) status already set
+        previous_status (Optional[str]): Status before the change, None for new orders
+        
+    Used for: create_order (new pending order), cancel_order, complete_order
+    """
+    if previous_status == order.status:
+        return
+
+    bucket = {
+        "company_id": order.company_id,
+        "day": order.created_at.date(),
+        "order_type": order.order_type,
+    }
+
+    rows = [{**bucket, "status": order.status, "order_count": 1}]
+    if previous_status is not None:
+        rows.append({**bucket, "status": previous_status, "order_count": -1})
+
+    _upsert_counts(db, rows)
+
+def record_order_status_changes(
+    db: Session,
+    changes: Sequence[Tuple[Order, str]],
+):
+    """
+    Update the statistics rollup for many order status changes at once.
+    
+    Args:
+        db (Session): Database session (same transaction as the order changes)
+        changes (Sequence[Tuple[Order, str]]): (order with its new status set,
+            previous status) pairs
+        
+    Used for: Bulk complete/cancel
+    Performance: Deltas are summed per counter row first, so any number of
+    orders costs one upsert (touching days x types x statuses rows)
+    """
+    deltas: Dict[tuple, int] = {}
+    for order, previous_status in changes:
+        if previous_status == order.status:
+            continue
+        bucket = (order.company_id, order.created_at.date(), order.order_type)
+        deltas[bucket + (order.status,)] = deltas.get(bucket + (order.status,), 0) + 1
+        deltas[bucket + (previous_status,)] = deltas.get(bucket + (previous_status,), 0) - 1
+
+    rows = [
+        {**dict(zip(_BUCKET_KEYS, key)), "order_count": delta}
+        for key, delta in deltas.items()
+        if delta != 0
+    ]
+    if rows:
+        _upsert_counts(db, rows)
+
+def sum_order_status_counts(
+    db: Session,
+    company_id: Optional[int],
+    is_superadmin: bool,
+    from_day: date,
+    to_day: date,
+    order_type: Optional[str] = None,
+):
+    """
+    Get order counts grouped by status from the rollup table.
+    
+    Args:
+        db (Session): Database session
+        company_id (Optional[int]): Company context for regular users
+        is_superadmin (bool): Whether user can see all companies' data
+        from_day (date): First creation day included
+        to_day (date): Last creation day included
+        order_type (Optional[str]): Restrict to sale / restock
+        
+    Returns:
+        List[tuple]: List of (status, count) tuples for each order status
+        
+    Used for: Dashboard widgets showing order status breakdown
+    Performance: Sums at most (days x statuses) counter rows per company
+    """
+    query = (
+        db.query(
+            OrderStatusCount.status,
+            func.sum(OrderStatusCount.order_count).label("count"),
+        )
+        .filter(
+            OrderStatusCount.day >= from_day,
+            OrderStatusCount.day <= to_day,
+        )
+    )
+
+    # Apply company filtering unless user is superadmin
+    if not is_superadmin:
+        query = query.filter(OrderStatusCount.company_id == company_id)
+
+    if order_type is not None:
+        query = query.filter(OrderStatusCount.order_type == order_type)
+
+    return query.group_by(OrderStatusCount.status).all()
+
+def rebuild_order_status_counts(db: Session, company_id: Optional[int] = None) -> int:
+    """
+    Recompute the statistics rollup from the orders table.
+    
+    Args:
+        db (Session): Database session
+        company_id (Optional[int]): Rebuild one company only (None = all)
+        
+    Returns:
+        int: Number of counter rows written
+        
+    Used for: Initial backfill, repairing drift after manual data changes
+    Note: Runs in the caller's transaction; commit to publish the new counters
+    """
+    clear = delete(OrderStatusCount)
+    source = select(
+        Order.company_id,
+        func.date(Order.created_at).label("day"),
+        Order.order_type,
+        Order.status,
+        func.count(Order.id).label("order_count"),
+    )
+
+    if company_id is not None:
+        clear = clear.where(OrderStatusCount.company_id == company_id)
+        source = source.where(Order.company_id == company_id)
+
+    source = source.group_by(
+        Order.company_id,
+        func.date(Order.created_at),
+        Order.order_type,
+        Order.status,
+    )
+
+    db.flush()  # Count pending order changes of this session too
+    db.execute(clear)
+    result = db.execute(
+        insert(OrderStatusCount).from_select(
+            _BUCKET_KEYS + ["order_count"],
+            source,
+        )
+    )
+    return result.rowcount
+
+# --- Order Statistics Design Notes ---
+# Counters are bucketed by the creation day of the order (UTC), matching the
+# created_at window the dashboard reports on
+# Every order change updates its counters in the same transaction, so the
+# rollup is exactly as consistent as the orders table itself
+# Concurrent orders of one company and day contend on the same counter row;
+# the upsert keeps that to a single short row lock
@@ -0,0 +1,404 @@
+"""
+Shared pagination helpers for repository functions.
+
+Every search endpoint pages through a stable ``(sort_key, ..., id)`` ordering.
+Clients can page either by ``offset`` (classic) or by an opaque ``after``
+cursor (keyset pagination). Keyset pages seek directly to the last row of the
+previous page, so page 5000 costs the same as page 1.
+
+The total is computed in the same statement as the page (``COUNT(*) OVER()``)
+and carried inside the cursor, so a page costs a single round trip. For very
+large result sets the total can come from planner statistics instead.
+
+Clients choose the ordering from a per-entity whitelist (SortSpec); the id
+tie-breaker is appended automatically so every ordering is total.
+
+Usage:
+    sort = [SortKey("quantity", Item.quantity), SortKey("id", Item.id)]
+    page = fetch_page(query, sort=sort, limit=10, offset=0, after=None)
+    page.rows, page.total, page.next_cursor
+
+    ITEM_SORT = SortSpec({"name": Item.name}, tie_breaker=Item.id)
+    sort = ITEM_SORT.keys([("name", "desc")])   # name DESC, id DESC
+"""
+
+# Import standard library modules
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Import SQLAlchemy components for ordering and row comparison
+from sqlalchemy import and_, func, or_, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+# Import estimation threshold and domain exceptions (mapped to HTTP 422)
+from api.config import PAGINATION_APPROX_TOTAL_THRESHOLD
+from api.domain.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One column of a stable page ordering.
+
+    Args:
+        name: Public name of the key (stored in the cursor)
+        column: SQL expression used for ORDER BY and the keyset filter
+        descending: Sort direction
+        value_of: Extracts the key value from a result row (defaults to getattr(row, name))
+    """
+    name: str
+    column: Any
+    descending: bool = False
+    value_of: Optional[Callable[[Any], Any]] = None
+
+    def extract(self, row) -> Any:
+        getter = self.value_of or attrgetter(self.name)
+        return getter(row)
+
+    @property
+    def token(self) -> str:
+        """Name with direction as stored in cursors ("-name" for descending)."""
+        return f"-{self.name}" if self.descending else self.name
+
+
+SORT_DIRECTIONS = {"asc": False, "desc": True}
+MAX_SORT_KEYS = 3  # Requested keys per search (the tie-breaker comes on top)
+
+
+class SortSpec:
+    """
+    Whitelist of client-selectable sort columns for one entity.
+
+    Only declare NOT NULL columns (keyset comparisons cannot step over
+    NULLs) that are backed by an index starting with the tenant column, or
+    that order a result already bounded by an indexed filter (lines of one
+    order), so sorted pages never sort a whole table.
+
+    Args:
+        columns: Public sort name -> column
+        tie_breaker: Unique column appended to every ordering (usually id)
+        tie_breaker_name: Public name of the tie-breaker
+        value_of: Row value extractors for names that are not row attributes
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        tie_breaker: Any,
+        tie_breaker_name: str = "id",
+        value_of: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ):
+        self.columns = dict(columns)
+        self.tie_breaker = tie_breaker
+        self.tie_breaker_name = tie_breaker_name
+        self.value_of = dict(value_of or {})
+
+    def keys(
+        self,
+        requested: Sequence[Tuple[str, str]] = (),
+        default: Sequence[SortKey] = (),
+    ) -> List[SortKey]:
+        """
+        Build the stable ordering for a search.
+
+        Args:
+            requested: (field, "asc" | "desc") pairs from the request
+            default: Keys used when nothing is requested (before the tie-breaker)
+
+        Returns:
+            List[SortKey]: Requested (or default) keys followed by the
+            tie-breaker, which follows the direction of the last key so the
+            whole ordering can be read from one index in one direction
+
+        Raises:
+            ValidationError: Unknown field or direction, repeated field,
+                or more than MAX_SORT_KEYS keys
+        """
+        if len(requested) > MAX_SORT_KEYS:
+            raise ValidationError(f"At most {MAX_SORT_KEYS} sort fields are supported")
+
+        keys: List[SortKey] = []
+        for field, direction in requested:
+            if field != self.tie_breaker_name and field not in self.columns:
+                raise ValidationError(f"Sorting by '{field}' is not supported")
+            if direction not in SORT_DIRECTIONS:
+                raise ValidationError(f"Invalid sort direction '{direction}'")
+            if any(key.name == field for key in keys):
+                raise ValidationError(f"Sort field '{field}' is repeated")
+
+            column = self.tie_breaker if field == self.tie_breaker_name else self.columns[field]
+            keys.append(SortKey(
+                field,
+                column,
+                descending=SORT_DIRECTIONS[direction],
+                value_of=self.value_of.get(field),
+            ))
+
+        if not keys:
+            keys = list(default)
+
+        # The tie-breaker makes the ordering total (and the cursor unambiguous)
+        if not any(key.name == self.tie_breaker_name for key in keys):
+            descending = keys[-1].descending if keys else False
+            keys.append(SortKey(self.tie_breaker_name, self.tie_breaker, descending=descending))
+        return keys
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    One page of results together with pagination metadata.
+
+    Attributes:
+        rows: Result rows (entities, or tuples for multi-column queries)
+        total: Number of rows matching the filters
+        next_cursor: Cursor of the following page (None on the last page)
+        total_is_estimate: True when total comes from planner statistics
+    """
+    rows: list
+    total: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
+
+
+# --- Cursor Encoding ---
+
+def _encode_value(value: Any) -> Any:
+    # Tag non-JSON types so they round-trip with the original Python type
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+def encode_cursor(
+    sort: Sequence[SortKey],
+    values: Sequence[Any],
+    total: Optional[int] = None,
+    total_is_estimate: bool = False,
+) -> str:
+    """
+    Serialize the sort values of a row into an opaque URL-safe cursor.
+
+    The total of the first page travels with the cursor so following pages
+    do not have to count again.
+    """
+    payload = {
+        "k": [key.token for key in sort],
+        "v": [_encode_value(value) for value in values],
+    }
+    if total is not None:
+        payload["t"] = total
+        payload["e"] = total_is_estimate
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    sort: Sequence[SortKey],
+) -> Tuple[List[Any], Optional[int], bool]:
+    """
+    Decode cursor produced by encode_cursor for the same sort order.
+
+    Returns:
+        tuple: (sort_values, total, total_is_estimate); total is None when
+        the cursor does not carry one
+
+    Raises:
+        ValidationError: Cursor is malformed or was issued for a different ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        names = payload["k"]
+        values = [_decode_value(value) for value in payload["v"]]
+        total = payload.get("t")
+        total_is_estimate = bool(payload.get("e", False))
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError, AttributeError):
+        raise ValidationError("Invalid pagination cursor")
+
+    if any(isinstance(value, (dict, list)) for value in values):
+        raise ValidationError("Invalid pagination cursor")
+
+    if total is not None and (isinstance(total, bool) or not isinstance(total, int) or total < 0):
+        raise ValidationError("Invalid pagination cursor")
+
+    if names != [key.token for key in sort] or len(values) != len(sort):
+        raise ValidationError("Pagination cursor does not match the requested sort order")
+
+    return values, total, total_is_estimate
+
+
+# --- Query Helpers ---
+
+def order_by_keys(query: Query, sort: Sequence[SortKey]) -> Query:
+    """Apply ORDER BY for all sort keys in sequence."""
+    return query.order_by(
+        *[key.column.desc() if key.descending else key.column.asc() for key in sort]
+    )
+
+
+def keyset_condition(sort: Sequence[SortKey], values: Sequence[Any]):
+    """
+    Build the WHERE clause selecting rows strictly after the cursor position.
+
+    Uses a row-value comparison when all keys share one direction (index
+    friendly on PostgreSQL), otherwise the equivalent OR-expansion.
+    """
+    directions = {key.descending for key in sort}
+    if len(directions) == 1:
+        left = tuple_(*[key.column for key in sort])
+        right = tuple_(*values)
+        return left < right if sort[0].descending else left > right
+
+    clauses = []
+    for index, key in enumerate(sort):
+        equal_prefix = [sort[i].column == values[i] for i in range(index)]
+        step = key.column < values[index] if key.descending else key.column > values[index]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+class ExplainJson(Executable, ClauseElement):
+    """
+    ``EXPLAIN (FORMAT JSON) <statement>`` as an executable SQL construct.
+
+    The wrapped statement is compiled by the session's own dialect, so bound
+    parameters use the driver's placeholder style (psycopg2 ``%(name)s``,
+    asyncpg ``$n``) and are passed like those of any other statement.
+    """
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(ExplainJson, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_total(query: Query) -> Optional[int]:
+    """
+    Estimate the number of rows a query returns from planner statistics.
+
+    Runs EXPLAIN (no execution), so the cost does not grow with table size.
+
+    Returns:
+        Optional[int]: Estimated row count, or None when the database
+        does not expose planner estimates (anything but PostgreSQL)
+    """
+    bind = query.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    plan = query.session.execute(ExplainJson(query.statement)).scalar()
+    if isinstance(plan, str):  # Drivers without a JSON codec for EXPLAIN output
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def fetch_page(
+    query: Query,
+    *,
+    sort: Sequence[SortKey],
+    limit: int,
+    offset: int = 0,
+    after: Optional[str] = None,
+    approx_threshold: Optional[int] = None,
+) -> Page:
+    """
+    Fetch one page in stable order together with the total and next cursor.
+
+    The total is computed with COUNT(*) OVER() in the page statement itself.
+    Cursor pages reuse the total stored in the cursor, so they count nothing.
+
+    Args:
+        query: Filtered (but unordered) query
+        sort: Stable ordering; the last key must be unique (usually id)
+        limit: Page size
+        offset: Rows to skip (ignored when after is given)
+        after: Cursor returned as next_cursor by the previous page
+        approx_threshold: Planner estimate above which the estimate is used
+            as total (defaults to PAGINATION_APPROX_TOTAL_THRESHOLD; 0 disables)
+
+    Returns:
+        Page: Rows, total and cursor of the following page
+    """
+    if approx_threshold is None:
+        approx_threshold = PAGINATION_APPROX_TOTAL_THRESHOLD
+
+    single_entity = len(query.column_descriptions) == 1
+    total: Optional[int] = None
+    total_is_estimate = False
+
+    page_query = order_by_keys(query, sort)
+    if after:
+        values, total, total_is_estimate = decode_cursor(after, sort)
+        page_query = page_query.filter(keyset_condition(sort, values))
+    else:
+        if approx_threshold > 0:
+            estimate = estimate_total(query)
+            if estimate is not None and estimate >= approx_threshold:
+                total, total_is_estimate = estimate, True
+        page_query = page_query.offset(offset)
+
+    # Count matching rows in the same statement (window runs before LIMIT)
+    count_in_page = total is None
+    if count_in_page:
+        page_query = page_query.add_columns(func.count().over().label("page_total"))
+
+    # Fetch one extra row to know whether another page exists
+    rows = page_query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if count_in_page:
+        # Empty page (offset past the end) carries no window value
+        total = rows[0][-1] if rows else query.count()
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        if count_in_page and single_entity:
+            last = last[0]
+        next_cursor = encode_cursor(
+            sort,
+            [key.extract(last) for key in sort],
+            total,
+            total_is_estimate,
+        )
+
+    if count_in_page:
+        # Drop the window column so callers see the rows of the original query
+        rows = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+
+    return Page(
+        rows=rows,
+        total=total,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
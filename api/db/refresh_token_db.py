@@ -0,0 +1,160 @@
+# Import standard library modules
+from datetime import datetime
+from typing import Optional
+
+# Import SQLAlchemy components for conditional updates
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+# Import refresh token model
+from api.models.refresh_token import RefreshToken
+
+def insert_refresh_token(
+    db: Session,
+    *,
+    user_id: int,
+    session_id: str,
+    token_hash: str,
+    expires_at: datetime,
+) -> RefreshToken:
+    """
+    Store a newly issued refresh token (digest only).
+    
+    Args:
+        db (Session): Database session
+        user_id (int): Token owner
+        session_id (str): Login session the token belongs to
+        token_hash (str): SHA-256 hex digest of the token
+        expires_at (datetime): UTC expiry
+        
+    Returns:
+        RefreshToken: Persisted token row
+        
+    Used for: Login (first token of a session), refresh (rotation)
+    """
+    token = RefreshToken(
+        user_id=user_id,
+        session_id=session_id,
+        token_hash=token_hash,
+        expires_at=expires_at,
+    )
+    db.add(token)
+    db.flush()
+    return token
+
+def get_refresh_token_by_hash(db: Session, token_hash: str) -> Optional[RefreshToken]:
+    """
+    Find a refresh token by its digest.
+    
+    Args:
+        db (Session): Database session
+        token_hash (str): SHA-256 hex digest of the presented token
+        
+    Returns:
+        Optional[RefreshToken]: Token row (possibly revoked or expired), or None
+        
+    Performance: Single probe of the unique token_hash index
+    """
+    return (
+        db.query(RefreshToken)
+        .filter(RefreshToken.token_hash == token_hash)
+        .first()
+    )
+
+def revoke_refresh_token(db: Session, token_id: int, now: datetime) -> bool:
+    """
+    Revoke one token unless it is already revoked.
+    
+    Args:
+        db (Session): Database session
+        token_id (int): Token to revoke
+        now (datetime): Revocation time (UTC)
+        
+    Returns:
+        bool: True if this call revoked the token; False if it was already
+        revoked (e.g. a concurrent refresh with the same token won)
+        
+    Concurrency: Conditional UPDATE, so a token can be rotated only once
+    """
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == token_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+def revoke_session_refresh_tokens(db: Session, session_id: str, now: datetime) -> int:
+    """
+    Revoke every active refresh token of a login session.
+    
+    Args:
+        db (Session): Database session
+        session_id (str): Login session to end
+        now (datetime): Revocation time (UTC)
+        
+    Returns:
+        int: Number of revoked tokens
+        
+    Used for: Logout, reuse detection, replacing a stale session on login
+    """
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.session_id == session_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+def session_has_live_refresh_token(
+    db: Session,
+    session_id: str,
+    now: datetime,
+    issued_after: Optional[datetime] = None,
+) -> bool:
+    """
+    Whether a login session can still be refreshed.
+    
+    Args:
+        db (Session): Database session
+        session_id (str): Login session
+        now (datetime): Current time (UTC)
+        issued_after (Optional[datetime]): Only count tokens issued after
+            this time (e.g. within the access token lifetime, i.e. a client
+            that has been active recently)
+        
+    Returns:
+        bool: True if an unrevoked, unexpired token exists for the session
+        
+    Used for: Login - a session without live tokens has ended and may be replaced
+    """
+    query = db.query(RefreshToken).filter(
+        RefreshToken.session_id == session_id,
+        RefreshToken.revoked_at.is_(None),
+        RefreshToken.expires_at > now,
+    )
+    if issued_after is not None:
+        query = query.filter(RefreshToken.created_at > issued_after)
+    return db.query(query.exists()).scalar()
+
+def purge_refresh_tokens(db: Session, before: datetime) -> int:
+    """
+    Delete tokens that expired before the given time.
+    
+    Args:
+        db (Session): Database session
+        before (datetime): Cut-off (UTC); keep a margin so recently rotated
+            tokens remain recognisable for reuse detection
+        
+    Returns:
+        int: Number of deleted rows
+        
+    Used for: Periodic cleanup (python -m api.cli purge-refresh-tokens)
+    """
+    result = db.execute(delete(RefreshToken).where(RefreshToken.expires_at < before))
+    return result.rowcount
+
+# --- Refresh Token Storage Design Notes ---
+# Only digests are stored; a database leak does not expose usable tokens
+# Revocation is conditional (revoked_at IS NULL), so concurrent refreshes with
+# one token cannot both succeed
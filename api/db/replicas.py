@@ -0,0 +1,175 @@
+"""
+Read-replica routing.
+
+Read-only requests (searches, stats, detail views) are spread over replica
+databases round-robin so they do not compete with order writes on the
+primary. A replica whose connection fails is ejected for a cool-down period
+and reads fall back to the remaining replicas, then to the primary.
+
+Replicas lag behind the primary, so a client that has just written is pinned
+to the primary for a short window (read-your-writes).
+
+Usage:
+    node = replica_router.choose(pin_key=token)
+    db = SessionLocal(bind=node.engine)
+    ...
+    replica_router.eject(node)   # on connection failure
+    replica_router.pin(token)    # after a committed write
+"""
+
+# Import standard library modules
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+# Import SQLAlchemy engine types
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+MAX_PINS = 10000  # Expired pins are purged once this many clients are tracked
+
+
+@dataclass(frozen=True)
+class DatabaseNode:
+    """
+    One database server with its sync and (optional) async engine.
+
+    Attributes:
+        name: Host name used in logs and stats
+        engine: Sync engine
+        async_engine: Async engine (None when no async driver is configured)
+        is_primary: True for the primary (writable) server
+    """
+    name: str
+    engine: Engine
+    async_engine: Optional[AsyncEngine] = None
+    is_primary: bool = False
+
+
+class ReplicaRouter:
+    """
+    Chooses the database node serving a read-only request.
+
+    Args:
+        primary: Primary node (used for pinned clients and as last resort)
+        replicas: Replica nodes; an empty list routes everything to primary
+        eject_seconds: How long a failed replica stays out of rotation
+        pin_seconds: Read-your-writes window after a client's write
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        primary: Optional[DatabaseNode],
+        replicas: Sequence[DatabaseNode] = (),
+        eject_seconds: float = 30.0,
+        pin_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replicas: List[DatabaseNode] = list(replicas)
+        self.eject_seconds = eject_seconds
+        self.pin_seconds = pin_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rotation = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._ejected_until: Dict[str, float] = {}
+        self._pinned_until: Dict[Hashable, float] = {}
+        self._routed = {"replica": 0, "primary": 0, "pinned": 0, "ejections": 0}
+
+    # --- Routing ---
+
+    def choose(self, pin_key: Optional[Hashable] = None) -> Optional[DatabaseNode]:
+        """
+        Pick the node for one read-only request.
+
+        Returns the next healthy replica in round-robin order, or the primary
+        when the client is pinned or no replica is healthy.
+        """
+        if pin_key is not None and self.is_pinned(pin_key):
+            self._count("pinned")
+            return self.primary
+
+        node = self.next_replica()
+        if node is None:
+            self._count("primary")
+            return self.primary
+
+        self._count("replica")
+        return node
+
+    def next_replica(self, exclude: Sequence[DatabaseNode] = ()) -> Optional[DatabaseNode]:
+        """Next healthy replica in rotation (None when all are ejected or excluded)."""
+        if self._rotation is None:
+            return None
+
+        now = self._clock()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                node = self.replicas[next(self._rotation)]
+                if node in exclude:
+                    continue
+                if self._ejected_until.get(node.name, 0.0) > now:
+                    continue
+                return node
+        return None
+
+    # --- Health ---
+
+    def eject(self, node: DatabaseNode) -> None:
+        """Take a failed replica out of rotation for eject_seconds."""
+        if node.is_primary:
+            return
+        with self._lock:
+            self._ejected_until[node.name] = self._clock() + self.eject_seconds
+            self._routed["ejections"] += 1
+
+    def healthy_replicas(self) -> List[DatabaseNode]:
+        now = self._clock()
+        with self._lock:
+            return [
+                node for node in self.replicas
+                if self._ejected_until.get(node.name, 0.0) <= now
+            ]
+
+    # --- Read-your-writes ---
+
+    def pin(self, pin_key: Hashable) -> None:
+        """Route the client's reads to the primary for the pin window."""
+        if self.pin_seconds <= 0:
+            return
+
+        now = self._clock()
+        with self._lock:
+            if len(self._pinned_until) >= MAX_PINS:
+                self._pinned_until = {
+                    key: until for key, until in self._pinned_until.items() if until > now
+                }
+            self._pinned_until[pin_key] = now + self.pin_seconds
+
+    def is_pinned(self, pin_key: Hashable) -> bool:
+        with self._lock:
+            return self._pinned_until.get(pin_key, 0.0) > self._clock()
+
+    # --- Observability ---
+
+    def stats(self) -> dict:
+        with self._lock:
+            routed = dict(self._routed)
+        return {
+            **routed,
+            "replicas": len(self.replicas),
+            "healthy_replicas": len(self.healthy_replicas()),
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._routed[name] += 1
+
+# --- Replica Routing Design Notes ---
+# Only dependencies for read-only endpoints consult the router; writes always use primary
+# Ejection is passive: a failed connect ejects the node, expiry re-admits it (next use probes it)
+# Pins live in worker memory; a client hitting another worker may read a lagging replica
+# within the pin window, so keep pin_seconds above typical replication lag
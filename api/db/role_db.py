@@ -53,4 +53,5 @@ def get_all_roles(db: Session):
 # Roles define permission levels and access rights throughout the application
 # Common role hierarchy: superadmin > admin > manager > user
 # Role names should be consistent and descriptive for clear authorization logic
-# Consider caching role data since it changes infrequently
+# Services read roles through the process-wide catalog (role_service.get_role_catalog);
+# reload it with reload_role_catalog after changing this table
@@ -1,19 +1,23 @@
 # Import standard library modules
 import uuid
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set, Tuple
 
 # Import SQLAlchemy ORM components for database operations
-from sqlalchemy import or_, false
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import event, or_, false
+from sqlalchemy.orm import Session, joinedload, object_session
 
 # Import application models for database tables
 from api.models.user import User
 from api.models.role import Role
 from api.models.oauth import UserOAuthAccount
 
-# Import custom exception classes
-from api.utils import UserAlreadyLoggedInError
+# Import shared keyset pagination and filter helpers
+from api.db.filters import EQ, IN, PREFIX, FilterField, FilterSpec
+from api.db.pagination import SortSpec, fetch_page
+
+# Import custom exception classes and principal cache invalidation
+from api.utils import UserAlreadyLoggedInError, invalidate_cached_principal
 
 # --- User Creation Functions ---
 
@@ -106,6 +110,9 @@ def edit_user(
     # Persist changes and refresh object with latest data
     db.flush()
     db.refresh(user)
+
+    # Role or company may have changed - drop cached authorization snapshot
+    invalidate_principal_on_commit(user)
     return user
 
 def change_user_is_active(db: Session, user: User, is_active: bool):
@@ -123,6 +130,7 @@ def change_user_is_active(db: Session, user: User, is_active: bool):
     clear_login_session(user)  # Force logout when deactivating
     db.flush()
     db.refresh(user)
+    invalidate_principal_on_commit(user)
 
 # --- Session Management Functions ---
 
@@ -173,9 +181,44 @@ def clear_login_session(user: User):
         user (User): User to log out
         
     Used for: Logout process, account deactivation, security cleanup
+    Note: Also evicts the user's cached principal (once committed) so the old
+    token stops working
     """
     user.session_id = None
     change_user_status(user, "offline")
+    invalidate_principal_on_commit(user)
+
+# --- Principal Cache Invalidation ---
+
+_PENDING_INVALIDATIONS = "invalidate_principals"  # Session.info key
+
+def invalidate_principal_on_commit(user: User):
+    """
+    Evict the user's cached principal when the current transaction commits.
+    
+    Args:
+        user (User): User whose session, status, role or company changed
+        
+    Note: Evicting before the commit would let a concurrent request re-cache
+    the old row; evicting after it guarantees the next load sees the change.
+    Only this worker's cache is evicted - other workers keep their entry for
+    at most PRINCIPAL_CACHE_TTL_SECONDS.
+    """
+    db = object_session(user)
+    if db is None:
+        invalidate_cached_principal(user.id)
+        return
+    db.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user.id)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(db: Session):
+    for user_id in db.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_cached_principal(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(db: Session):
+    # Nothing changed; cached principals are still accurate
+    db.info.pop(_PENDING_INVALIDATIONS, None)
 
 def clear_login_session_by_user_id(db: Session, user_id: int):
     """
@@ -266,6 +309,30 @@ def get_oauth_providers(db: Session, user_id: int) -> Set[str]:
 
 # --- User Listing and Search Functions ---
 
+# Filterable user fields (credentials and session ids are never filterable)
+USER_FILTERS = FilterSpec(
+    User,
+    [
+        FilterField("id", EQ | IN),
+        FilterField("username", EQ | PREFIX),
+        FilterField("email", EQ | PREFIX),
+        FilterField("status", EQ | IN),
+        FilterField("is_active"),
+        FilterField("role_id", EQ | IN),
+        FilterField("company_id", EQ | IN),
+    ],
+    scope_column="company_id",
+)
+
+# Client-selectable orderings (each backed by an index led by company_id)
+USER_SORT = SortSpec(
+    {
+        "username": User.username,  # ix_users_company_username
+        "status": User.status,      # ix_users_company_status
+    },
+    tie_breaker=User.id,
+)
+
 def paginate_users(
     db: Session,
     filters: dict,
@@ -273,20 +340,30 @@ def paginate_users(
     company_id: int,
     limit: int,
     offset: int,
+    after: Optional[str] = None,
+    exclude_user_id: Optional[int] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ):
     """
     Get paginated list of users with filtering and access control.
     
     Args:
         db (Session): Database session
-        filters (dict): Search criteria (status, active state, etc.)
+        filters (dict): Search criteria declared in USER_FILTERS (status, active state, etc.)
         allowed_roles (Optional[Set[str]]): Roles current user can view (None = superadmin)
         company_id (int): Company scope for multi-tenant filtering
         limit (int): Maximum number of results per page
         offset (int): Number of records to skip for pagination
+        after (Optional[str]): Keyset cursor from the previous page (replaces offset)
+        exclude_user_id (Optional[int]): User left out of the list (e.g. the requester)
+        sort (Sequence[Tuple[str, str]]): Requested (field, direction) ordering;
+            fields are whitelisted in USER_SORT, id is always the final tie-breaker
         
     Returns:
-        tuple: (total_count, user_list) for pagination metadata and results
+        Page: Users of the page with total count and next cursor
+        
+    Raises:
+        ValidationError: Unsupported filter field, operator or value
         
     Security: Enforces role-based access control and company isolation
     """
@@ -299,10 +376,11 @@ def paginate_users(
         )
     )
 
-    # Apply dynamic filters based on request parameters
-    for key, value in filters.items():
-        if hasattr(User, key):
-            query = query.filter(getattr(User, key) == value)
+    # Apply declared filters (unknown fields are rejected)
+    query = USER_FILTERS.apply(db, query, filters, scoped=company_id is not None)
+
+    if exclude_user_id is not None:
+        query = query.filter(User.id != exclude_user_id)
 
     # Role-based access control
     if allowed_roles is not None:
@@ -321,13 +399,10 @@ def paginate_users(
     if company_id is not None:
         query = query.filter(User.company_id == company_id)
 
-    # Get total count before applying pagination
-    total = query.count()
-    
-    # Apply pagination and get results
-    results = query.offset(offset).limit(limit).all()
-
-    return total, results
+    # Apply pagination; total is counted in the same statement
+    return fetch_page(
+        query, sort=USER_SORT.keys(sort), limit=limit, offset=offset, after=after
+    )
 
 def count_users(db: Session, company_id=None, online_only=False):
     """
@@ -357,6 +432,8 @@ def count_users(db: Session, company_id=None, online_only=False):
 
 # --- Database Design Notes ---
 # User sessions are managed through session_id field for security
+# Session/status/role/company changes invalidate the in-process principal cache
+# after commit; other workers converge within PRINCIPAL_CACHE_TTL_SECONDS
 # Multi-tenant isolation enforced through company_id filtering
 # OAuth integration supports multiple providers per user
 # Soft delete through is_active flag preserves audit trail
@@ -3,26 +3,33 @@ from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
-from api.dependencies.db import get_db
-from api.models.user import User
-from api.utils import decode_access_token, decode_token_ignore_exp, InvalidTokenError, TokenExpiredError
-from api.db.user_db import get_user_data_by_id, clear_login_session_by_user_id
+from api.dependencies.db import get_async_auth_db, get_auth_db
+from api.domain.mappers.user_mapper import user_entity_to_principal
+from api.domain.user import Principal
+from api.utils import (
+    decode_access_token,
+    principal_cache,
+    InvalidTokenError,
+    TokenExpiredError,
+)
+from api.db.user_db import get_user_data_by_id
 
 security = HTTPBearer()
 
 def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+    db: Session = Depends(get_auth_db),
+) -> Principal:
     """
     FastAPI dependency that extracts and validates the current authenticated user.
     
     Args:
         token (HTTPAuthorizationCredentials): JWT token from Authorization header
-        db (Session): Database session for user data lookup
+        db (Session): Lazy read-only session on the primary for the user lookup
         
     Returns:
-        User: Authenticated user object with role and company information
+        Principal: Immutable snapshot of the authenticated user (id, role name/rank,
+        company_id, is_active). Exposes the same attributes services read from User.
         
     Raises:
         HTTPException(401): For various authentication failures:
@@ -33,40 +40,58 @@ def get_current_user(
     Security Features:
         - JWT token validation with expiration checking
         - Session ID validation to prevent token replay attacks
-        - Automatic session cleanup on expired tokens
+        - Expired tokens rejected without a database write (renewed via refresh tokens)
         - User status validation (active/inactive)
         
+    Performance:
+        Validated principals are cached per (user_id, session_id) for
+        PRINCIPAL_CACHE_TTL_SECONDS, so repeated requests skip the
+        user/role/company join. The cache is invalidated by user_db
+        after a commit that changes session, status, role or company.
+        Invalidation is per worker: other workers may accept a revoked
+        session for up to PRINCIPAL_CACHE_TTL_SECONDS (keep it short).
+        The lookup runs on its own read-only session (get_auth_db), which
+        only connects on a cache miss and never commits.
+        
     Usage:
         @router.get("/profile")
         def get_profile(current_user: User = Depends(get_current_user)):
             return {"user_id": current_user.id, "role": current_user.role.name}
     """
-    
+    return _resolve_principal(db, token)
+
+
+async def get_current_user_async(
+    token: HTTPAuthorizationCredentials = Depends(security),
+    db=Depends(get_async_auth_db),
+) -> Principal:
+    """
+    Async counterpart of get_current_user for async route handlers.
+
+    Runs the same validation on the async session (see get_current_user), so
+    authenticating does not take a thread-pool slot; principal cache hits do
+    not touch the database at all.
+    """
+    return await db.run_sync(_resolve_principal, token)
+
+
+def _resolve_principal(db: Session, token: HTTPAuthorizationCredentials) -> Principal:
     try:
         # Decode and validate JWT token
         payload = decode_access_token(token.credentials)
 
     except TokenExpiredError:
         """
-        Handle expired tokens with graceful session cleanup.
+        Handle expired tokens without touching the database.
         
-        When a token expires, we attempt to extract the user ID from the expired token
-        and clear their session to ensure security. This prevents the user from being
-        stuck in a "logged in" state with an invalid token.
+        The login session stays valid: clients exchange their refresh token
+        at /api/auth/refresh for a new access token instead of logging in
+        again. Sessions end on logout, refresh token reuse, or when a new
+        login replaces a session that has gone quiet.
         """
-        # Extract user info from expired token for cleanup
-        stale_payload = decode_token_ignore_exp(token.credentials)
-
-        if stale_payload:
-            user_id = stale_payload.get("sub")
-            if user_id:
-                # Clear the user's session to force fresh login
-                clear_login_session_by_user_id(db, user_id)
-
-        # Return user-friendly error message
         raise HTTPException(
             status_code=401,
-            detail="Session expired. Please log in again."
+            detail="Access token expired"
         )
 
     except InvalidTokenError:
@@ -83,6 +108,15 @@ def get_current_user(
     if not user_id:
         raise HTTPException(status_code=401)
 
+    token_session_id = payload.get("session_id")
+
+    # Serve already validated sessions from the principal cache
+    cache_key = (str(user_id), token_session_id)
+    if token_session_id:
+        principal = principal_cache.get(cache_key)
+        if principal is not None:
+            return principal
+
     # Fetch user data from database
     user = get_user_data_by_id(db, user_id)
     if not user:
@@ -94,7 +128,6 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="User disabled")
 
     # Validate session ID to prevent token replay attacks
-    token_session_id = payload.get("session_id")
     if not token_session_id or user.session_id != token_session_id:
         """
         Session ID validation prevents security issues:
@@ -104,7 +137,9 @@ def get_current_user(
         """
         raise HTTPException(status_code=401, detail="Session expired")
 
-    return user
+    principal = user_entity_to_principal(user)
+    principal_cache.set(cache_key, principal)
+    return principal
 
 def require_role(required_roles: List[str]):
     """
@@ -136,15 +171,15 @@ def require_role(required_roles: List[str]):
             # Admins and managers can access this endpoint
             pass
     """
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: Principal = Depends(get_current_user)):
         """
         Inner dependency function that performs the actual role checking.
         
         Args:
-            current_user (User): Authenticated user (injected by get_current_user)
+            current_user (Principal): Authenticated user (injected by get_current_user)
             
         Returns:
-            User: The current user if role check passes
+            Principal: The current user if role check passes
             
         Raises:
             HTTPException(403): If user's role is not in required_roles list
@@ -165,12 +200,14 @@ def require_role(required_roles: List[str]):
 # 1. Client includes JWT token in Authorization: Bearer <token> header
 # 2. get_current_user dependency extracts and validates token
 # 3. User information loaded from database with role/company context
+#    (or served from the principal cache for an already validated session)
 # 4. Session validation ensures token hasn't been invalidated
 # 5. require_role can add additional authorization layers
 #
 # Security Features:
 # - JWT signature validation prevents token tampering
 # - Session ID validation prevents token replay after logout
-# - Automatic session cleanup on token expiration
+# - Expired access tokens are renewed with rotating refresh tokens
+#   (POST /api/auth/refresh), not by logging in again
 # - Role-based access control for fine-grained permissions
 # - User status checking (active/inactive accounts)
\ No newline at end of file
@@ -1,7 +1,32 @@
-from api.db.db_engine import SessionLocal
+import threading
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Optional
 
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.orm import Session
 
-def get_db():
+from api.db.async_db import SyncSessionRunner
+from api.db.db_engine import AsyncSessionLocal, SessionLocal, replica_router
+from api.db.replicas import DatabaseNode
+
+# Failures that eject a replica (async drivers may raise raw socket errors)
+REPLICA_CONNECTION_ERRORS = (OperationalError, OSError)
+
+# Transaction counters per mode (see transaction_stats)
+_stats_lock = threading.Lock()
+_transaction_counts = {"read_write": 0, "read_only": 0, "snapshot": 0, "commits": 0, "rollbacks": 0}
+
+# Engines applying READ ONLY to every connection (see _lazy_primary_read_session)
+_read_only_engines: dict = {}
+
+# Bearer token (if any) identifies the client for read-your-writes pinning
+optional_bearer = HTTPBearer(auto_error=False)
+
+
+def get_db(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)):
     """
     FastAPI dependency that provides database session with automatic transaction management.
 
@@ -29,10 +54,16 @@ def get_db():
         yield db
 
         # If no exception occurred, commit the transaction
+        _count_transaction(db.in_transaction(), "commits")
         db.commit()
 
+        # Replicas lag behind: keep this client's reads on the primary for a while
+        if credentials is not None and db.info.get("has_writes"):
+            replica_router.pin(credentials.credentials)
+
     except:
         # If any exception occurred, rollback all changes
+        _count_transaction(db.in_transaction(), "rollbacks")
         db.rollback()
 
         # Re-raise the exception to be handled by FastAPI
@@ -43,6 +74,344 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Async counterpart of get_db for async (read-heavy) route handlers.
+
+    Yields:
+        AsyncSession: Session on the async engine, or a SyncSessionRunner over
+        a sync session when no async driver is configured (DB_ASYNC_DRIVER="")
+
+    Transaction Management: same as get_db (commit on success, rollback on error)
+
+    Usage:
+        @router.post("/search")
+        async def search(db: AsyncSession = Depends(get_async_db)):
+            page = await paginate_items_async(db, ...)
+
+    Note: Waiting on the database does not hold a thread-pool slot, so one
+    worker can keep many queries in flight.
+    """
+    db = AsyncSessionLocal() if AsyncSessionLocal is not None else SyncSessionRunner(SessionLocal())
+
+    try:
+        yield db
+        _count_transaction(db.in_transaction(), "commits")
+        await db.commit()
+
+    except:
+        _count_transaction(db.in_transaction(), "rollbacks")
+        await db.rollback()
+        raise
+
+    finally:
+        await db.close()
+
+
+def get_auth_db():
+    """
+    Read-only session on the primary for resolving the authenticated user.
+
+    Yields:
+        Session: Lazy session: it only connects when a principal cache miss
+        runs the user lookup, so cached requests use no connection at all
+
+    Transaction Management:
+        - READ ONLY transaction (PostgreSQL), applied per connection by the engine
+        - Never commits; closing the session ends the transaction
+        - Always the primary: a lagging replica could still accept a session
+          that was just logged out
+
+    Used by: get_current_user (the handler's own session is separate)
+    """
+    db = _lazy_primary_read_session(SessionLocal, _primary_engine())
+
+    try:
+        yield db
+
+    finally:
+        if db.in_transaction():
+            _count("read_only")
+        db.close()
+
+
+async def get_async_auth_db():
+    """Async counterpart of get_auth_db (used by get_current_user_async)."""
+    node = replica_router.primary
+    if AsyncSessionLocal is not None and node is not None and node.async_engine is not None:
+        db = _lazy_primary_read_session(AsyncSessionLocal, node.async_engine)
+    else:
+        db = SyncSessionRunner(_lazy_primary_read_session(SessionLocal, _primary_engine()))
+
+    try:
+        yield db
+
+    finally:
+        if db.in_transaction():
+            _count("read_only")
+        await db.close()
+
+
+def get_read_db(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)):
+    """
+    FastAPI dependency providing a read-only session for non-mutating endpoints.
+
+    Yields:
+        Session: Session on a healthy replica (round-robin), or on the primary
+        when no replica is configured/healthy or the client wrote recently
+
+    Transaction Management:
+        - Runs in a READ ONLY transaction (PostgreSQL)
+        - Never commits; closing the session ends the transaction
+        - Any flush or INSERT/UPDATE/DELETE raises InvalidRequestError
+
+    Usage:
+        @router.get("/items/{item_id}")
+        def get_item(item_id: int, db: Session = Depends(get_read_db)):
+            ...
+    """
+    db = _open_read_session(_pin_key(credentials), snapshot=False)
+    _count("read_only")
+
+    try:
+        yield db
+
+    finally:
+        db.close()
+
+
+def get_snapshot_db(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)):
+    """
+    Read-only session whose queries all see one consistent snapshot.
+
+    Yields:
+        Session: Like get_read_db, but the transaction is
+        SERIALIZABLE READ ONLY DEFERRABLE on the PostgreSQL primary: it may
+        wait briefly for a safe snapshot, then never fails with serialization
+        errors. Hot standbys reject SERIALIZABLE, so on a replica the
+        transaction is REPEATABLE READ READ ONLY (also a single snapshot)
+
+    Used for: Endpoints combining several aggregates (dashboard) that must
+    agree with each other.
+    """
+    db = _open_read_session(_pin_key(credentials), snapshot=True)
+    _count("snapshot")
+
+    try:
+        yield db
+
+    finally:
+        db.close()
+
+
+def get_stream_db(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer),
+) -> Callable[[], ContextManager[Session]]:
+    """
+    Read-only session opener for endpoints returning a StreamingResponse.
+
+    Returns:
+        Callable: Context manager factory opening a session like get_read_db;
+        the session is closed when the with-block (the stream) ends
+
+    Why not a yielded session: FastAPI closes yield dependencies before a
+    streaming body is sent, so the stream must own its session.
+
+    Usage:
+        @router.get("/export")
+        def export(open_db = Depends(get_stream_db)):
+            def chunks():
+                with open_db() as db:
+                    yield from ...
+            return StreamingResponse(chunks())
+    """
+    pin_key = _pin_key(credentials)
+
+    @contextmanager
+    def open_db():
+        db = _open_read_session(pin_key, snapshot=False)
+        _count("read_only")
+
+        try:
+            yield db
+
+        finally:
+            db.close()
+
+    return open_db
+
+
+async def get_async_read_db(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)):
+    """Async counterpart of get_read_db for async read-only route handlers."""
+    db = await _open_async_read_session(_pin_key(credentials))
+    _count("read_only")
+
+    try:
+        yield db
+
+    finally:
+        await db.close()
+
+
+def transaction_stats() -> dict:
+    """
+    Request transaction counters of this worker.
+
+    Returns:
+        dict: read_write / read_only / snapshot sessions opened, plus
+        commits and rollbacks of read-write sessions
+    """
+    with _stats_lock:
+        return dict(_transaction_counts)
+
+
+def read_only_options(dialect_name: str, snapshot: bool = False, replica: bool = False) -> dict:
+    """
+    Connection execution options starting a read-only transaction.
+
+    Args:
+        dialect_name: Dialect of the bound engine
+        snapshot: Read one consistent snapshot: SERIALIZABLE READ ONLY
+            DEFERRABLE on the primary, REPEATABLE READ READ ONLY on a replica
+        replica: Session is bound to a hot standby (no serializable mode)
+
+    Returns:
+        dict: Options for Session.connection(); empty for databases without
+        read-only transactions (SQLite), where the session guard still applies
+    """
+    if dialect_name != "postgresql":
+        return {}
+
+    options = {"postgresql_readonly": True}
+    if snapshot and replica:
+        options.update(isolation_level="REPEATABLE READ")
+    elif snapshot:
+        options.update(isolation_level="SERIALIZABLE", postgresql_deferrable=True)
+    return options
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _transaction_counts[name] += 1
+
+
+def _count_transaction(began: bool, outcome: str) -> None:
+    # A request that never queried has no transaction to commit or roll back
+    if began:
+        with _stats_lock:
+            _transaction_counts["read_write"] += 1
+            _transaction_counts[outcome] += 1
+
+
+def _primary_engine():
+    node = replica_router.primary
+    return node.engine if node is not None else SessionLocal.kw.get("bind")
+
+
+def _lazy_primary_read_session(session_factory, engine):
+    # Engine-level options apply READ ONLY to whichever connection the session
+    # checks out, without connecting now (unlike _begin_read_only)
+    if engine is None:
+        db = session_factory()
+    else:
+        db = session_factory(bind=_read_only_engine(engine))
+    db.info["read_only"] = True
+    return db
+
+
+def _read_only_engine(engine):
+    # One option engine per engine: each registers a connect listener
+    read_only = _read_only_engines.get(engine)
+    if read_only is None:
+        options = read_only_options(engine.dialect.name)
+        read_only = engine.execution_options(**options) if options else engine
+        _read_only_engines[engine] = read_only
+    return read_only
+
+
+def _pin_key(credentials: Optional[HTTPAuthorizationCredentials]) -> Optional[str]:
+    return credentials.credentials if credentials is not None else None
+
+
+def _begin_read_only(db: Session, snapshot: bool = False, replica: bool = False) -> None:
+    # Start the transaction now: a dead replica fails over before the handler
+    # runs, and the read-only characteristics apply before the first query
+    db.info["read_only"] = True
+    db.connection(
+        execution_options=read_only_options(db.get_bind().dialect.name, snapshot, replica)
+    )
+
+
+def _open_read_session(pin_key: Optional[str], snapshot: bool = False) -> Session:
+    node = replica_router.choose(pin_key)
+    tried = []
+
+    while node is not None and not node.is_primary:
+        db = SessionLocal(bind=node.engine)
+        try:
+            _begin_read_only(db, snapshot, replica=True)
+            return db
+        except REPLICA_CONNECTION_ERRORS:
+            db.close()
+            replica_router.eject(node)
+            tried.append(node)
+            node = replica_router.next_replica(exclude=tried) or replica_router.primary
+
+    db = SessionLocal(bind=node.engine) if node is not None else SessionLocal()
+    _begin_read_only(db, snapshot)
+    return db
+
+
+async def _open_async_read_session(pin_key: Optional[str]):
+    node = replica_router.choose(pin_key)
+    tried = []
+
+    while node is not None and not node.is_primary:
+        db = _async_session_for(node)
+        try:
+            await db.run_sync(_begin_read_only)
+            return db
+        except REPLICA_CONNECTION_ERRORS:
+            await db.close()
+            replica_router.eject(node)
+            tried.append(node)
+            node = replica_router.next_replica(exclude=tried) or replica_router.primary
+
+    if node is not None:
+        db = _async_session_for(node)
+    else:
+        db = AsyncSessionLocal() if AsyncSessionLocal is not None else SyncSessionRunner(SessionLocal())
+    await db.run_sync(_begin_read_only)
+    return db
+
+
+def _async_session_for(node: DatabaseNode):
+    if AsyncSessionLocal is not None and node.async_engine is not None:
+        return AsyncSessionLocal(bind=node.async_engine)
+    return SyncSessionRunner(SessionLocal(bind=node.engine))
+
+
+# --- Write Tracking (read-your-writes, read-only guard) ---
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise InvalidRequestError("Write attempted in a read-only request")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        if orm_execute_state.session.info.get("read_only"):
+            raise InvalidRequestError("Write attempted in a read-only request")
+        orm_execute_state.session.info["has_writes"] = True
+
+
 # --- Database Session Lifecycle ---
 # 1. New session created for each HTTP request
 # 2. Session yielded to route handler for database operations
@@ -54,4 +423,15 @@ def get_db():
 # - Automatic transaction management
 # - Connection pooling and resource cleanup
 # - Request isolation (each request gets its own session)
-# - Exception safety with guaranteed rollback on errors
\ No newline at end of file
+# - Exception safety with guaranteed rollback on errors
+# - Read-only endpoints use get_read_db/get_async_read_db (replicas, READ ONLY
+#   transaction, no commit round trip); get_snapshot_db adds a deferrable
+#   serializable snapshot for multi-query reads
+# - Streaming responses open their read-only session through get_stream_db,
+#   which lives until the last chunk is sent
+# - A committed write pins the client to the primary for READ_YOUR_WRITES_SECONDS
+# - transaction_stats() reports sessions per mode, commits and rollbacks;
+#   sessions that never ran a query are not counted
+# - Authentication resolves the user on its own lazy read-only session on the
+#   primary (get_auth_db), so principal cache hits use no connection
+# - get_async_db follows the same lifecycle on the async engine
\ No newline at end of file
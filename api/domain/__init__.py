@@ -1,7 +1,10 @@
 from api.domain.company import Company, CompanyList, PaginatedCompanies
-from api.domain.item import Item, PaginatedItems, SkuGenerator
+from api.domain.dashboard import DashboardSnapshot
+from api.domain.item import Item, ItemImportError, ItemImportReport, PaginatedItems, SkuGenerator
 from api.domain.order import (
     Order,
+    OrderBulkOutcome,
+    OrderBulkResult,
     OrderLineItem,
     OrderStatusCounts,
     PaginatedOrderItems,
@@ -12,6 +15,8 @@ from api.domain.user import (
     CreateUserResult,
     CurrentUserProfile,
     PaginatedUsers,
+    Principal,
+    PrincipalRole,
     UserDraft,
     UserProfile,
     UserStats,
@@ -20,6 +25,7 @@ from api.domain.exceptions import (
     ConflictError,
     DomainError,
     ForbiddenError,
+    InsufficientStockError,
     NotFoundError,
     ValidationError,
 )
@@ -1,8 +1,55 @@
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from api.domain.exceptions import ForbiddenError
 
 
+@dataclass(frozen=True)
+class RoleEntry:
+    id: int
+    name: str
+    rank: int
+
+
+class RoleCatalog:
+    """
+    Immutable snapshot of the roles table with precomputed subrole sets.
+
+    A lower rank means more rights; the subroles of a role are the roles with
+    the same or a higher rank (the role itself included), ordered by rank.
+    """
+
+    def __init__(self, roles: Iterable[RoleEntry]):
+        ordered = sorted(roles, key=lambda role: (role.rank, role.id))
+        self._by_name: Dict[str, RoleEntry] = {role.name: role for role in ordered}
+        self._subroles: Dict[str, Tuple[RoleEntry, ...]] = {
+            role.name: tuple(other for other in ordered if other.rank >= role.rank)
+            for role in ordered
+        }
+        self._subrole_names: Dict[str, FrozenSet[str]] = {
+            name: frozenset(other.name for other in subroles)
+            for name, subroles in self._subroles.items()
+        }
+
+    @classmethod
+    def from_rows(cls, rows) -> "RoleCatalog":
+        """Build from Role rows (anything with id, name and rank)."""
+        return cls(RoleEntry(id=row.id, name=row.name, rank=row.rank) for row in rows)
+
+    def get(self, name: str) -> Optional[RoleEntry]:
+        return self._by_name.get(name)
+
+    def subroles(self, name: str) -> Tuple[RoleEntry, ...]:
+        """Subroles of a role (empty for unknown roles)."""
+        return self._subroles.get(name, ())
+
+    def subrole_names(self, name: str) -> FrozenSet[str]:
+        return self._subrole_names.get(name, frozenset())
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+
 class TenantScope:
     @staticmethod
     def enforce(
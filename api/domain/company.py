@@ -53,3 +53,5 @@ class CompanyList:
 class PaginatedCompanies:
     total: int
     data: List[Company]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
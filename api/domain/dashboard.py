@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from api.domain.company import PaginatedCompanies
+from api.domain.item import PaginatedItems
+from api.domain.order import OrderStatusCounts
+from api.domain.user import PaginatedUsers, UserStats
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    user_stats: UserStats
+    order_counts: OrderStatusCounts
+    online_users: PaginatedUsers
+    companies: Optional[PaginatedCompanies] = None
+    low_stock_items: Optional[PaginatedItems] = None
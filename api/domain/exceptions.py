@@ -16,3 +16,11 @@ class ForbiddenError(DomainError):
 
 class ConflictError(DomainError):
     pass
+
+
+class InsufficientStockError(ForbiddenError):
+    """Stock adjustment would make inventory negative for the listed items."""
+
+    def __init__(self, message: str, item_ids):
+        super().__init__(message)
+        self.item_ids = list(item_ids)
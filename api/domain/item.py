@@ -4,7 +4,7 @@ from typing import List, Optional
 from uuid import uuid4
 
 from api.domain.exceptions import ConflictError, ForbiddenError
-from api.domain.value_objects import ItemName, Money, Quantity
+from api.domain.value_objects import ItemName, Money, Quantity, Sku
 
 
 class SkuGenerator:
@@ -33,12 +33,13 @@ class Item:
         price,
         quantity,
         company_id: int,
+        sku: Optional[str] = None,
     ) -> "Item":
         item_name = ItemName.from_raw(name)
         return cls(
             id=None,
             name=item_name,
-            sku=SkuGenerator.generate(item_name.value),
+            sku=Sku.from_raw(sku).value if sku else SkuGenerator.generate(item_name.value),
             price=Money.from_raw(price),
             quantity=Quantity.from_raw(quantity),
             company_id=company_id,
@@ -97,3 +98,21 @@ class Item:
 class PaginatedItems:
     total: int
     data: List[Item]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
+
+
+@dataclass(frozen=True)
+class ItemImportError:
+    line: int
+    error: str
+    sku: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ItemImportReport:
+    processed: int
+    imported: int
+    failed: int
+    errors: List[ItemImportError]
+    errors_truncated: bool = False
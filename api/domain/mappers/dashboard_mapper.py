@@ -0,0 +1,31 @@
+from api.domain.dashboard import DashboardSnapshot
+from api.domain.mappers.company_mapper import company_domain_to_row
+from api.domain.mappers.item_mapper import item_domain_to_row
+from api.domain.mappers.user_mapper import user_stats_to_response
+from api.schemas.dashboard_schema import DashboardResponse
+from api.schemas.pagination_schema import PaginationResponse
+
+
+def _page_to_response(page, to_row=None) -> PaginationResponse:
+    return PaginationResponse(
+        total=page.total,
+        data=[to_row(row) for row in page.data] if to_row else page.data,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
+    )
+
+
+def dashboard_to_response(snapshot: DashboardSnapshot) -> DashboardResponse:
+    return DashboardResponse(
+        user_stats=user_stats_to_response(snapshot.user_stats),
+        order_counts=snapshot.order_counts.as_dict(),
+        online_users=_page_to_response(snapshot.online_users),
+        companies=(
+            _page_to_response(snapshot.companies, company_domain_to_row)
+            if snapshot.companies is not None else None
+        ),
+        low_stock_items=(
+            _page_to_response(snapshot.low_stock_items, item_domain_to_row)
+            if snapshot.low_stock_items is not None else None
+        ),
+    )
@@ -1,8 +1,8 @@
 from typing import List, Optional
 
-from api.domain.item import Item as DomainItem
+from api.domain.item import Item as DomainItem, ItemImportReport
 from api.models.item import Item as ItemEntity
-from api.schemas import ItemEditResponse, ItemGetResponse
+from api.schemas import ItemEditResponse, ItemGetResponse, ItemImportErrorResponse, ItemImportResponse
 
 
 def item_entity_to_domain(
@@ -50,6 +50,19 @@ def item_domain_to_edit_response(item: DomainItem) -> ItemEditResponse:
     )
 
 
+def item_import_report_to_response(report: ItemImportReport) -> ItemImportResponse:
+    return ItemImportResponse(
+        processed=report.processed,
+        imported=report.imported,
+        failed=report.failed,
+        errors=[
+            ItemImportErrorResponse(line=error.line, error=error.error, sku=error.sku)
+            for error in report.errors
+        ],
+        errors_truncated=report.errors_truncated,
+    )
+
+
 def item_domain_to_row(item: DomainItem) -> dict:
     return {
         "id": item.id,
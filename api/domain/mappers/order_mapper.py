@@ -2,12 +2,14 @@ from typing import List, Optional
 
 from api.domain.order import (
     Order as DomainOrder,
+    OrderBulkResult,
     OrderLineItem,
     OrderStatus,
     OrderType,
 )
 from api.models.order import Order as OrderEntity
 from api.models.order_item import OrderItem
+from api.schemas import OrderBulkOutcomeResponse, OrderBulkResponse
 
 
 def order_entity_to_domain(
@@ -58,3 +60,19 @@ def order_line_to_row(line: OrderLineItem) -> dict:
 
 def order_lines_to_rows(lines: List[OrderLineItem]) -> List[dict]:
     return [order_line_to_row(line) for line in lines]
+
+
+def order_bulk_result_to_response(result: OrderBulkResult) -> OrderBulkResponse:
+    return OrderBulkResponse(
+        succeeded=result.succeeded,
+        failed=result.failed,
+        results=[
+            OrderBulkOutcomeResponse(
+                order_id=outcome.order_id,
+                success=outcome.succeeded,
+                status=outcome.status.value if outcome.status else None,
+                error=outcome.error,
+            )
+            for outcome in result.outcomes
+        ],
+    )
@@ -1,4 +1,12 @@
-from api.domain.user import CreateUserResult, CurrentUserProfile, UserProfile, UserStats
+from api.domain.user import (
+    CreateUserResult,
+    CurrentUserProfile,
+    Principal,
+    PrincipalRole,
+    UserProfile,
+    UserStats,
+)
+from api.models.user import User as UserEntity
 from api.schemas import (
     UserCountResponse,
     UserCreateResponse,
@@ -48,3 +56,13 @@ def current_user_profile_to_dict(profile: CurrentUserProfile) -> dict:
         "company_id": profile.company_id,
         "oauth_info": OAuthInfo(github=profile.oauth_github),
     }
+
+
+def user_entity_to_principal(user: UserEntity) -> Principal:
+    return Principal(
+        id=user.id,
+        role=PrincipalRole(name=user.role.name, rank=user.role.rank),
+        company_id=user.company_id,
+        is_active=user.is_active,
+        session_id=user.session_id,
+    )
@@ -127,16 +127,44 @@ class Order:
         return []
 
 
+@dataclass(frozen=True)
+class OrderBulkOutcome:
+    order_id: int
+    status: Optional[OrderStatus] = None  # New status when the transition succeeded
+    error: Optional[str] = None           # Why the order was left unchanged
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class OrderBulkResult:
+    outcomes: List[OrderBulkOutcome]  # One per requested order, in request order
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.succeeded)
+
+    @property
+    def failed(self) -> int:
+        return len(self.outcomes) - self.succeeded
+
+
 @dataclass(frozen=True)
 class PaginatedOrders:
     total: int
     data: List[Order]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 @dataclass(frozen=True)
 class PaginatedOrderItems:
     total: int
     data: List[OrderLineItem]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 @dataclass(frozen=True)
@@ -62,7 +62,25 @@ class CurrentUserProfile:
     oauth_github: bool
 
 
+@dataclass(frozen=True)
+class PrincipalRole:
+    name: str
+    rank: int
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of the authenticated user used for authorization."""
+    id: int
+    role: PrincipalRole
+    company_id: Optional[int]
+    is_active: bool
+    session_id: str
+
+
 @dataclass(frozen=True)
 class PaginatedUsers:
     total: int
     data: List[dict]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from email.utils import parseaddr
 from typing import List, Optional
 
@@ -53,21 +53,47 @@ class ItemName:
 class Money:
     value: Decimal
 
+    MAX_VALUE = Decimal("99999999.99")  # NUMERIC(10,2) columns
+    CENT = Decimal("0.01")
+
     @classmethod
     def from_raw(cls, raw) -> "Money":
         try:
             price = Decimal(raw)
         except Exception:
             raise ValidationError("Invalid price")
+        if not price.is_finite():
+            raise ValidationError("Invalid price")
         if price < 0:
             raise ValidationError("Price must be >= 0")
+        # Compare after rounding to cents, as the database stores it
+        if price > cls.MAX_VALUE or price.quantize(cls.CENT, rounding=ROUND_HALF_UP) > cls.MAX_VALUE:
+            raise ValidationError(f"Price must be <= {cls.MAX_VALUE}")
         return cls(value=price)
 
 
+@dataclass(frozen=True)
+class Sku:
+    value: str
+
+    MAX_LENGTH = 64
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "Sku":
+        if not raw or not raw.strip():
+            raise ValidationError("SKU is required")
+        value = raw.strip()
+        if len(value) > cls.MAX_LENGTH or any(char.isspace() for char in value):
+            raise ValidationError(f"SKU must be at most {cls.MAX_LENGTH} characters without spaces")
+        return cls(value=value)
+
+
 @dataclass(frozen=True)
 class Quantity:
     value: int
 
+    MAX_VALUE = 2**31 - 1  # INT columns
+
     @classmethod
     def from_raw(cls, raw) -> "Quantity":
         try:
@@ -76,6 +102,8 @@ class Quantity:
             raise ValidationError("Invalid quantity")
         if quantity < 0:
             raise ValidationError("Quantity must be >= 0")
+        if quantity > cls.MAX_VALUE:
+            raise ValidationError(f"Quantity must be <= {cls.MAX_VALUE}")
         return cls(value=quantity)
 
 
@@ -1,101 +1,250 @@
-import requests
+"""
+Async GitHub OAuth client.
 
-from api.config import GITHUB_CLIENT_ID, GITHUB_CLIENT_SECRET
+All calls go through one pooled httpx.AsyncClient per worker (and event
+loop), so TLS connections to github.com are reused. Every call is bounded by
+connect/read timeouts; a slow or unreachable GitHub fails the OAuth callback
+with GitHubError instead of hanging the worker.
 
-def exchange_code_for_token(code: str) -> str:
-    """
-    Exchange GitHub OAuth authorization code for access token.
-    
-    This is the second step of GitHub's OAuth flow after user authorization.
-    The authorization code is exchanged for an access token that can be used
-    to make authenticated requests to GitHub's API on behalf of the user.
-    
-    Args:
-        code (str): Authorization code received from GitHub OAuth callback
-        
-    Returns:
-        str: GitHub access token for authenticated API requests
-        
-    Raises:
-        requests.HTTPError: If GitHub API request fails (invalid code, expired code, etc.)
-        KeyError: If GitHub response doesn't contain expected access_token field
-        
-    OAuth Flow Context:
-        1. User clicks "Login with GitHub" 
-        2. User redirected to GitHub for authorization
-        3. GitHub redirects back with authorization code
-        4. This function exchanges code for access token
-        5. Access token used to fetch user profile information
-        
-    Used for: OAuth login completion, GitHub account linking
-    """
-    # Make POST request to GitHub's token exchange endpoint
-    res = requests.post(
-        "https://github.com/login/oauth/access_token",  # GitHub OAuth token endpoint
-        headers={"Accept": "application/json"},          # Request JSON response format
-        data={
-            "client_id": GITHUB_CLIENT_ID,               # OAuth app client ID
-            "client_secret": GITHUB_CLIENT_SECRET,       # OAuth app client secret  
-            "code": code,                                # Authorization code from callback
-        },
-    )
-    
-    # Raise exception if request failed (4xx or 5xx status codes)
-    res.raise_for_status()
-    
-    # Extract access token from JSON response
-    return res.json()["access_token"]
-
-
-def fetch_user(access_token: str) -> dict:
+Usage:
+    token = await github_client.exchange_code_for_token(code)
+    profile = await github_client.fetch_user(token)
+
+Base URLs are injectable (GITHUB_OAUTH_URL / GITHUB_API_URL, or the
+constructor), so tests can run the flow against a local stub server.
+"""
+
+# Import standard library modules
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlencode
+
+# Import async HTTP client
+import httpx
+
+from api.config import (
+    GITHUB_API_URL,
+    GITHUB_CLIENT_ID,
+    GITHUB_CLIENT_SECRET,
+    GITHUB_CONNECT_TIMEOUT,
+    GITHUB_MAX_RETRIES,
+    GITHUB_OAUTH_URL,
+    GITHUB_POOL_MAXSIZE,
+    GITHUB_READ_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: GitHub overloaded or restarting
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Failures where the request never reached GitHub (always safe to retry)
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class GitHubError(Exception):
+    """GitHub could not be reached or rejected the request."""
+    pass
+
+
+class GitHubClient:
     """
-    Retrieve GitHub user profile information using access token.
-    
-    Fetches the authenticated user's public profile data from GitHub API.
-    This information is used for account creation/linking and profile display.
-    
+    Pooled, time-bounded client for GitHub's OAuth and user endpoints.
+
     Args:
-        access_token (str): Valid GitHub access token from OAuth flow
-        
-    Returns:
-        dict: GitHub user profile data including:
-            - id: GitHub user ID (unique identifier)
-            - login: GitHub username  
-            - email: User's primary email (may be None if private)
-            - name: User's display name
-            - avatar_url: Profile picture URL
-            - html_url: GitHub profile URL
-            - Other public profile fields
-            
-    Raises:
-        requests.HTTPError: If GitHub API request fails (invalid token, rate limits, etc.)
-        
-    Privacy Note: Only public profile information is returned.
-    Private email addresses may not be included unless user grants email scope.
-    
-    Used for: User profile creation, account linking verification, profile updates
+        oauth_url: Base URL of github.com (authorize and token endpoints)
+        api_url: Base URL of the REST API (user endpoint)
+        timeout: Connect/read/write/pool timeouts
+        max_retries: Extra attempts; the token exchange is only retried when
+            the request was not sent, because a code is single-use
+        retry_backoff: Exponential backoff base (seconds)
+        transport: Custom httpx transport (tests)
     """
-    # Make GET request to GitHub's user API endpoint
-    res = requests.get(
-        "https://api.github.com/user",                   # GitHub user profile endpoint
-        headers={
-            "Authorization": f"Bearer {access_token}",   # OAuth access token for authentication
-            "Accept": "application/json",                # Request JSON response format
-        },
-    )
-    
-    # Raise exception if request failed (invalid token, rate limits, etc.)
-    res.raise_for_status()
-    
-    # Return complete user profile data as dictionary
-    return res.json()
+
+    def __init__(
+        self,
+        oauth_url: str = GITHUB_OAUTH_URL,
+        api_url: str = GITHUB_API_URL,
+        client_id: Optional[str] = GITHUB_CLIENT_ID,
+        client_secret: Optional[str] = GITHUB_CLIENT_SECRET,
+        timeout: Optional[httpx.Timeout] = None,
+        max_retries: int = GITHUB_MAX_RETRIES,
+        retry_backoff: float = 0.2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.oauth_url = oauth_url.rstrip("/")
+        self.api_url = api_url.rstrip("/")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.timeout = timeout or httpx.Timeout(
+            GITHUB_READ_TIMEOUT,
+            connect=GITHUB_CONNECT_TIMEOUT,
+        )
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def authorize_url(self, state: str, redirect_uri: Optional[str], scope: str) -> str:
+        """
+        URL that sends the browser to GitHub's consent page.
+
+        Args:
+            state: Single-use CSRF state (see create_oauth_state)
+            redirect_uri: Callback URL registered for the OAuth app
+            scope: Space-separated scopes
+
+        Returns:
+            str: Authorization URL
+        """
+        query = urlencode({
+            "client_id": self.client_id,
+            "redirect_uri": redirect_uri,
+            "scope": scope,
+            "state": state,
+        })
+        return f"{self.oauth_url}/login/oauth/authorize?{query}"
+
+    async def exchange_code_for_token(self, code: str) -> str:
+        """
+        Exchange GitHub OAuth authorization code for access token.
+
+        Args:
+            code: Authorization code received from GitHub OAuth callback
+
+        Returns:
+            str: GitHub access token for authenticated API requests
+
+        Raises:
+            GitHubError: GitHub unreachable, timed out, or the code was
+                rejected (invalid, expired or already used)
+        """
+        res = await self._send(
+            "POST",
+            f"{self.oauth_url}/login/oauth/access_token",
+            idempotent=False,
+            headers={"Accept": "application/json"},
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+            },
+        )
+
+        # GitHub answers 200 with an error document for bad codes
+        token = _json(res).get("access_token")
+        if not token:
+            raise GitHubError("GitHub rejected the authorization code")
+        return token
+
+    async def fetch_user(self, access_token: str) -> dict:
+        """
+        Retrieve GitHub user profile information using access token.
+
+        Args:
+            access_token: Valid GitHub access token from OAuth flow
+
+        Returns:
+            dict: GitHub user profile (id, login, email, name, ...)
+
+        Raises:
+            GitHubError: GitHub unreachable, timed out, or token rejected
+        """
+        res = await self._send(
+            "GET",
+            f"{self.api_url}/user",
+            idempotent=True,
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/json",
+            },
+        )
+        return _json(res)
+
+    async def aclose(self) -> None:
+        """Close pooled connections (application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+    def _http(self) -> httpx.AsyncClient:
+        # Connections belong to an event loop; a new loop gets a new pool
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                self._retire_client(self._client, self._loop)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=GITHUB_POOL_MAXSIZE,
+                    max_keepalive_connections=GITHUB_POOL_MAXSIZE,
+                ),
+                transport=self._transport,
+            )
+            self._loop = loop
+        return self._client
+
+    @staticmethod
+    def _retire_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+        # aclose() must run on the loop that owns the connections
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # The loop is gone (e.g. asyncio.run() returned); its sockets can
+            # no longer be closed from here and are left to the GC
+            logger.warning(
+                "GitHub client of a finished event loop was not closed; "
+                "call github_client.aclose() before the loop ends"
+            )
+
+    async def _send(self, method: str, url: str, idempotent: bool, **kwargs) -> httpx.Response:
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+            try:
+                res = await self._http().request(method, url, **kwargs)
+            except NOT_SENT_ERRORS as exc:
+                last_error = exc
+                continue
+            except httpx.TransportError as exc:
+                # Sent but no (complete) answer: repeat only idempotent calls
+                if not idempotent:
+                    raise GitHubError("GitHub did not respond") from exc
+                last_error = exc
+                continue
+
+            if res.status_code in RETRY_STATUSES and idempotent:
+                last_error = GitHubError(f"GitHub returned {res.status_code}")
+                continue
+            if res.is_error:
+                raise GitHubError(f"GitHub returned {res.status_code}")
+            return res
+
+        raise GitHubError("GitHub is not reachable") from last_error
+
+
+def _json(res: httpx.Response) -> dict:
+    try:
+        return res.json()
+    except ValueError as exc:
+        raise GitHubError("GitHub returned an invalid response") from exc
+
+
+# Shared by all requests of this worker
+github_client = GitHubClient()
 
 # --- GitHub OAuth Integration Design Notes ---
 # This module implements GitHub's OAuth 2.0 flow for user authentication:
-# 
+#
 # OAuth Flow:
-# 1. User initiates login → redirect to GitHub authorization
-# 2. User grants permission → GitHub redirects with authorization code  
+# 1. User initiates login → redirect to authorize_url()
+# 2. User grants permission → GitHub redirects with authorization code
 # 3. exchange_code_for_token() → converts code to access token
 # 4. fetch_user() → retrieves user profile with access token
 # 5. Application creates/links user account based on profile data
@@ -104,9 +253,9 @@ def fetch_user(access_token: str) -> dict:
 # - Client credentials stored securely in configuration
 # - Access tokens have limited lifetime and scope
 # - Only public profile information is accessed
-# - Rate limiting handled by GitHub (may need retry logic for production)
 #
 # Error Handling:
-# - Network errors propagated as requests.HTTPError
-# - Invalid responses may raise KeyError or ValueError
-# - Caller responsible for handling OAuth-specific errors (expired codes, etc.)
+# - Timeouts, network errors and error responses raise GitHubError
+# - Retries: unsent requests always, GET also on read errors and 502/503/504;
+#   a sent token exchange is never repeated (codes are single-use)
+# - Caller turns GitHubError into an OAuth error redirect
@@ -1,22 +1,35 @@
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 
 from api.config import validate_config
+from api.integrations.github_client import github_client
 from api.routes.auth import router as auth_router
 from api.routes.companies import router as companies_router
+from api.routes.dashboard import router as dashboard_router
 from api.routes.items import router as items_router
+from api.routes.metrics import router as metrics_router
 from api.routes.orders import router as orders_router
 from api.routes.users import router as users_router
 from api.utils.exception_handlers import register_exception_handlers
 
 validate_config()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled connections to GitHub
+    await github_client.aclose()
+
+
 app = FastAPI(
     title="Business Management API",
     description="REST API for business management system with multi-tenant support",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 register_exception_handlers(app)
@@ -26,6 +39,8 @@ app.include_router(users_router)
 app.include_router(companies_router)
 app.include_router(items_router)
 app.include_router(orders_router)
+app.include_router(dashboard_router)
+app.include_router(metrics_router)
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -11,7 +11,10 @@ Available Models:
     - Item: Product catalog and inventory management
     - Order: Customer orders and order lifecycle
     - OrderItem: Individual items within orders with pricing
+    - OrderStatusCount: Per-day order status counters for dashboard statistics
     - UserOAuthAccount: External authentication provider linkage
+    - RefreshToken: Hashed, rotating refresh tokens of login sessions
+    - OAuthFlowEntry: Short-lived OAuth state and exchange codes (shared store)
 
 Usage:
     from api.models import User, Company, Order
@@ -28,6 +31,8 @@ Database Design: Multi-tenant architecture with company-based data isolation
 from api.models.user import User                    # User accounts and authentication
 from api.models.role import Role                    # Role-based access control
 from api.models.oauth import UserOAuthAccount       # OAuth provider integration
+from api.models.refresh_token import RefreshToken   # Refresh tokens of login sessions
+from api.models.oauth_flow import OAuthFlowEntry    # OAuth state / exchange codes in flight
 
 # Import multi-tenant organization model
 from api.models.company import Company              # Tenant/organization containers
@@ -36,3 +41,4 @@ from api.models.company import Company              # Tenant/organization contai
 from api.models.item import Item                    # Product catalog and inventory
 from api.models.order import Order                  # Customer orders
 from api.models.order_item import OrderItem         # Order line items with pricing
+from api.models.order_status_count import OrderStatusCount  # Order statistics rollup
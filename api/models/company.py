@@ -1,5 +1,5 @@
 # Import SQLAlchemy components for ORM model definition
-from sqlalchemy import String, Integer
+from sqlalchemy import String, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Import database base class for model inheritance
@@ -28,6 +28,12 @@ class Company(Base):
     """
     __tablename__ = "companies"
 
+    # --- Indexes (match db/schema.sql and db/migrations/009_prefix_filter_indexes.sql) ---
+    __table_args__ = (
+        # Prefix filters on the company name (LIKE 'x%')
+        Index("ix_companies_name_pattern", "name", postgresql_ops={"name": "text_pattern_ops"}),
+    )
+
     # --- Primary Key ---
     id: Mapped[int] = mapped_column(
         Integer,
@@ -5,6 +5,10 @@ from sqlalchemy import (
     Numeric,
     Boolean,
     ForeignKey,
+    Index,
+    func,
+    literal_column,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,6 +38,25 @@ class Item(Base):
     """
     __tablename__ = "items"
 
+    # --- Indexes (match db/schema.sql and db/migrations/002_query_shape_indexes.sql, 004_sort_indexes.sql,
+    # 009_prefix_filter_indexes.sql) ---
+    __table_args__ = (
+        Index("uniq_company_sku", "company_id", "sku", unique=True),  # SKU unique per company
+        Index("ix_items_company_name", "company_id", "name", "id"),    # Catalog sorted by name
+        Index("ix_items_company_price", "company_id", "price", "id"),  # Catalog sorted by price
+        # Prefix filters (LIKE 'x%'); the sort indexes above cannot serve LIKE
+        Index("ix_items_company_name_pattern", "company_id", "name", postgresql_ops={"name": "text_pattern_ops"}),
+        Index("ix_items_company_sku_pattern", "company_id", "sku", postgresql_ops={"sku": "text_pattern_ops"}),
+        Index(
+            "ix_items_low_stock",
+            "company_id",
+            "quantity",
+            # Partial: only active low-stock rows (20 = item_db.LOW_STOCK_THRESHOLD)
+            postgresql_where=text("is_active AND quantity <= 20"),
+            sqlite_where=text("is_active = 1 AND quantity <= 20"),
+        ),
+    )
+
     # --- Primary Key ---
     id: Mapped[int] = mapped_column(
         Integer,
@@ -93,6 +116,21 @@ class Item(Base):
         passive_deletes=True,           # Handle CASCADE delete efficiently
     )
 
+# Lower-cased "name sku" text matched by fuzzy item search. Queries must use
+# this exact expression (with the literal space) to hit ix_items_search.
+item_search_text = func.lower(Item.name.concat(literal_column("' '")).concat(Item.sku))
+
+# Trigram index for fuzzy search (match db/migrations/005_item_search.sql).
+# company_id comes first (btree_gin) so one tenant's catalog is searched
+# without visiting other tenants' items. PostgreSQL only.
+Index(
+    "ix_items_search",
+    Item.company_id,
+    item_search_text.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
 # --- Item Management Design Notes ---
 # Pricing Strategy:
 # - Current price stored in item.price for catalog display
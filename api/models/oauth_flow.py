@@ -0,0 +1,51 @@
+from datetime import datetime
+
+# Import SQLAlchemy components for ORM model definition
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Import database base class for model inheritance
+from api.db.db_engine import Base
+
+
+class OAuthFlowEntry(Base):
+    """
+    Short-lived value of an OAuth flow in progress (CSRF state, exchange code).
+
+    Backs the shared OAuth flow store, so a GitHub callback or code exchange
+    can be served by any worker or host, not only the one that started the
+    flow.
+
+    Key Design Principles:
+        - Single use: entries are deleted when consumed
+        - Minutes-long lifetime; expired rows are swept by the store
+        - Key is namespaced by kind (e.g. "state:<token>", "code:<token>")
+    """
+    __tablename__ = "oauth_flow_entries"
+
+    # --- Indexes (match db/migrations/007_oauth_flow_entries.sql) ---
+    __table_args__ = (
+        Index("ix_oauth_flow_entries_expires_at", "expires_at"),  # Expiry sweep
+    )
+
+    # --- Primary Key ---
+    key: Mapped[str] = mapped_column(
+        String(128),
+        primary_key=True,               # "<kind>:<random token>"
+    )
+
+    # --- Value ---
+    payload: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,                 # JSON document
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,                 # UTC; consumed or swept afterwards
+    )
+
+# --- OAuth Flow Entry Design Notes ---
+# Exchange code payloads contain freshly issued tokens; they live for two
+# minutes and are deleted on first use, expired leftovers are swept on writes
+# No foreign keys: entries of the login flow exist before a user is known
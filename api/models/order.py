@@ -5,6 +5,7 @@ from sqlalchemy import (
     String,
     ForeignKey,
     DateTime,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,6 +39,13 @@ class Order(Base):
 
     __tablename__ = "orders"
 
+    # --- Indexes (match db/migrations/002_query_shape_indexes.sql) ---
+    __table_args__ = (
+        Index("ix_orders_company_created", "company_id", "created_at"),  # Tenant listings, date ranges
+        Index("ix_orders_company_status", "company_id", "status"),       # Status filters per tenant
+        Index("ix_orders_created_at", "created_at"),                     # Cross-tenant stats (superadmin)
+    )
+
     # --- Primary Key ---
     id: Mapped[int] = mapped_column(
         Integer,
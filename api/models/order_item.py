@@ -1,5 +1,5 @@
 # Import SQLAlchemy components for ORM model definition
-from sqlalchemy import Integer, ForeignKey, Numeric
+from sqlalchemy import Integer, ForeignKey, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Import database base class for model inheritance
@@ -28,6 +28,12 @@ class OrderItem(Base):
     """
     __tablename__ = "order_items"
 
+    # --- Indexes (match db/migrations/002_query_shape_indexes.sql) ---
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),  # Lines of an order
+        Index("ix_order_items_item_id", "item_id"),    # Item deletes cascade to lines
+    )
+
     # --- Primary Key ---
     id: Mapped[int] = mapped_column(
         Integer,
@@ -0,0 +1,54 @@
+from datetime import date
+
+# Import SQLAlchemy components for ORM model definition
+from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Import database base class for model inheritance
+from api.db.db_engine import Base
+
+
+class OrderStatusCount(Base):
+    """
+    Rollup of order counts per company, creation day, order type and status.
+
+    Maintained incrementally in the same transaction as order creation and
+    status changes, so dashboard statistics sum a handful of counter rows
+    instead of scanning orders.
+
+    Key Design Principles:
+        - One row per (company_id, day, order_type, status)
+        - day is the UTC creation day of the order; a status change moves
+          the order between status rows of the same day
+        - Can always be rebuilt from orders (python -m api.cli rebuild-order-stats)
+    """
+    __tablename__ = "order_status_counts"
+
+    # --- Composite Primary Key (counter bucket) ---
+    company_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("companies.id", ondelete="CASCADE"),  # Drop counters with company
+        primary_key=True,
+    )
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,               # Creation day of counted orders
+    )
+
+    order_type: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,               # sale / restock
+    )
+
+    status: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,               # pending / completed / cancelled
+    )
+
+    # --- Counter ---
+    order_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,                      # Number of orders in this bucket
+    )
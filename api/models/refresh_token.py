@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Optional
+
+# Import SQLAlchemy components for ORM model definition
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Import database base class for model inheritance
+from api.db.db_engine import Base
+
+
+class RefreshToken(Base):
+    """
+    Long-lived credential that mints new access tokens without a password login.
+
+    Only the SHA-256 digest of the token is stored; the token itself is sent to
+    the client once. Every refresh revokes the presented token and issues a new
+    one (rotation), so each token is single-use.
+
+    Key Design Principles:
+        - Bound to the login session (users.session_id): logout or a new
+          login ends the session and every refresh token issued for it
+        - Presenting an already rotated token revokes the whole session
+          (the token was copied, legitimate clients only hold the newest)
+        - Looked up by the unique token_hash index, no expensive hashing
+    """
+    __tablename__ = "refresh_tokens"
+
+    # --- Indexes (match db/migrations/006_refresh_tokens.sql) ---
+    __table_args__ = (
+        Index("ix_refresh_tokens_session_id", "session_id"),  # Revoke / check a session's tokens
+    )
+
+    # --- Primary Key ---
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+
+    # --- Token Identity ---
+    token_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,                    # SHA-256 hex digest, lookup key on refresh
+    )
+
+    # --- Owner and Session ---
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),  # Delete tokens with the user
+        nullable=False,
+    )
+
+    session_id: Mapped[str] = mapped_column(
+        String,
+        nullable=False,                 # users.session_id the token was issued for
+    )
+
+    # --- Lifetime ---
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,                 # UTC; REFRESH_TOKEN_TTL_SECONDS after issue
+    )
+
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,                  # Set when rotated, on logout or on reuse
+    )
+
+# --- Refresh Token Design Notes ---
+# Tokens are 256-bit random values, so a fast digest is enough to store them
+# safely (no slow password hash needed); lookups are a single index probe
+# Revoked and expired rows are kept until purged (python -m api.cli purge-refresh-tokens)
+# so reuse of a rotated token can still be recognised
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 
@@ -24,6 +24,17 @@ class User(Base):
     """
     __tablename__ = "users"
 
+    # --- Indexes (match db/migrations/002_query_shape_indexes.sql, 004_sort_indexes.sql and
+    # 009_prefix_filter_indexes.sql) ---
+    __table_args__ = (
+        Index("ix_users_company_status", "company_id", "status"),  # Tenant user lists, online counts
+        Index("ix_users_role_id", "role_id"),                      # Role-scoped listings
+        Index("ix_users_company_username", "company_id", "username", "id"),  # Sorted by username
+        # Prefix filters (LIKE 'x%'); the unique indexes cannot serve LIKE
+        Index("ix_users_username_pattern", "username", postgresql_ops={"username": "text_pattern_ops"}),
+        Index("ix_users_email_pattern", "email", postgresql_ops={"email": "text_pattern_ops"}),
+    )
+
     # --- Primary Key ---
     id: Mapped[int] = mapped_column(
         Integer,
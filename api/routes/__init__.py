@@ -10,6 +10,8 @@ Route Modules:
     - companies.py: Multi-tenant company management (superadmin only)
     - items.py: Product catalog and inventory management
     - orders.py: Order processing and lifecycle management
+    - dashboard.py: Combined dashboard widgets in a single request
+    - metrics.py: Per-worker pool, cache and transaction counters (superadmin only)
 
 Common Patterns:
     - Dependency injection for database sessions and authentication
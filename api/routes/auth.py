@@ -2,14 +2,15 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_db
+from api.dependencies import get_async_db, get_current_user, get_db
 from api.models.user import User
 from api.schemas import LoginRequest, LoginResponse, MessageResponse
-from api.schemas.auth_schema import OAuthExchangeRequest
+from api.schemas.auth_schema import OAuthExchangeRequest, RefreshRequest, TokenRefreshResponse
 from api.services import login_user, logout_user
 from api.services.auth_service import (
     exchange_oauth_code,
     handle_github_callback,
+    refresh_access_token,
     start_github_link,
     start_github_login,
 )
@@ -25,6 +26,14 @@ def login_user_endpoint(
     return login_user(request.identifier, request.password, db)
 
 
+@router.post("/refresh", response_model=TokenRefreshResponse)
+def refresh_token_endpoint(
+    request: RefreshRequest,
+    db: Session = Depends(get_db),
+):
+    return refresh_access_token(request.refresh_token, db)
+
+
 @router.post("/logout", response_model=MessageResponse)
 def logout_user_endpoint(
     db: Session = Depends(get_db),
@@ -48,12 +57,12 @@ def link_github_account(
 
 
 @router.get("/github/callback")
-def github_callback(
+async def github_callback(
     code: str,
     state: str,
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
 ):
-    redirect_url = handle_github_callback(code, state, db)
+    redirect_url = await handle_github_callback(code, state, db)
     return RedirectResponse(url=redirect_url)
 
 
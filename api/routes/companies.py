@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_db
+from api.dependencies import get_async_read_db, get_current_user, get_current_user_async, get_db, get_read_db
 from api.domain.mappers.company_mapper import (
     company_domain_to_detail_response,
     company_domain_to_row,
@@ -23,7 +24,7 @@ from api.services import (
     edit_company,
     get_info_of_company,
     list_companies,
-    paginate_companies,
+    paginate_companies_async,
 )
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
@@ -31,7 +32,7 @@ router = APIRouter(prefix="/api/companies", tags=["companies"])
 
 @router.get("", response_model=CompaniesResponse)
 def list_companies_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     result = list_companies(db=db, current_user=current_user)
@@ -39,28 +40,32 @@ def list_companies_endpoint(
 
 
 @router.post("/search", response_model=PaginationResponse)
-def paginate_companies_endpoint(
+async def paginate_companies_endpoint(
     data: PaginationRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    result = paginate_companies(
+    result = await paginate_companies_async(
         db=db,
         current_user=current_user,
         limit=data.limit,
         offset=data.offset,
         filters=data.filters,
+        after=data.after,
+        sort=data.sort_order,
     )
     return PaginationResponse(
         total=result.total,
         data=[company_domain_to_row(company) for company in result.data],
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
 @router.get("/{company_id}", response_model=CompanyDetailResponse)
 def get_company_endpoint(
     company_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     company = get_info_of_company(
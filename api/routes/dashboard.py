@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from api.dependencies import get_current_user, get_snapshot_db
+from api.domain.mappers.dashboard_mapper import dashboard_to_response
+from api.models.user import User
+from api.schemas import DashboardResponse
+from api.services import get_dashboard
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=DashboardResponse)
+def get_dashboard_endpoint(
+    db: Session = Depends(get_snapshot_db),
+    current_user: User = Depends(get_current_user),
+):
+    return dashboard_to_response(get_dashboard(db=db, current_user=current_user))
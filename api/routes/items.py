@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Depends
+from typing import Iterator
+
+import anyio
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_db
+from api.db import ITEM_EXPORT_COLUMNS
+from api.dependencies import (
+    get_async_read_db,
+    get_current_user,
+    get_current_user_async,
+    get_db,
+    get_read_db,
+    get_stream_db,
+)
 from api.domain.mappers.item_mapper import (
     item_domain_to_edit_response,
     item_domain_to_get_response,
     item_domain_to_row,
+    item_import_report_to_response,
 )
 from api.models.user import User
 from api.schemas import (
@@ -13,44 +26,66 @@ from api.schemas import (
     ItemEditRequest,
     ItemEditResponse,
     ItemGetResponse,
+    ItemImportResponse,
+    ItemSearchRequest,
     MessageResponse,
-    PaginationRequest,
     PaginationResponse,
 )
 from api.services import (
     create_item,
     edit_item,
+    export_items,
     get_item,
-    paginate_items,
+    IMPORT_COLUMNS,
+    import_items,
+    paginate_items_async,
     toggle_item_is_active,
 )
+from api.utils.export_utils import ExportFormat, export_response
+from api.utils.import_utils import import_format, iter_records
 
 router = APIRouter(prefix="/api/items", tags=["items"])
 
 
 @router.post("/search", response_model=PaginationResponse)
-def paginate_items_endpoint(
-    request: PaginationRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def paginate_items_endpoint(
+    request: ItemSearchRequest,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    result = paginate_items(
+    result = await paginate_items_async(
         db=db,
         current_user=current_user,
         limit=request.limit,
         offset=request.offset,
         filters=request.filters,
+        after=request.after,
+        sort=request.sort_order,
+        q=request.q,
     )
     return PaginationResponse(
         total=result.total,
         data=[item_domain_to_row(item) for item in result.data],
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
+@router.get("/export")
+def export_items_endpoint(
+    fmt: ExportFormat = Query("csv", alias="format"),
+    open_db=Depends(get_stream_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Rows are read from a server-side cursor while the response is sent
+    rows = export_items(open_db=open_db, current_user=current_user)
+    return export_response(ITEM_EXPORT_COLUMNS, rows, fmt, filename="items")
+
+
 @router.get("/{item_id}", response_model=ItemGetResponse)
 def get_item_endpoint(
     item_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return get_item(item_id=item_id, db=db, current_user=current_user)
@@ -72,6 +107,35 @@ def create_item_endpoint(
     return MessageResponse(message=result.message)
 
 
+@router.post("/import", response_model=ItemImportResponse)
+def import_items_endpoint(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Body is the raw file (Content-Type text/csv or application/x-ndjson),
+    # parsed while it streams in
+    fmt = import_format(request.headers.get("content-type"))
+    report = import_items(
+        db=db,
+        current_user=current_user,
+        records=iter_records(_body_chunks(request), fmt, required=IMPORT_COLUMNS),
+    )
+    return item_import_report_to_response(report)
+
+
+def _body_chunks(request: Request) -> Iterator[bytes]:
+    # Sync endpoints run in a worker thread; pull body chunks from the event loop
+    stream = request.stream()
+    while True:
+        try:
+            chunk = anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+        if chunk:
+            yield chunk
+
+
 @router.put("/{item_id}", response_model=ItemEditResponse)
 def edit_item_endpoint(
     item_id: int,
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+
+from api.dependencies import get_current_user, transaction_stats
+from api.models.user import User
+from api.schemas import MetricsResponse
+from api.services import get_worker_metrics
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+def get_metrics_endpoint(current_user: User = Depends(get_current_user)):
+    return get_worker_metrics(current_user=current_user, transactions=transaction_stats())
@@ -1,41 +1,66 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_db
+from api.db import ORDER_EXPORT_COLUMNS
+from api.dependencies import (
+    get_async_read_db,
+    get_current_user,
+    get_current_user_async,
+    get_db,
+    get_read_db,
+    get_stream_db,
+)
 from api.domain.mappers.order_mapper import (
+    order_bulk_result_to_response,
     order_domain_to_row,
     order_lines_to_rows,
 )
 from api.models.user import User
-from api.schemas import MessageResponse, OrderCreateRequest, PaginationRequest, PaginationResponse
+from api.schemas import (
+    MessageResponse,
+    OrderBulkRequest,
+    OrderBulkResponse,
+    OrderCreateRequest,
+    PaginationRequest,
+    PaginationResponse,
+)
 from api.services import (
     cancel_order,
+    cancel_orders,
     complete_order,
-    count_orders_by_status,
+    complete_orders,
+    count_orders_by_status_async,
     create_order,
+    export_orders,
     paginate_order_items,
-    paginate_orders,
+    paginate_orders_async,
 )
+from api.utils.export_utils import ExportFormat, export_response
 
 router = APIRouter(prefix="/api/orders", tags=["orders"])
 
 
 @router.post("/search", response_model=PaginationResponse)
-def paginate_orders_endpoint(
+async def paginate_orders_endpoint(
     request: PaginationRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    result = paginate_orders(
+    result = await paginate_orders_async(
         db=db,
         current_user=current_user,
         limit=request.limit,
         offset=request.offset,
         filters=request.filters,
+        after=request.after,
+        sort=request.sort_order,
     )
     return PaginationResponse(
         total=result.total,
         data=[order_domain_to_row(order) for order in result.data],
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -43,7 +68,7 @@ def paginate_orders_endpoint(
 def paginate_order_items_endpoint(
     order_id: int,
     request: PaginationRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     result = paginate_order_items(
@@ -52,19 +77,35 @@ def paginate_order_items_endpoint(
         order_id=order_id,
         limit=request.limit,
         offset=request.offset,
+        after=request.after,
+        sort=request.sort_order,
     )
     return PaginationResponse(
         total=result.total,
         data=order_lines_to_rows(result.data),
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
-@router.get("/stats")
-def get_order_counts_endpoint(
-    db: Session = Depends(get_db),
+@router.get("/export")
+def export_orders_endpoint(
+    fmt: ExportFormat = Query("csv", alias="format"),
+    open_db=Depends(get_stream_db),
     current_user: User = Depends(get_current_user),
 ):
-    return count_orders_by_status(db=db, current_user=current_user).as_dict()
+    # Rows are read from a server-side cursor while the response is sent
+    rows = export_orders(open_db=open_db, current_user=current_user)
+    return export_response(ORDER_EXPORT_COLUMNS, rows, fmt, filename="orders")
+
+
+@router.get("/stats")
+async def get_order_counts_endpoint(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    counts = await count_orders_by_status_async(db=db, current_user=current_user)
+    return counts.as_dict()
 
 
 @router.post("", response_model=MessageResponse)
@@ -82,6 +123,26 @@ def create_order_endpoint(
     return MessageResponse(message=result.message)
 
 
+@router.post("/bulk/complete", response_model=OrderBulkResponse)
+def complete_orders_endpoint(
+    request: OrderBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = complete_orders(db=db, current_user=current_user, order_ids=request.order_ids)
+    return order_bulk_result_to_response(result)
+
+
+@router.post("/bulk/cancel", response_model=OrderBulkResponse)
+def cancel_orders_endpoint(
+    request: OrderBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = cancel_orders(db=db, current_user=current_user, order_ids=request.order_ids)
+    return order_bulk_result_to_response(result)
+
+
 @router.post("/{order_id}/cancel", response_model=MessageResponse)
 def cancel_order_endpoint(
     order_id: int,
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_db
+from api.dependencies import get_async_read_db, get_current_user, get_current_user_async, get_db, get_read_db
 from api.models.user import User
 from api.schemas import (
     MessageResponse,
@@ -19,11 +20,11 @@ from api.schemas import (
 from api.services import (
     create_user_account,
     edit_user,
-    get_current_user_info,
+    get_current_user_info_async,
     get_info_of_user,
     get_subroles_for_role,
-    get_user_count,
-    paginate_users,
+    get_user_count_async,
+    paginate_users_async,
     toggle_user_is_active,
 )
 
@@ -32,16 +33,16 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 
 
 @router.get("/me")
-def get_me_endpoint(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def get_me_endpoint(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    return get_current_user_info(db, current_user)
+    return await get_current_user_info_async(db, current_user)
 
 
 @router.get("/roles/assignable", response_model=RolesResponse)
 def get_subroles_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     roles = get_subroles_for_role(
@@ -56,11 +57,11 @@ def get_subroles_endpoint(
 
 
 @router.get("/stats", response_model=UserCountResponse)
-def get_user_stats_endpoint(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def get_user_stats_endpoint(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    return get_user_count(db, current_user)
+    return await get_user_count_async(db, current_user)
 
 
 @router.post("", response_model=UserCreateResponse)
@@ -100,7 +101,7 @@ def edit_user_endpoint(
 @router.get("/{user_id}", response_model=UserGetResponse)
 def get_user_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return get_info_of_user(db=db, current_user=current_user, user_id=user_id)
@@ -117,16 +118,23 @@ def toggle_user_is_active_endpoint(
 
 
 @router.post("/search", response_model=PaginationResponse)
-def paginate_users_endpoint(
+async def paginate_users_endpoint(
     request: PaginationRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    result = paginate_users(
+    result = await paginate_users_async(
         db=db,
         current_user=current_user,
         limit=request.limit,
         offset=request.offset,
         filters=request.filters,
+        after=request.after,
+        sort=request.sort_order,
     )
-    return PaginationResponse(total=result.total, data=result.data)
\ No newline at end of file
+    return PaginationResponse(
+        total=result.total,
+        data=result.data,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
+    )
\ No newline at end of file
@@ -5,4 +5,6 @@ from api.schemas.universal_schema import *
 from api.schemas.user_schema import *
 from api.schemas.pagination_schema import *
 from api.schemas.item_schema import *
-from api.schemas.order_schema import *
\ No newline at end of file
+from api.schemas.order_schema import *
+from api.schemas.dashboard_schema import *
+from api.schemas.metrics_schema import *
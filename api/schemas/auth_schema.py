@@ -1,5 +1,4 @@
-from datetime import datetime
-from typing import Optional, TypedDict
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -13,11 +12,6 @@ class OAuthInfo(BaseModel):
     github: bool = False
 
 
-class OAuthStateData(TypedDict):
-    user_id: Optional[int]
-    expires_at: datetime
-
-
 class LoginResponse(BaseModel):
     id: int
     username: str
@@ -26,6 +20,17 @@ class LoginResponse(BaseModel):
     role: str
     company_id: Optional[int] = None
     oauth_info: OAuthInfo
+    refresh_token: Optional[str] = None  # Exchange at /api/auth/refresh for a new access token
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
+class TokenRefreshResponse(BaseModel):
+    access_token: str
+    token_type: str
+    refresh_token: str  # Rotated; the presented token is no longer valid
 
 
 class LogoutRequest(BaseModel):
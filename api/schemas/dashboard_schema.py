@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+from api.schemas.pagination_schema import PaginationResponse
+from api.schemas.user_schema import UserCountResponse
+
+
+class DashboardResponse(BaseModel):
+    user_stats: UserCountResponse
+    order_counts: Dict[str, int]
+    online_users: PaginationResponse
+    companies: Optional[PaginationResponse] = None        # superadmin only
+    low_stock_items: Optional[PaginationResponse] = None  # company roles only
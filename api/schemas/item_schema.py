@@ -1,5 +1,8 @@
 from decimal import Decimal
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from api.schemas.pagination_schema import PaginationRequest
 
 
 class ItemWriter(BaseModel):
@@ -17,4 +20,19 @@ class ItemEditRequest(ItemWriter):
     pass
 
 class ItemEditResponse(ItemWriter):
-    pass
\ No newline at end of file
+    pass
+
+class ItemImportErrorResponse(BaseModel):
+    line: int
+    error: str
+    sku: Optional[str] = None
+
+class ItemImportResponse(BaseModel):
+    processed: int
+    imported: int
+    failed: int
+    errors: List[ItemImportErrorResponse]
+    errors_truncated: bool = False  # More rows failed than are listed in errors
+
+class ItemSearchRequest(PaginationRequest):
+    q: Optional[str] = Field(default=None, max_length=100)  # Fuzzy match on name and SKU, ranked by relevance
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Dict
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+
+class MetricsResponse(BaseModel):
+    transactions: Dict[str, int]      # Sessions per mode, commits, rollbacks
+    replicas: Dict[str, int]          # Routing decisions and healthy replicas
+    password_hashing: Dict[str, int]  # Hashing pool queue depth and counters
+    principal_cache: CacheStatsResponse
+    dashboard_cache: CacheStatsResponse
@@ -1,7 +1,23 @@
 from decimal import Decimal
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+BULK_ORDER_MAX_IDS = 500  # Orders per bulk complete/cancel request
 
 class OrderCreateRequest(BaseModel):
     order_type: str
-    items: List[dict]
\ No newline at end of file
+    items: List[dict]
+
+class OrderBulkRequest(BaseModel):
+    order_ids: List[int] = Field(min_length=1, max_length=BULK_ORDER_MAX_IDS)
+
+class OrderBulkOutcomeResponse(BaseModel):
+    order_id: int
+    success: bool
+    status: Optional[str] = None  # New status of successfully changed orders
+    error: Optional[str] = None   # Reason the order was left unchanged
+
+class OrderBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[OrderBulkOutcomeResponse]
@@ -1,12 +1,25 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal, Optional, Tuple
 
 
+class SortField(BaseModel):
+    field: str = Field(min_length=1, max_length=64)
+    direction: Literal["asc", "desc"] = "asc"
+
 class PaginationRequest(BaseModel):
     limit: int = Field(default=10, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
     filters: Dict[str, Any] = {}
+    sort: List[SortField] = Field(default=[], max_length=3)  # Whitelisted per entity; id tie-breaker added
+    after: Optional[str] = None  # Keyset cursor (next_cursor of previous page); overrides offset
+
+    @property
+    def sort_order(self) -> List[Tuple[str, str]]:
+        """Requested ordering as (field, direction) pairs for the services."""
+        return [(key.field, key.direction) for key in self.sort]
 
 class PaginationResponse(BaseModel):
     total: int
     data: list
+    next_cursor: Optional[str] = None  # None on the last page
+    total_is_estimate: bool = False  # total comes from planner statistics
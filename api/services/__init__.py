@@ -12,4 +12,6 @@ from api.services.auth_service import *      # Authentication and OAuth flows
 from api.services.company_service import *   # Multi-tenant company operations
 from api.services.role_service import *      # Role-based access control
 from api.services.item_service import *      # Product catalog management
-from api.services.order_service import *     # Order processing and lifecycle
\ No newline at end of file
+from api.services.order_service import *     # Order processing and lifecycle
+from api.services.dashboard_service import *  # Combined dashboard snapshot
+from api.services.metrics_service import *    # Worker counters for monitoring
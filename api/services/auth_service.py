@@ -1,16 +1,30 @@
 # Import utilities
+from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 # Import configuration
-from api.config import GITHUB_CLIENT_ID, GITHUB_REDIRECT_URI
+from api.config import (
+    GITHUB_REDIRECT_URI,
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+    REFRESH_TOKEN_TTL_SECONDS,
+)
 
 # Import database operations
 from api.db.oauth_db import (
     create_oauth_account,
     get_oauth_account_by_provider_user_id,
 )
+from api.db.refresh_token_db import (
+    get_refresh_token_by_hash,
+    insert_refresh_token,
+    revoke_refresh_token,
+    revoke_session_refresh_tokens,
+    session_has_live_refresh_token,
+)
 from api.db.user_db import (
     clear_login_session,
     establish_login_session,
@@ -20,19 +34,19 @@ from api.db.user_db import (
 )
 
 # Import GitHub integration
-from api.integrations.github_client import (
-    exchange_code_for_token,
-    fetch_user,
-)
+from api.integrations.github_client import GitHubError, github_client
 
 # Import models and schemas
 from api.models.user import User
 from api.schemas import LoginResponse, MessageResponse
-from api.schemas.auth_schema import OAuthInfo
+from api.schemas.auth_schema import OAuthInfo, TokenRefreshResponse
 
 # Import utilities
 from api.utils import (
     create_access_token,
+    hash_password,
+    password_hasher,
+    password_needs_rehash,
     verify_password,
     create_oauth_state,
     UserAlreadyLoggedInError,
@@ -40,6 +54,9 @@ from api.utils import (
     UserDisabledError,
 )
 from api.utils.auth_utils import (
+    ACCESS_TOKEN_EXPIRES_IN,
+    generate_refresh_token,
+    hash_refresh_token,
     consume_oauth_exchange_code,
     consume_oauth_state,
     create_oauth_exchange_code,
@@ -52,7 +69,19 @@ from api.utils.auth_utils import (
 # =====================================================
 
 def login_user_object(user: User, db: Session) -> LoginResponse:
-    """Create session and JWT for authenticated user."""
+    """Create session, JWT and refresh token for authenticated user."""
+    now = datetime.utcnow()
+
+    # A session whose client has not refreshed within one access token
+    # lifetime has no valid token left; replace it instead of refusing login
+    if user.session_id is not None and not session_has_live_refresh_token(
+        db,
+        user.session_id,
+        now,
+        issued_after=now - timedelta(seconds=ACCESS_TOKEN_EXPIRES_IN),
+    ):
+        end_login_session(user, db, now)
+
     # Create login session
     session_id = establish_login_session(user)
 
@@ -76,9 +105,17 @@ def login_user_object(user: User, db: Session) -> LoginResponse:
         oauth_info=OAuthInfo(
             github="github" in providers
         ),
+        refresh_token=issue_refresh_token(db, user.id, session_id, now),
     )
 
 
+def end_login_session(user: User, db: Session, now: Optional[datetime] = None) -> None:
+    """Revoke the session's refresh tokens and clear the login session."""
+    if user.session_id is not None:
+        revoke_session_refresh_tokens(db, user.session_id, now or datetime.utcnow())
+    clear_login_session(user)
+
+
 # =====================================================
 # Password login
 # =====================================================
@@ -113,16 +150,80 @@ def verify_user(identifier: str, password: str, db: Session) -> User:
     if not user.is_active:
         raise UserDisabledError()
 
+    # Upgrade hashes made with older cost parameters while the password is known
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        password_hasher.record_rehash()
+
     return user
 
 
+# =====================================================
+# Refresh tokens
+# =====================================================
+
+def issue_refresh_token(db: Session, user_id: int, session_id: str, now: datetime) -> str:
+    """Store a new refresh token for the session and return it (only time it is visible)."""
+    token = generate_refresh_token()
+    insert_refresh_token(
+        db,
+        user_id=user_id,
+        session_id=session_id,
+        token_hash=hash_refresh_token(token),
+        expires_at=now + timedelta(seconds=REFRESH_TOKEN_TTL_SECONDS),
+    )
+    return token
+
+
+def refresh_access_token(refresh_token: str, db: Session) -> TokenRefreshResponse:
+    """
+    Exchange a refresh token for a new access token and a rotated refresh token.
+
+    Costs one index lookup and a digest instead of a password verification.
+    A rotated token presented again after REFRESH_TOKEN_REUSE_GRACE_SECONDS
+    means it was copied: the whole session is revoked.
+    """
+    now = datetime.utcnow()
+    stored = get_refresh_token_by_hash(db, hash_refresh_token(refresh_token))
+    if not stored or stored.expires_at <= now:
+        raise HTTPException(401, "Invalid refresh token")
+
+    # Rotate; losing the race to a concurrent refresh counts as reuse at "now"
+    if stored.revoked_at is not None or not revoke_refresh_token(db, stored.id, now):
+        revoked_at = stored.revoked_at or now
+        if now - revoked_at > timedelta(seconds=REFRESH_TOKEN_REUSE_GRACE_SECONDS):
+            revoke_session_refresh_tokens(db, stored.session_id, now)
+            user = db_get_user_data_by_id(db, stored.user_id)
+            if user and user.session_id == stored.session_id:
+                clear_login_session(user)
+            db.commit()  # Immediate commit for security actions (raising rolls back)
+            raise HTTPException(401, "Refresh token reuse detected")
+
+    user = db_get_user_data_by_id(db, stored.user_id)
+    if not user or not user.is_active or user.session_id != stored.session_id:
+        raise HTTPException(401, "Session expired")
+
+    return TokenRefreshResponse(
+        access_token=create_access_token(
+            user.id,
+            user.role.name,
+            session_id=stored.session_id,
+        ),
+        token_type="bearer",
+        refresh_token=issue_refresh_token(db, user.id, stored.session_id, now),
+    )
+
+
 # =====================================================
 # Logout
 # =====================================================
 
 def logout_user(current_user: User, db: Session) -> MessageResponse:
-    """Clear user session and set offline status."""
-    clear_login_session(current_user)
+    """Clear user session, revoke its refresh tokens and set offline status."""
+    # current_user may be a cached principal snapshot; mutate the stored row
+    user = db_get_user_data_by_id(db, current_user.id)
+    if user:
+        end_login_session(user, db)
     return MessageResponse(
         message="User logged out successfully"
     )
@@ -132,45 +233,47 @@ def logout_user(current_user: User, db: Session) -> MessageResponse:
 # GitHub OAuth – start flows
 # =====================================================
 
+GITHUB_SCOPE = "read:user user:email"
+
+
 def start_github_login() -> str:
     """Generate GitHub OAuth URL for login flow."""
     state = create_oauth_state(user_id=None)
-
-    return (
-        "https://github.com/login/oauth/authorize"
-        f"?client_id={GITHUB_CLIENT_ID}"
-        f"&redirect_uri={GITHUB_REDIRECT_URI}"
-        "&scope=read:user user:email"
-        f"&state={state}"
-    )
+    return github_client.authorize_url(state, GITHUB_REDIRECT_URI, GITHUB_SCOPE)
 
 
 def start_github_link(user_id: int) -> str:
     """Generate GitHub OAuth URL for account linking."""
     state = create_oauth_state(user_id)
-
-    return (
-        "https://github.com/login/oauth/authorize"
-        f"?client_id={GITHUB_CLIENT_ID}"
-        f"&redirect_uri={GITHUB_REDIRECT_URI}"
-        "&scope=read:user user:email"
-        f"&state={state}"
-    )
+    return github_client.authorize_url(state, GITHUB_REDIRECT_URI, GITHUB_SCOPE)
 
 
 # =====================================================
 # GitHub OAuth callback (LOGIN + LINK)
 # =====================================================
 
-def handle_github_callback(code: str, state: str, db: Session) -> str:
-    """Handle GitHub OAuth callback for login or linking."""
-    # Validate state and get user ID if linking
-    user_id: Optional[int] = consume_oauth_state(state)
+async def handle_github_callback(code: str, state: str, db: AsyncSession) -> str:
+    """
+    Handle GitHub OAuth callback for login or linking.
+
+    The GitHub round trips are awaited on the event loop (no thread-pool slot
+    is held while GitHub answers); the account work runs on the sync session.
+    """
+    # Validate state and get user ID if linking (the store may hit the database)
+    user_id: Optional[int] = await run_in_threadpool(consume_oauth_state, state)
+
+    # Exchange code for access token and load the GitHub profile
+    try:
+        access_token = await github_client.exchange_code_for_token(code)
+        github_user = await github_client.fetch_user(access_token)
+    except GitHubError:
+        return oauth_error_redirect("GitHub is not available, please try again")
+
+    return await db.run_sync(complete_github_callback, user_id, github_user)
 
-    # Exchange code for access token
-    access_token = exchange_code_for_token(code)
-    github_user = fetch_user(access_token)
 
+def complete_github_callback(db: Session, user_id: Optional[int], github_user: dict) -> str:
+    """Log in or link the account of a verified GitHub profile."""
     github_id = str(github_user["id"])
     github_email = str(github_user.get("email"))
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.orm import Session
 
 from api.domain import (
@@ -13,7 +13,7 @@ from api.domain.mappers.company_mapper import (
     company_domain_to_entity,
     company_entity_to_domain,
 )
-from api.models import User, Company as CompanyEntity
+from api.models import User
 from api.db.company_db import (
     get_company_data_by_id as db_get_company_data_by_id,
     create_company as db_create_company,
@@ -22,7 +22,9 @@ from api.db.company_db import (
     delete_company as db_delete_company,
     company_exists_by_name as db_company_exists_by_name,
     list_companies as db_list_companies,
+    paginate_companies as db_paginate_companies,
 )
+from api.db.async_db import paginate_companies_async as db_paginate_companies_async
 
 
 def create_company(db: Session, current_user: User, name: str, field: str) -> MessageResult:
@@ -146,19 +148,50 @@ def paginate_companies(
     limit: int,
     offset: int,
     filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ) -> PaginatedCompanies:
     RolePolicy.require(current_user.role.name, ["superadmin"])
 
-    query = db.query(CompanyEntity)
+    page = db_paginate_companies(
+        db=db,
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        sort=sort,
+    )
+
+    return _paginated_companies(page)
+
+
+async def paginate_companies_async(
+    db,
+    current_user: User,
+    limit: int,
+    offset: int,
+    filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+) -> PaginatedCompanies:
+    RolePolicy.require(current_user.role.name, ["superadmin"])
+
+    page = await db_paginate_companies_async(
+        db=db,
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        sort=sort,
+    )
 
-    for key, value in filters.items():
-        if hasattr(CompanyEntity, key):
-            query = query.filter(getattr(CompanyEntity, key) == value)
+    return _paginated_companies(page)
 
-    total = query.count()
-    results = query.offset(offset).limit(limit).all()
 
+def _paginated_companies(page) -> PaginatedCompanies:
     return PaginatedCompanies(
-        total=total,
-        data=[company_entity_to_domain(company) for company in results],
+        total=page.total,
+        data=[company_entity_to_domain(company) for company in page.rows],
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
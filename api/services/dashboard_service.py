@@ -0,0 +1,61 @@
+from sqlalchemy.orm import Session
+
+from api.config import DASHBOARD_CACHE_MAX_SIZE, DASHBOARD_CACHE_TTL_SECONDS
+from api.domain import DashboardSnapshot
+from api.models import User
+from api.services.company_service import paginate_companies
+from api.services.item_service import paginate_items
+from api.services.order_service import count_orders_by_status
+from api.services.user_service import get_user_stats, paginate_users
+from api.utils.cache_utils import CacheStats, TTLCache
+
+DASHBOARD_PAGE_SIZE = 5
+
+# Snapshots per (company_id, role); widgets only depend on tenant and role
+dashboard_cache: TTLCache = TTLCache(
+    ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS,
+    max_size=DASHBOARD_CACHE_MAX_SIZE,
+)
+
+
+def dashboard_cache_stats() -> CacheStats:
+    return dashboard_cache.stats()
+
+
+def get_dashboard(db: Session, current_user: User) -> DashboardSnapshot:
+    role = current_user.role.name
+    cache_key = (current_user.company_id, role)
+
+    cached = dashboard_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    is_superadmin = role == "superadmin"
+    snapshot = DashboardSnapshot(
+        user_stats=get_user_stats(db, current_user),
+        order_counts=count_orders_by_status(db, current_user),
+        online_users=paginate_users(
+            db=db,
+            current_user=current_user,
+            limit=DASHBOARD_PAGE_SIZE,
+            offset=0,
+            filters={"status": "online"},
+        ),
+        companies=paginate_companies(
+            db=db,
+            current_user=current_user,
+            limit=DASHBOARD_PAGE_SIZE,
+            offset=0,
+            filters={},
+        ) if is_superadmin else None,
+        low_stock_items=paginate_items(
+            db=db,
+            current_user=current_user,
+            limit=DASHBOARD_PAGE_SIZE,
+            offset=0,
+            filters={"low_stock": True},
+        ) if not is_superadmin else None,
+    )
+
+    dashboard_cache.set(cache_key, snapshot)
+    return snapshot
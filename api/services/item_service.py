@@ -1,6 +1,18 @@
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
-from api.domain import Item as DomainItem, MessageResult, NotFoundError, PaginatedItems
+from api.domain import (
+    Item as DomainItem,
+    ItemImportError,
+    ItemImportReport,
+    MessageResult,
+    NotFoundError,
+    PaginatedItems,
+    SkuGenerator,
+    ValidationError,
+)
 from api.domain.access import RolePolicy
 from api.domain.mappers.item_mapper import (
     item_domain_to_edit_response,
@@ -15,8 +27,18 @@ from api.db import (
     edit_item as db_edit_item,
     paginate_items as db_paginate_items,
     change_item_is_active as db_change_item_is_active,
+    paginate_items_async as db_paginate_items_async,
+    upsert_items as db_upsert_items,
+    insert_new_items as db_insert_new_items,
+    stream_items as db_stream_items,
 )
 from api.services.company_service import assert_company_access
+from api.utils.import_utils import Record, RecordError
+
+IMPORT_COLUMNS = ("name", "price", "quantity")  # Required; "sku" is optional
+IMPORT_BATCH_SIZE = 1000  # Validated rows written per upsert
+IMPORT_MAX_REPORTED_ERRORS = 1000  # Further failures are counted, not listed
+IMPORT_SKU_ATTEMPTS = 3  # Generated SKUs tried per row before it is reported
 
 
 def create_item(
@@ -40,6 +62,194 @@ def create_item(
     return MessageResult(message="Item was successfully added.")
 
 
+def import_items(
+    db: Session,
+    current_user: User,
+    records: Iterable[Tuple[int, Record]],
+) -> ItemImportReport:
+    """
+    Create or update catalog items from a stream of parsed import records.
+
+    Rows are validated like create_item and written in batches of
+    IMPORT_BATCH_SIZE. Rows with a SKU are upserted on (company_id, sku).
+    Rows without a SKU always create a new item: their generated SKU is
+    inserted with ON CONFLICT DO NOTHING and regenerated if it is taken, so
+    it can never overwrite an existing item. Invalid rows (including values
+    outside the column ranges) are reported by line and skipped; the rest of
+    the file is still imported. Each batch runs in a SAVEPOINT; a batch the
+    database rejects is retried row by row, so only the offending row fails.
+    """
+    RolePolicy.require(current_user.role.name, ["admin", "manager"])
+    if current_user.company_id is None:
+        raise ValidationError("Items can only be imported into a company")
+
+    processed = imported = failed = 0
+    errors: List[ItemImportError] = []
+    batch: Dict[str, Tuple[int, dict]] = {}  # Explicit SKUs: last row per SKU wins within a batch
+    new_rows: Dict[str, Tuple[int, dict]] = {}  # Generated SKUs
+
+    def report(line: int, error: str, sku: Optional[str]) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(ItemImportError(line=line, error=error, sku=sku))
+
+    def flush() -> None:
+        nonlocal imported
+        # Upserts first, so a generated SKU never lands on a SKU of this batch
+        for pending, write in (
+            (batch, _upsert_explicit),
+            (new_rows, _insert_generated),
+        ):
+            if pending:
+                written, rejected = _write_in_savepoint(db, list(pending.values()), write)
+                imported += written
+                for line, error, sku in rejected:
+                    report(line, error, sku)
+                pending.clear()
+
+    for line, record in records:
+        processed += 1
+        try:
+            item = _import_row(record, current_user.company_id)
+        except ValidationError as exc:
+            sku = record.get("sku") if isinstance(record, dict) else None
+            report(line, str(exc), _text(sku))
+            continue
+
+        row = {
+            "name": item.name.value,
+            "sku": item.sku,
+            "price": item.price.value,
+            "quantity": item.quantity.value,
+            "company_id": item.company_id,
+        }
+        if _text(record.get("sku")) is None:
+            while row["sku"] in new_rows or row["sku"] in batch:
+                row["sku"] = SkuGenerator.generate(row["name"])
+            new_rows[row["sku"]] = (line, row)
+        else:
+            batch[item.sku] = (line, row)
+        if len(batch) + len(new_rows) >= IMPORT_BATCH_SIZE:
+            flush()
+
+    flush()
+
+    return ItemImportReport(
+        processed=processed,
+        imported=imported,
+        failed=failed,
+        errors=errors,
+        errors_truncated=failed > len(errors),
+    )
+
+
+# (line, error, sku) of an import row the database did not accept
+RejectedRow = Tuple[int, str, Optional[str]]
+BatchWriter = Callable[[Session, List[Tuple[int, dict]]], Tuple[int, List[RejectedRow]]]
+
+
+def _write_in_savepoint(
+    db: Session,
+    pending: List[Tuple[int, dict]],
+    write: BatchWriter,
+) -> Tuple[int, List[RejectedRow]]:
+    # One SAVEPOINT per batch. When the database rejects the batch (a row
+    # that slipped past validation), retry row by row so only that row fails
+    # and the rows written by earlier batches are kept.
+    try:
+        with db.begin_nested():
+            return write(db, pending)
+    except DBAPIError:
+        pass
+
+    written = 0
+    rejected: List[RejectedRow] = []
+    for line, row in pending:
+        try:
+            with db.begin_nested():
+                count, failures = write(db, [(line, row)])
+        except DBAPIError:
+            rejected.append((line, "Row was rejected by the database", row["sku"]))
+            continue
+        written += count
+        rejected.extend(failures)
+    return written, rejected
+
+
+def _upsert_explicit(db: Session, pending: List[Tuple[int, dict]]) -> Tuple[int, List[RejectedRow]]:
+    return db_upsert_items(db, [row for _, row in pending]), []
+
+
+def _insert_generated(db: Session, pending: List[Tuple[int, dict]]) -> Tuple[int, List[RejectedRow]]:
+    # Insert rows with generated SKUs; rows whose SKU is taken get a new one.
+    # Returns the number inserted and the rows that never found a free SKU.
+    inserted = 0
+    for attempt in range(IMPORT_SKU_ATTEMPTS):
+        if attempt:
+            skus = set()
+            for _, row in pending:
+                row["sku"] = SkuGenerator.generate(row["name"])
+                while row["sku"] in skus:
+                    row["sku"] = SkuGenerator.generate(row["name"])
+                skus.add(row["sku"])
+        lines = {id(row): line for line, row in pending}
+        rows = [row for _, row in pending]
+        taken = db_insert_new_items(db, rows)
+        inserted += len(rows) - len(taken)
+        pending = [(lines[id(row)], row) for row in taken]
+        if not pending:
+            break
+    return inserted, [(line, "Could not generate a unique SKU", None) for line, _ in pending]
+
+
+def _import_row(record: Record, company_id: int) -> DomainItem:
+    if isinstance(record, RecordError):
+        raise ValidationError(record.message)
+
+    missing = [name for name in IMPORT_COLUMNS if _text(record.get(name)) is None]
+    if missing:
+        raise ValidationError(f"Missing {', '.join(missing)}")
+
+    return DomainItem.draft(
+        name=_text(record["name"]),
+        price=_text(record["price"]),
+        quantity=_text(record["quantity"]),
+        company_id=company_id,
+        sku=_text(record.get("sku")),
+    )
+
+
+def _text(value) -> Optional[str]:
+    # CSV cells are strings, NDJSON values may be numbers; blank means missing
+    if value is None or isinstance(value, (dict, list, bool)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def export_items(
+    open_db: Callable[[], ContextManager[Session]],
+    current_user: User,
+) -> Iterator[tuple]:
+    """
+    Rows of the user's catalog for export (columns: ITEM_EXPORT_COLUMNS).
+
+    Access is checked immediately; the session is opened on the first row
+    and closed after the last, so the caller may stream the rows after the
+    request handler has returned.
+    """
+    RolePolicy.require(current_user.role.name, ["admin", "manager"])
+    if current_user.company_id is None:
+        raise ValidationError("Items can only be exported from a company")
+
+    def rows():
+        with open_db() as db:
+            yield from db_stream_items(db, current_user.company_id)
+
+    return rows()
+
+
 def edit_item(
     db: Session,
     current_user: User,
@@ -127,16 +337,52 @@ def paginate_items(
     limit: int,
     offset: int,
     filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+    q: Optional[str] = None,
+) -> PaginatedItems:
+    page = db_paginate_items(
+        db=db,
+        filters=filters,
+        company_id=current_user.company_id,
+        limit=limit,
+        offset=offset,
+        after=after,
+        sort=sort,
+        q=q,
+    )
+
+    return _paginated_items(page)
+
+
+async def paginate_items_async(
+    db,
+    current_user: User,
+    limit: int,
+    offset: int,
+    filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+    q: Optional[str] = None,
 ) -> PaginatedItems:
-    total, results = db_paginate_items(
+    page = await db_paginate_items_async(
         db=db,
         filters=filters,
         company_id=current_user.company_id,
         limit=limit,
         offset=offset,
+        after=after,
+        sort=sort,
+        q=q,
     )
 
+    return _paginated_items(page)
+
+
+def _paginated_items(page) -> PaginatedItems:
     return PaginatedItems(
-        total=total,
-        data=[item_entity_to_domain(item) for item in results],
+        total=page.total,
+        data=[item_entity_to_domain(item) for item in page.rows],
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
@@ -0,0 +1,27 @@
+from api.db.db_engine import replica_router
+from api.domain.access import RolePolicy
+from api.models.user import User
+from api.services.dashboard_service import dashboard_cache_stats
+from api.utils.auth_utils import password_hash_stats, principal_cache_stats
+
+
+def get_worker_metrics(current_user: User, transactions: dict) -> dict:
+    """
+    Counters of the worker process serving the request (superadmin only).
+
+    Every worker keeps its own counters, so repeated calls may be answered
+    by different workers; scrape each worker or aggregate the samples.
+
+    Args:
+        current_user: Authenticated user
+        transactions: Request transaction counters (see transaction_stats)
+    """
+    RolePolicy.require(current_user.role.name, ["superadmin"])
+
+    return {
+        "transactions": transactions,
+        "replicas": replica_router.stats(),
+        "password_hashing": password_hash_stats(),
+        "principal_cache": principal_cache_stats().as_dict(),
+        "dashboard_cache": dashboard_cache_stats().as_dict(),
+    }
@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
-from typing import List
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from sqlalchemy.orm import Session
 
-from api.domain import MessageResult, NotFoundError, ValidationError
+from api.domain import DomainError, InsufficientStockError, MessageResult, NotFoundError, ValidationError
 from api.domain.access import RolePolicy
 from api.domain.mappers.item_mapper import item_entity_to_domain
 from api.domain.mappers.order_mapper import (
@@ -14,42 +14,67 @@ from api.domain.mappers.order_mapper import (
 )
 from api.domain.order import (
     Order as DomainOrder,
+    OrderBulkOutcome,
+    OrderBulkResult,
     OrderLineItem,
     OrderStatusCounts,
     OrderType,
     PaginatedOrderItems,
     PaginatedOrders,
+    StockAdjustment,
 )
-from api.models import Order, OrderItem, User
+from api.models import Order, User
 from api.db.order_db import (
     paginate_order as db_paginate_orders,
     insert_order as db_insert_order,
-    get_order_by_id as db_get_order_by_id,
+    get_order_with_lines as db_get_order_with_lines,
+    get_orders_with_lines as db_get_orders_with_lines,
     change_order_status as db_change_order_status,
-    count_orders_grouped_by_status as db_count_orders_grouped_by_status,
+    change_orders_status as db_change_orders_status,
+    stream_orders as db_stream_orders,
+)
+from api.db.order_stats_db import (
+    record_order_status as db_record_order_status,
+    record_order_status_changes as db_record_order_status_changes,
+    sum_order_status_counts as db_sum_order_status_counts,
 )
 from api.db.order_items_db import (
     paginate_order_items as db_paginate_order_items,
-    insert_order_item as db_insert_order_item,
-    get_order_items as db_get_order_items,
+    insert_order_items as db_insert_order_items,
 )
 from api.db.item_db import (
-    get_item_data_by_id as db_get_item_data_by_id,
-    apply_stock_change as db_apply_stock_change,
+    get_items_by_ids as db_get_items_by_ids,
+    apply_stock_adjustments as db_apply_stock_adjustments,
+)
+from api.db.async_db import (
+    paginate_order_async as db_paginate_orders_async,
+    sum_order_status_counts_async as db_sum_order_status_counts_async,
 )
 from api.services.company_service import assert_company_access
-from api.utils import start_of_day, end_of_day
 
 
 def _is_superadmin(user: User) -> bool:
     return user.role.name == "superadmin"
 
 
-def _apply_adjustments(db: Session, adjustments) -> None:
-    for adjustment in adjustments:
-        item = db_get_item_data_by_id(db, adjustment.item_id)
-        if item:
-            db_apply_stock_change(db, item, adjustment.delta)
+def _apply_adjustments(
+    db: Session,
+    order: DomainOrder,
+    adjustments: List[StockAdjustment],
+) -> None:
+    if not adjustments:
+        return
+
+    applied = db_apply_stock_adjustments(db, adjustments)
+    failed_ids = {a.item_id for a in adjustments if a.item_id not in applied}
+    if failed_ids:
+        # Request transaction rolls back, so no partial adjustment is committed
+        raise InsufficientStockError(_stock_error(order, failed_ids), item_ids=sorted(failed_ids))
+
+
+def _stock_error(order: DomainOrder, failed_ids) -> str:
+    names = dict.fromkeys(line.name for line in order.lines if line.item_id in failed_ids)
+    return "Insufficient stock for " + ", ".join(f"'{name}'" for name in names)
 
 
 def create_order(
@@ -69,17 +94,28 @@ def create_order(
         company_id=current_user.company_id,
     )
 
+    # Load all referenced items at once; sales lock them until commit
+    entities = db_get_items_by_ids(
+        db,
+        [order_item["item_id"] for order_item in items],
+        for_update=order.order_type == OrderType.SALE,
+    )
+    checked_company_ids = set()
+
     for order_item in items:
-        entity = db_get_item_data_by_id(db, order_item["item_id"])
+        entity = entities.get(order_item["item_id"])
         if not entity:
             raise NotFoundError("Item not found")
 
-        assert_company_access(
-            db=db,
-            is_superadmin=_is_superadmin(current_user),
-            current_user_company_id=current_user.company_id,
-            company_id=entity.company_id,
-        )
+        # Tenant scope is checked once per distinct company
+        if entity.company_id not in checked_company_ids:
+            assert_company_access(
+                db=db,
+                is_superadmin=_is_superadmin(current_user),
+                current_user_company_id=current_user.company_id,
+                company_id=entity.company_id,
+            )
+            checked_company_ids.add(entity.company_id)
 
         domain_item = item_entity_to_domain(entity)
         domain_item.can_fulfill(order_item["quantity"], order.order_type.value)
@@ -103,19 +139,22 @@ def create_order(
         company_id=order.company_id,
     )
     db_insert_order(db, order_entity)
+    db_record_order_status(db, order_entity)
+
+    db_insert_order_items(
+        db,
+        [
+            {
+                "order_id": order_entity.id,
+                "item_id": line.item_id,
+                "quantity": line.quantity,
+                "unit_price": line.unit_price,
+            }
+            for line in order.lines
+        ],
+    )
 
-    for line in order.lines:
-        db_insert_order_item(
-            db,
-            OrderItem(
-                order_id=order_entity.id,
-                item_id=line.item_id,
-                quantity=line.quantity,
-                unit_price=line.unit_price,
-            ),
-        )
-
-    _apply_adjustments(db, order.create_stock_adjustments())
+    _apply_adjustments(db, order, order.create_stock_adjustments())
 
     return MessageResult(message="Order was successfully created.")
 
@@ -123,7 +162,7 @@ def create_order(
 def cancel_order(db: Session, order_id: int, current_user: User) -> MessageResult:
     RolePolicy.require(current_user.role.name, ["admin", "manager", "employee"])
 
-    order_entity = db_get_order_by_id(db, order_id)
+    order_entity = db_get_order_with_lines(db, order_id)
     if not order_entity:
         raise NotFoundError("Order not found")
 
@@ -134,12 +173,13 @@ def cancel_order(db: Session, order_id: int, current_user: User) -> MessageResul
         company_id=order_entity.company_id,
     )
 
-    order_items = db_get_order_items(db, order_entity.id)
-    order = order_entity_to_domain(order_entity, order_items)
+    order = order_entity_to_domain(order_entity, order_entity.items)
     adjustments = order.cancel()
 
-    _apply_adjustments(db, adjustments)
+    _apply_adjustments(db, order, adjustments)
+    previous_status = order_entity.status
     db_change_order_status(order_entity, order.status.value)
+    db_record_order_status(db, order_entity, previous_status)
 
     return MessageResult(message="Order was successfully cancelled.")
 
@@ -147,7 +187,7 @@ def cancel_order(db: Session, order_id: int, current_user: User) -> MessageResul
 def complete_order(db: Session, order_id: int, current_user: User) -> MessageResult:
     RolePolicy.require(current_user.role.name, ["admin", "manager", "employee"])
 
-    order_entity = db_get_order_by_id(db, order_id)
+    order_entity = db_get_order_with_lines(db, order_id)
     if not order_entity:
         raise NotFoundError("Order not found")
 
@@ -158,36 +198,220 @@ def complete_order(db: Session, order_id: int, current_user: User) -> MessageRes
         company_id=order_entity.company_id,
     )
 
-    order_items = db_get_order_items(db, order_entity.id)
-    order = order_entity_to_domain(order_entity, order_items)
+    order = order_entity_to_domain(order_entity, order_entity.items)
     adjustments = order.complete()
 
-    _apply_adjustments(db, adjustments)
+    _apply_adjustments(db, order, adjustments)
+    previous_status = order_entity.status
     db_change_order_status(order_entity, order.status.value)
+    db_record_order_status(db, order_entity, previous_status)
 
     return MessageResult(message="Order was successfully completed.")
 
 
+def complete_orders(db: Session, current_user: User, order_ids: Sequence[int]) -> OrderBulkResult:
+    """
+    Complete many orders in one transaction (see _transition_orders).
+    """
+    return _transition_orders(db, current_user, order_ids, DomainOrder.complete)
+
+
+def cancel_orders(db: Session, current_user: User, order_ids: Sequence[int]) -> OrderBulkResult:
+    """
+    Cancel many orders in one transaction (see _transition_orders).
+    """
+    return _transition_orders(db, current_user, order_ids, DomainOrder.cancel)
+
+
+def _transition_orders(
+    db: Session,
+    current_user: User,
+    order_ids: Sequence[int],
+    transition: Callable[[DomainOrder], List[StockAdjustment]],
+) -> OrderBulkResult:
+    """
+    Apply a status transition to many orders with set-based queries.
+
+    Orders and lines are loaded together, rules are applied by the domain
+    model, then stock, statuses and statistics are written with one
+    statement each. Orders that fail (not found, other company, invalid
+    transition, insufficient stock) are reported and left unchanged; the
+    others are still transitioned.
+    """
+    RolePolicy.require(current_user.role.name, ["admin", "manager", "employee"])
+
+    order_ids = list(dict.fromkeys(order_ids))
+    entities = db_get_orders_with_lines(db, order_ids)
+    company_errors: Dict[int, Optional[str]] = {}  # Tenant scope is checked once per company
+    errors: Dict[int, str] = {}
+    changed: Dict[int, Tuple[DomainOrder, List[StockAdjustment]]] = {}
+
+    for order_id in order_ids:
+        entity = entities.get(order_id)
+        if entity is None:
+            errors[order_id] = "Order not found"
+            continue
+
+        if entity.company_id not in company_errors:
+            company_errors[entity.company_id] = _company_access_error(db, current_user, entity.company_id)
+        if company_errors[entity.company_id]:
+            errors[order_id] = company_errors[entity.company_id]
+            continue
+
+        order = order_entity_to_domain(entity, entity.items)
+        try:
+            changed[order_id] = (order, transition(order))
+        except DomainError as exc:
+            errors[order_id] = str(exc)
+
+    errors.update(_apply_bulk_adjustments(db, changed))
+
+    previous_statuses = {order_id: entities[order_id].status for order_id in changed}
+    ids_by_status: Dict[str, List[int]] = {}
+    for order_id, (order, _) in changed.items():
+        ids_by_status.setdefault(order.status.value, []).append(order_id)
+    for status, ids in ids_by_status.items():
+        db_change_orders_status(db, ids, status)
+    db_record_order_status_changes(
+        db, [(entities[order_id], previous_statuses[order_id]) for order_id in changed]
+    )
+
+    return OrderBulkResult(
+        outcomes=[
+            OrderBulkOutcome(order_id, status=changed[order_id][0].status)
+            if order_id in changed
+            else OrderBulkOutcome(order_id, error=errors[order_id])
+            for order_id in order_ids
+        ]
+    )
+
+
+def _company_access_error(db: Session, current_user: User, company_id: int) -> Optional[str]:
+    try:
+        assert_company_access(
+            db=db,
+            is_superadmin=_is_superadmin(current_user),
+            current_user_company_id=current_user.company_id,
+            company_id=company_id,
+        )
+    except DomainError as exc:
+        return str(exc)
+    return None
+
+
+def _apply_bulk_adjustments(
+    db: Session,
+    changed: Dict[int, Tuple[DomainOrder, List[StockAdjustment]]],
+) -> Dict[int, str]:
+    # Stock of all orders is adjusted in one conditional UPDATE. When items
+    # cannot be adjusted, the applied part is reverted (the rows are locked
+    # by the UPDATE, so reverting cannot fail), orders touching those items
+    # are dropped from changed, and the rest is retried.
+    errors: Dict[int, str] = {}
+    while True:
+        adjustments = [
+            adjustment
+            for _, order_adjustments in changed.values()
+            for adjustment in order_adjustments
+        ]
+        if not adjustments:
+            return errors
+
+        applied = db_apply_stock_adjustments(db, adjustments)
+        failed_ids = {adjustment.item_id for adjustment in adjustments} - applied.keys()
+        if not failed_ids:
+            return errors
+
+        db_apply_stock_adjustments(
+            db,
+            [
+                StockAdjustment(adjustment.item_id, -adjustment.delta)
+                for adjustment in adjustments
+                if adjustment.item_id in applied
+            ],
+        )
+        for order_id, (order, order_adjustments) in list(changed.items()):
+            order_failed_ids = {a.item_id for a in order_adjustments} & failed_ids
+            if order_failed_ids:
+                errors[order_id] = _stock_error(order, order_failed_ids)
+                del changed[order_id]
+
+
 def paginate_orders(
     db: Session,
     current_user: User,
     limit: int,
     offset: int,
     filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+) -> PaginatedOrders:
+    RolePolicy.require(current_user.role.name, ["admin", "manager"])
+
+    page = db_paginate_orders(
+        db=db,
+        filters=filters,
+        company_id=current_user.company_id,
+        limit=limit,
+        offset=offset,
+        after=after,
+        sort=sort,
+    )
+
+    return _paginated_orders(page)
+
+
+async def paginate_orders_async(
+    db,
+    current_user: User,
+    limit: int,
+    offset: int,
+    filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ) -> PaginatedOrders:
     RolePolicy.require(current_user.role.name, ["admin", "manager"])
 
-    total, results = db_paginate_orders(
+    page = await db_paginate_orders_async(
         db=db,
         filters=filters,
         company_id=current_user.company_id,
         limit=limit,
         offset=offset,
+        after=after,
+        sort=sort,
     )
 
+    return _paginated_orders(page)
+
+
+def export_orders(
+    open_db: Callable[[], ContextManager[Session]],
+    current_user: User,
+) -> Iterator[tuple]:
+    """
+    Rows of the company's orders for export (columns: ORDER_EXPORT_COLUMNS).
+
+    Access is checked immediately; rows are read lazily in a session that
+    stays open until the last row has been consumed.
+    """
+    RolePolicy.require(current_user.role.name, ["admin", "manager"])
+    if current_user.company_id is None:
+        raise ValidationError("Orders can only be exported from a company")
+
+    def rows():
+        with open_db() as db:
+            yield from db_stream_orders(db, current_user.company_id)
+
+    return rows()
+
+
+def _paginated_orders(page) -> PaginatedOrders:
     return PaginatedOrders(
-        total=total,
-        data=[order_entity_to_domain(order) for order in results],
+        total=page.total,
+        data=[order_entity_to_domain(order) for order in page.rows],
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -197,19 +421,23 @@ def paginate_order_items(
     order_id: int,
     limit: int,
     offset: int,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ) -> PaginatedOrderItems:
     RolePolicy.require(current_user.role.name, ["admin", "manager"])
 
-    total, results = db_paginate_order_items(
+    page = db_paginate_order_items(
         db=db,
         order_id=order_id,
         company_id=current_user.company_id,
         limit=limit,
         offset=offset,
+        after=after,
+        sort=sort,
     )
 
     lines = []
-    for item, ordered_quantity, unit_price in results:
+    for item, ordered_quantity, unit_price, _order_item_id in page.rows:
         lines.append(
             OrderLineItem(
                 item_id=item.id,
@@ -219,27 +447,41 @@ def paginate_order_items(
             )
         )
 
-    return PaginatedOrderItems(total=total, data=lines)
+    return PaginatedOrderItems(
+        total=page.total,
+        data=lines,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
+    )
 
 
 def count_orders_by_status(db: Session, current_user: User) -> OrderStatusCounts:
-    now = datetime.utcnow()
-    filters = {
-        "order_type": "sale",
-        "from_ts": start_of_day(now - timedelta(days=7)),
-        "to_ts": end_of_day(now),
-    }
-
-    rows = db_count_orders_grouped_by_status(
-        db=db,
+    rows = db_sum_order_status_counts(db=db, **_weekly_sale_counts_scope(current_user))
+    return _order_status_counts(rows)
+
+
+async def count_orders_by_status_async(db, current_user: User) -> OrderStatusCounts:
+    rows = await db_sum_order_status_counts_async(db=db, **_weekly_sale_counts_scope(current_user))
+    return _order_status_counts(rows)
+
+
+def _weekly_sale_counts_scope(current_user: User) -> dict:
+    today = datetime.utcnow().date()
+
+    # Sale orders created in the last 7 days plus today (8 day buckets)
+    return dict(
         company_id=current_user.company_id,
         is_superadmin=_is_superadmin(current_user),
-        filters=filters,
+        from_day=today - timedelta(days=7),
+        to_day=today,
+        order_type="sale",
     )
 
+
+def _order_status_counts(rows) -> OrderStatusCounts:
     counts = {"pending": 0, "completed": 0, "cancelled": 0}
     for status, count in rows:
-        counts[status] = count
+        counts[status] = int(count or 0)
 
     return OrderStatusCounts(
         pending=counts["pending"],
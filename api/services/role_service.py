@@ -1,22 +1,53 @@
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from sqlalchemy.orm import Session
 
-from api.db.role_db import get_all_roles, get_role_by_name
-from api.domain.access import RolePolicy
+from api.db.role_db import get_all_roles
+from api.domain.access import RoleCatalog, RoleEntry, RolePolicy
 from api.domain.exceptions import ForbiddenError, NotFoundError
-from api.models.role import Role
 from api.models.user import User
 
+# Roles are a handful of static rows: load them once per process
+_role_catalog: Optional[RoleCatalog] = None
+
+
+def get_role_catalog(db: Session) -> RoleCatalog:
+    """Process-wide role catalog, loaded from the roles table on first use."""
+    catalog = _role_catalog
+    if catalog is None:
+        catalog = reload_role_catalog(db)
+    return catalog
+
+
+def cached_role_catalog() -> Optional[RoleCatalog]:
+    """Role catalog if already loaded (no database access)."""
+    return _role_catalog
+
+
+def reload_role_catalog(db: Session) -> RoleCatalog:
+    """Reload the role catalog (call after changing the roles table)."""
+    global _role_catalog
+
+    catalog = RoleCatalog.from_rows(get_all_roles(db))
+    # An empty table is not cached: roles may not be seeded yet
+    _role_catalog = catalog if len(catalog) else None
+    return catalog
+
+
+def clear_role_catalog() -> None:
+    """Drop the loaded catalog; the next lookup reloads it."""
+    global _role_catalog
+    _role_catalog = None
+
 
 def resolve_assignable_role(
     db: Session,
     *,
     role_name: str,
     current_user: User,
-) -> Role:
+) -> RoleEntry:
     role_name = role_name.lower()
-    role = get_role_by_name(db, role_name)
+    role = get_role_catalog(db).get(role_name)
     if not role:
         raise NotFoundError("Role not found")
 
@@ -32,17 +63,27 @@ def get_subroles_for_role(
     db: Session,
     role_name: str,
     excluded_roles: Optional[List[str]] = None,
-) -> List[Role]:
+) -> List[RoleEntry]:
+    return subroles_in_catalog(get_role_catalog(db), role_name, excluded_roles)
+
+
+def subroles_in_catalog(
+    catalog: RoleCatalog,
+    role_name: str,
+    excluded_roles: Optional[List[str]] = None,
+) -> List[RoleEntry]:
     role_name = role_name.lower()
     excluded = {r.lower() for r in excluded_roles or []}
 
-    current_role = get_role_by_name(db, role_name)
-    if not current_role:
+    if not catalog.get(role_name):
         raise ForbiddenError("Invalid role")
 
-    all_roles = get_all_roles(db)
-    return [
-        role
-        for role in all_roles
-        if role.rank >= current_role.rank and role.name.lower() not in excluded
-    ]
+    return [role for role in catalog.subroles(role_name) if role.name.lower() not in excluded]
+
+
+def subrole_names_in_catalog(catalog: RoleCatalog, role_name: str) -> FrozenSet[str]:
+    """Precomputed subrole names of a role, the role itself included."""
+    role_name = role_name.lower()
+    if not catalog.get(role_name):
+        raise ForbiddenError("Invalid role")
+    return catalog.subrole_names(role_name)
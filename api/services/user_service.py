@@ -1,7 +1,6 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
 from sqlalchemy.orm import Session
-from werkzeug.security import generate_password_hash
 
 from api.db.user_db import (
     change_user_is_active as db_change_user_is_active,
@@ -13,8 +12,14 @@ from api.db.user_db import (
     paginate_users as db_paginate_users,
     user_exists_by_username_or_email as db_user_exists_by_username_or_email,
 )
+from api.db.async_db import (
+    count_users_async as db_count_users_async,
+    get_oauth_providers_async as db_get_oauth_providers_async,
+    get_user_data_by_id_async as db_get_user_data_by_id_async,
+    paginate_users_async as db_paginate_users_async,
+)
 from api.domain import ConflictError, MessageResult, NotFoundError
-from api.domain.access import RolePolicy
+from api.domain.access import RoleCatalog, RolePolicy
 from api.domain.mappers.user_mapper import (
     create_user_result_to_response,
     current_user_profile_to_dict,
@@ -32,8 +37,13 @@ from api.domain.user import (
 )
 from api.models.user import User
 from api.services.company_service import assert_company_access
-from api.services.role_service import get_subroles_for_role, resolve_assignable_role
-from api.utils import generate_password
+from api.services.role_service import (
+    cached_role_catalog,
+    get_role_catalog,
+    resolve_assignable_role,
+    subrole_names_in_catalog,
+)
+from api.utils import generate_password, hash_password
 
 
 def _is_superadmin(user: User) -> bool:
@@ -82,7 +92,7 @@ def create_user_account(
         email=draft.email.value,
         company_id=company.id,
         role_id=role_entity.id,
-        password_hash=generate_password_hash(initial_password),
+        password_hash=hash_password(initial_password),
         status="offline",
     )
     insert_user(db, user)
@@ -209,6 +219,19 @@ def get_current_user_info(db: Session, current_user: User):
         raise NotFoundError("User not found")
 
     providers = db_get_oauth_providers(db, current_user.id)
+    return _current_user_profile(user, providers)
+
+
+async def get_current_user_info_async(db, current_user: User):
+    user = await db_get_user_data_by_id_async(db, current_user.id)
+    if user is None:
+        raise NotFoundError("User not found")
+
+    providers = await db_get_oauth_providers_async(db, current_user.id)
+    return _current_user_profile(user, providers)
+
+
+def _current_user_profile(user: User, providers) -> dict:
     profile = CurrentUserProfile(
         id=user.id,
         username=user.username,
@@ -251,43 +274,110 @@ def paginate_users(
     limit: int,
     offset: int,
     filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
 ) -> PaginatedUsers:
-    if "status" in filters:
-        allowed_roles = None
-    else:
-        roles = get_subroles_for_role(
-            db,
-            current_user.role.name,
-            excluded_roles=[current_user.role.name],
-        )
-        allowed_roles = {role.name for role in roles}
-
-    total, results = db_paginate_users(
+    filters, exclude_user_id = _split_user_filters(current_user, filters)
+    page = db_paginate_users(
         db,
         filters,
-        allowed_roles,
+        _visible_roles(get_role_catalog(db), current_user, filters),
         current_user.company_id,
         limit,
         offset,
+        after=after,
+        sort=sort,
+        exclude_user_id=exclude_user_id,
     )
 
+    return _paginated_users(page)
+
+
+async def paginate_users_async(
+    db,
+    current_user: User,
+    limit: int,
+    offset: int,
+    filters: dict,
+    after: Optional[str] = None,
+    sort: Sequence[Tuple[str, str]] = (),
+) -> PaginatedUsers:
+    filters, exclude_user_id = _split_user_filters(current_user, filters)
+    page = await db_paginate_users_async(
+        db,
+        filters,
+        _visible_roles(
+            cached_role_catalog() or await db.run_sync(get_role_catalog),
+            current_user,
+            filters,
+        ),
+        current_user.company_id,
+        limit,
+        offset,
+        after=after,
+        sort=sort,
+        exclude_user_id=exclude_user_id,
+    )
+
+    return _paginated_users(page)
+
+
+def _split_user_filters(current_user: User, filters: dict) -> Tuple[dict, Optional[int]]:
+    # include_self is a listing option, not a column filter
+    filters = dict(filters)
+    include_self = filters.pop("include_self", True)
+    return filters, (None if include_self else current_user.id)
+
+
+def _visible_roles(catalog: RoleCatalog, current_user: User, filters: dict) -> Optional[Set[str]]:
+    # Online user lists are shown across roles; otherwise only assignable subroles
+    if "status" in filters:
+        return None
+
+    role_name = current_user.role.name
+    return set(subrole_names_in_catalog(catalog, role_name) - {role_name.lower()})
+
+
+def _paginated_users(page) -> PaginatedUsers:
     data = []
-    for user in results:
+    for user in page.rows:
         row = {c.name: getattr(user, c.name) for c in user.__table__.columns}
         row.pop("password_hash", None)
         row["role_name"] = user.role.name if user.role else None
         row["company_name"] = user.company.name if user.company else None
         data.append(row)
 
-    return PaginatedUsers(total=total, data=data)
+    return PaginatedUsers(
+        total=page.total,
+        data=data,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
+    )
 
 
-def get_user_count(db: Session, current_user: User):
+def get_user_stats(db: Session, current_user: User) -> UserStats:
     is_superadmin = _is_superadmin(current_user)
     company_id = None if is_superadmin else current_user.company_id
 
-    stats = UserStats(
+    return UserStats(
         total_users=db_count_users(db, company_id=company_id),
         online_users=db_count_users(db, company_id=company_id, online_only=True),
     )
-    return user_stats_to_response(stats)
+
+
+async def get_user_stats_async(db, current_user: User) -> UserStats:
+    is_superadmin = _is_superadmin(current_user)
+    company_id = None if is_superadmin else current_user.company_id
+
+    return UserStats(
+        total_users=await db_count_users_async(db, company_id=company_id),
+        online_users=await db_count_users_async(db, company_id=company_id, online_only=True),
+    )
+
+
+def get_user_count(db: Session, current_user: User):
+    return user_stats_to_response(get_user_stats(db, current_user))
+
+
+async def get_user_count_async(db, current_user: User):
+    return user_stats_to_response(await get_user_stats_async(db, current_user))
@@ -6,6 +6,7 @@ and data validation helpers used throughout the application.
 
 Module Categories:
     - auth_utils: JWT tokens, password handling, OAuth state management
+    - password_utils: Bounded process pool for password hashing (behind auth_utils)
     - exception_utils: Custom exception classes for business logic
     - data_validation_utils: Input validation and sanitization functions
 """
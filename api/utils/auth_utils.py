@@ -1,22 +1,36 @@
 # Import security and utility libraries
+import hashlib
 import secrets
 import string
-from typing import Dict, Optional
+from typing import Optional
 from urllib.parse import urlencode
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError as JWTInvalidTokenError
 from datetime import datetime, timedelta, timezone
-from werkzeug.security import check_password_hash
 
 # Import configuration and schemas
-from api.config import JWT_SECRET
-from api.schemas.auth_schema import OAuthStateData
+from api.config import (
+    JWT_SECRET,
+    OAUTH_FLOW_STORE,
+    OAUTH_FLOW_STORE_MAX_SIZE,
+    OAUTH_FLOW_STORE_URL,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_METHOD,
+    PASSWORD_HASH_QUEUE_TIMEOUT,
+    PASSWORD_HASH_WORKERS,
+    PRINCIPAL_CACHE_MAX_SIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+)
+from api.utils.cache_utils import CacheStats, TTLCache
+from api.utils.flow_store import FlowStore, build_flow_store
 from api.utils.exception_utils import TokenExpiredError, InvalidTokenError
+from api.utils.password_utils import PasswordHasher
 
 # JWT configuration constants
 JWT_ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRES_IN = 3600  # Access token lifetime (seconds); renewed via refresh tokens
 
-def create_access_token(user_id: int, role: str, session_id, expires_in: int = 3600) -> str:
+def create_access_token(user_id: int, role: str, session_id, expires_in: int = ACCESS_TOKEN_EXPIRES_IN) -> str:
     """
     Generate JWT access token for authenticated user.
     
@@ -100,6 +114,32 @@ def decode_token_ignore_exp(token: str) -> dict:
     except JWTInvalidTokenError:
         return {}
 
+def generate_refresh_token() -> str:
+    """
+    Generate an opaque refresh token (256 bits of randomness).
+    
+    Returns:
+        str: URL-safe token, handed to the client once
+        
+    Security: Only hash_refresh_token(token) is stored server-side
+    """
+    return secrets.token_urlsafe(32)
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Digest of a refresh token for storage and lookup.
+    
+    Args:
+        token: Refresh token presented by the client
+        
+    Returns:
+        str: SHA-256 hex digest (64 characters)
+        
+    Performance: Random tokens need no salt or slow hash, so a refresh costs
+    one digest and one index probe instead of a password verification
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 def generate_password(length=10):
     """
     Generate secure random password for new users.
@@ -118,6 +158,31 @@ def generate_password(length=10):
     alphabet = string.ascii_letters + string.digits
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
+# Shared password hashing pool of this process (see api.utils.password_utils)
+password_hasher = PasswordHasher(
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=PASSWORD_HASH_QUEUE_TIMEOUT,
+    method=PASSWORD_HASH_METHOD,
+)
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password for storage.
+    
+    Args:
+        password: Plaintext password
+        
+    Returns:
+        str: werkzeug hash using PASSWORD_HASH_METHOD
+        
+    Raises:
+        PasswordHasherBusyError: Hashing pool saturated
+        
+    Performance: Runs in the hashing process pool, not on the request thread
+    """
+    return password_hasher.hash(password)
+
 def verify_password(password: str, password_hash: str) -> bool:
     """
     Verify plaintext password against stored hash.
@@ -132,13 +197,72 @@ def verify_password(password: str, password_hash: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
         
+    Raises:
+        PasswordHasherBusyError: Hashing pool saturated
+        
     Security: Uses werkzeug's timing-safe comparison
+    Performance: Runs in the hashing process pool, not on the request thread
     """
-    return check_password_hash(password_hash, password)
+    return password_hasher.verify(password, password_hash)
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """Whether a stored hash predates the configured PASSWORD_HASH_METHOD."""
+    return password_hasher.needs_rehash(password_hash)
+
+def password_hash_stats() -> dict:
+    """Return queue depth and counters of the password hashing pool."""
+    return password_hasher.stats()
+
+# Authenticated principal cache keyed by (str(user_id), session_id)
+principal_cache: TTLCache = TTLCache(
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=PRINCIPAL_CACHE_MAX_SIZE,
+)
+
+def invalidate_cached_principal(user_id: int) -> int:
+    """
+    Drop every cached principal snapshot of a user.
+    
+    Must be called whenever data captured in the snapshot changes
+    (session, active flag, role or company), so the next request
+    reloads the user from the database.
+    
+    Args:
+        user_id: User whose cached sessions should be removed
+        
+    Returns:
+        int: Number of removed cache entries
+    """
+    return principal_cache.invalidate_where(
+        lambda key: key[0] == str(user_id)
+    )
+
+def principal_cache_stats() -> CacheStats:
+    """Return hit/miss counters of the principal cache."""
+    return principal_cache.stats()
 
 # OAuth state management for CSRF protection
-_OAUTH_STATE_STORE: Dict[str, OAuthStateData] = {}
 _OAUTH_STATE_TTL = timedelta(minutes=10)
+_OAUTH_CODE_TTL = timedelta(minutes=2)
+
+# Shared by all OAuth flows of this process (created on first use)
+_oauth_flow_store: Optional[FlowStore] = None
+
+def oauth_flow_store() -> FlowStore:
+    """
+    Store holding OAuth state and exchange codes until consumed.
+    
+    Returns:
+        FlowStore: Backend selected by OAUTH_FLOW_STORE (memory or database)
+    """
+    global _oauth_flow_store
+    if _oauth_flow_store is None:
+        _oauth_flow_store = build_flow_store(
+            OAUTH_FLOW_STORE,
+            url=OAUTH_FLOW_STORE_URL,
+            max_size=OAUTH_FLOW_STORE_MAX_SIZE,
+        )
+    return _oauth_flow_store
 
 def create_oauth_state(user_id: Optional[int]) -> str:
     """
@@ -160,10 +284,11 @@ def create_oauth_state(user_id: Optional[int]) -> str:
     """
     state = secrets.token_urlsafe(32)
 
-    _OAUTH_STATE_STORE[state] = {
-        "user_id": user_id,
-        "expires_at": datetime.utcnow() + _OAUTH_STATE_TTL,
-    }
+    oauth_flow_store().put(
+        f"state:{state}",
+        {"user_id": user_id},
+        ttl_seconds=_OAUTH_STATE_TTL.total_seconds(),
+    )
 
     return state
 
@@ -182,36 +307,26 @@ def consume_oauth_state(state: str) -> Optional[int]:
         
     Security: Single-use state prevents replay attacks
     """
-    data = _OAUTH_STATE_STORE.pop(state, None)
+    data = oauth_flow_store().pop(f"state:{state}")
 
     if not data:
-        return None  # State not found
-
-    if data["expires_at"] < datetime.utcnow():
-        return None  # State expired
+        return None  # State not found or expired
 
     return data["user_id"]
 
-_OAUTH_CODE_STORE: Dict[str, dict] = {}
-_OAUTH_CODE_TTL = timedelta(minutes=2)
-
 
 def create_oauth_exchange_code(login_payload: dict) -> str:
     code = secrets.token_urlsafe(32)
-    _OAUTH_CODE_STORE[code] = {
-        "login_payload": login_payload,
-        "expires_at": datetime.utcnow() + _OAUTH_CODE_TTL,
-    }
+    oauth_flow_store().put(
+        f"code:{code}",
+        login_payload,
+        ttl_seconds=_OAUTH_CODE_TTL.total_seconds(),
+    )
     return code
 
 
 def consume_oauth_exchange_code(code: str) -> Optional[dict]:
-    data = _OAUTH_CODE_STORE.pop(code, None)
-    if not data:
-        return None
-    if data["expires_at"] < datetime.utcnow():
-        return None
-    return data["login_payload"]
+    return oauth_flow_store().pop(f"code:{code}")
 
 def oauth_error_redirect(message: str) -> str:
     """
@@ -0,0 +1,139 @@
+"""
+In-process caching helpers.
+
+Provides a small, thread-safe TTL cache used for hot-path lookups that would
+otherwise hit the database on every request (e.g. the authenticated principal).
+Each cache keeps hit/miss counters so the effect on the hot path is observable.
+"""
+
+# Import standard library modules
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time snapshot of cache counters."""
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": self.size,
+        }
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe in-memory cache with per-entry time-to-live and bounded size.
+
+    Args:
+        ttl_seconds: Lifetime of an entry; values <= 0 disable caching entirely
+        max_size: Maximum number of entries before the oldest ones are evicted
+        clock: Monotonic time source (injectable for tests)
+
+    Note: Entries live in the memory of a single worker process. Other workers
+    only observe changes once their own entries expire, so keep TTLs short for
+    security-relevant data.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, V]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return cached value for key, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                # Lazily drop expired entry on access
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key for the configured TTL."""
+        if self.ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            now = self._clock()
+            self._entries.pop(key, None)  # Re-insert to keep insertion order fresh
+            if len(self._entries) >= self.max_size:
+                self._evict(now)
+            self._entries[key] = (now + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove all entries whose key matches predicate.
+
+        Returns:
+            int: Number of removed entries
+        """
+        with self._lock:
+            stale_keys = [key for key in self._entries if predicate(key)]
+            for key in stale_keys:
+                del self._entries[key]
+            self._invalidations += len(stale_keys)
+            return len(stale_keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def _evict(self, now: float) -> None:
+        # Drop expired entries first, then the oldest ones until there is room
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+        while self._entries and len(self._entries) >= self.max_size:
+            oldest_key = next(iter(self._entries))
+            del self._entries[oldest_key]
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from api.domain import ConflictError, ForbiddenError, NotFoundError, ValidationError
+from api.utils.exception_utils import PasswordHasherBusyError
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -20,3 +21,11 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ValidationError)
     async def handle_validation(_: Request, exc: ValidationError):
         return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+    @app.exception_handler(PasswordHasherBusyError)
+    async def handle_password_hasher_busy(_: Request, exc: PasswordHasherBusyError):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Server is busy, please try again"},
+            headers={"Retry-After": "1"},
+        )
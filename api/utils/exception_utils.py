@@ -80,3 +80,12 @@ class UserDisabledError(AuthError):
         - Security incidents
     """
     pass
+
+class PasswordHasherBusyError(Exception):
+    """
+    Raised when the password hashing pool has no free slot in time.
+    
+    Signals overload (e.g. a login burst) instead of queueing requests
+    without bound; mapped to HTTP 503 with Retry-After.
+    """
+    pass
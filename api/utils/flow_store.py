@@ -0,0 +1,137 @@
+"""
+Stores for short-lived, single-use values of OAuth flows.
+
+An OAuth flow spans several requests (start -> GitHub callback -> code
+exchange) that may be served by different workers or hosts. The store keeps
+each value only until it is consumed or its TTL runs out.
+
+Backends (OAUTH_FLOW_STORE):
+    memory     per-process dict with a TTL heap and a size bound (one worker only)
+    database   oauth_flow_entries table, shared by every worker and host
+               (OAUTH_FLOW_STORE_URL may point at a separate database, e.g. a
+               SQLite file shared by the workers of one host)
+
+Usage:
+    store.put("state:abc", {"user_id": 1}, ttl_seconds=600)
+    store.pop("state:abc")   # -> {"user_id": 1}, then None
+"""
+
+# Import standard library modules
+import heapq
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class FlowStore(ABC):
+    """
+    Interface of OAuth flow stores.
+
+    Values are JSON-serialisable dicts; pop is atomic, so a value can be
+    consumed only once even when two workers race for it. A backend that
+    lacks a method cannot be instantiated (TypeError from build_flow_store).
+    """
+
+    @abstractmethod
+    def put(self, key: str, value: dict, ttl_seconds: float) -> None:
+        """Store value under key until consumed or ttl_seconds have passed."""
+
+    @abstractmethod
+    def pop(self, key: str) -> Optional[dict]:
+        """Remove and return the value of key, or None when missing or expired."""
+
+    @abstractmethod
+    def purge(self) -> int:
+        """Drop expired entries; returns the number of removed entries."""
+
+
+class MemoryFlowStore(FlowStore):
+    """
+    In-process store with TTL eviction and bounded size.
+
+    Args:
+        max_size: Maximum live entries; the entry closest to expiry is evicted first
+        clock: Monotonic time source (injectable for tests)
+
+    Note: Values are only visible to the worker that stored them.
+    """
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, dict]] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []  # (expires_at, key), may hold consumed keys
+
+    def put(self, key: str, value: dict, ttl_seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            self._sweep(now)
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                self._evict_soonest()
+
+            expires_at = now + ttl_seconds
+            self._entries[key] = (expires_at, value)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+            # Consumed keys stay in the heap until they expire; compact when they pile up
+            if len(self._expiry_heap) > 2 * max(self.max_size, len(self._entries)):
+                self._expiry_heap = [(exp, k) for k, (exp, _) in self._entries.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def pop(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            return entry[1]
+
+    def purge(self) -> int:
+        with self._lock:
+            return self._sweep(self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sweep(self, now: float) -> int:
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            # Skip heap items of consumed or re-stored keys
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                removed += 1
+        return removed
+
+    def _evict_soonest(self) -> None:
+        while self._expiry_heap:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                return
+
+
+def build_flow_store(backend: str, url: str = "", max_size: int = 10000) -> FlowStore:
+    """
+    Create the configured flow store.
+
+    Args:
+        backend: "memory" or "database"
+        url: Database URL of the shared table (database backend; empty uses
+            the application database)
+        max_size: Entry bound of the memory backend
+
+    Returns:
+        FlowStore: Store instance (one per process)
+    """
+    if backend == "memory":
+        return MemoryFlowStore(max_size=max_size)
+    if backend == "database":
+        # Imported here: api.db depends on api.utils
+        from api.db.oauth_flow_db import DatabaseFlowStore
+
+        return DatabaseFlowStore.from_url(url) if url else DatabaseFlowStore()
+    raise ValueError(f"Unknown OAuth flow store backend: {backend}")
@@ -0,0 +1,154 @@
+"""
+Streaming parsers for bulk imports.
+
+Uploaded files are consumed chunk by chunk and turned into records one line
+at a time, so memory use does not depend on the file size. Supported formats:
+
+    text/csv               header row, one record per row (quoted newlines allowed)
+    application/x-ndjson   one JSON object per line (also application/jsonl)
+
+Malformed records are yielded as errors with their line number instead of
+aborting the import; only structural problems (unknown format, missing
+header columns, oversized lines) stop the stream.
+
+Usage:
+    fmt = import_format(request.headers.get("content-type"))
+    for line, record in iter_records(chunks, fmt, required=("name", "price")):
+        if isinstance(record, RecordError): ...
+"""
+
+# Import standard library modules
+import codecs
+import csv
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Import domain exceptions (mapped to HTTP 422)
+from api.domain.exceptions import ValidationError
+
+MAX_LINE_BYTES = 64 * 1024  # Longest accepted line (guards against files without newlines)
+
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@dataclass(frozen=True)
+class RecordError:
+    """A record that could not be parsed (reported, not raised)."""
+    message: str
+
+
+Record = Union[Dict[str, object], RecordError]
+
+
+def import_format(content_type: Optional[str]) -> str:
+    """
+    Resolve the import format from a Content-Type header.
+
+    Raises:
+        ValidationError: Content type is not a supported import format
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    fmt = CONTENT_TYPES.get(media_type)
+    if fmt is None:
+        raise ValidationError(
+            "Unsupported import format; send text/csv or application/x-ndjson"
+        )
+    return fmt
+
+
+def iter_lines(chunks: Iterable[bytes], encoding: str = "utf-8-sig") -> Iterator[str]:
+    """
+    Split a stream of byte chunks into text lines (line endings kept).
+
+    Raises:
+        ValidationError: Invalid encoding or a line longer than MAX_LINE_BYTES
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    try:
+        for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            lines = buffer.split("\n")
+            # The last piece is an unfinished line; keep it for the next chunk
+            buffer = lines.pop()
+            for line in lines:
+                yield line + "\n"
+            if len(buffer) > MAX_LINE_BYTES:
+                raise ValidationError(f"Lines must be shorter than {MAX_LINE_BYTES} bytes")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValidationError(f"File is not valid {encoding.split('-')[0].upper()} text")
+
+    if buffer:
+        yield buffer
+
+
+def iter_records(
+    chunks: Iterable[bytes],
+    fmt: str,
+    required: Sequence[str] = (),
+) -> Iterator[Tuple[int, Record]]:
+    """
+    Parse an uploaded file into (line number, record) pairs.
+
+    Args:
+        chunks: Raw body chunks
+        fmt: "csv" or "ndjson" (see import_format)
+        required: Columns every CSV header must contain
+
+    Returns:
+        Iterator of (line, dict) for parsed records and (line, RecordError)
+        for records that are not valid; blank lines are skipped
+    """
+    lines = iter_lines(chunks)
+    if fmt == "csv":
+        return _iter_csv(lines, required)
+    return _iter_ndjson(lines)
+
+
+def _iter_csv(lines: Iterator[str], required: Sequence[str]) -> Iterator[Tuple[int, Record]]:
+    reader = csv.DictReader(lines)
+    header = [name.strip() for name in (reader.fieldnames or [])]
+    missing = [name for name in required if name not in header]
+    if missing:
+        raise ValidationError(f"CSV header is missing columns: {', '.join(missing)}")
+    reader.fieldnames = header
+
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as exc:
+            yield reader.line_num, RecordError(f"Malformed CSV row: {exc}")
+            continue
+
+        if None in row:
+            yield reader.line_num, RecordError("Row has more fields than the header")
+            continue
+        if not any((value or "").strip() for value in row.values()):
+            continue
+        yield reader.line_num, row
+
+
+def _iter_ndjson(lines: Iterator[str]) -> Iterator[Tuple[int, Record]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield number, RecordError("Invalid JSON")
+            continue
+
+        if not isinstance(record, dict):
+            yield number, RecordError("Each line must be a JSON object")
+            continue
+        yield number, record
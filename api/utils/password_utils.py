@@ -0,0 +1,183 @@
+"""
+Password hashing and verification off the request threads.
+
+scrypt is CPU-bound by design (tens of milliseconds per call) and holds the
+GIL while it runs, so a burst of logins executed inline stalls every other
+request of the worker. PasswordHasher runs the work in a small process pool
+instead: request threads only wait for the result.
+
+Admission is bounded: at most max_pending jobs are queued or running. Further
+callers wait up to queue_timeout seconds for a slot and then fail with
+PasswordHasherBusyError (HTTP 503) instead of piling up behind the pool.
+
+Usage:
+    hasher = PasswordHasher(workers=2, max_pending=32, queue_timeout=5, method="scrypt:32768:8:1")
+    if hasher.verify(password, user.password_hash) and hasher.needs_rehash(user.password_hash):
+        user.password_hash = hasher.hash(password)
+"""
+
+# Import standard library modules
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+# Import werkzeug hashing primitives (run in the worker processes)
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+# Import custom exception for a saturated pool (mapped to HTTP 503)
+from api.utils.exception_utils import PasswordHasherBusyError
+
+
+class PasswordHasher:
+    """
+    Bounded process pool for password hashing.
+
+    Args:
+        workers: Worker processes (0 = hash inline on the calling thread)
+        max_pending: Jobs allowed to be queued or running at once
+        queue_timeout: Seconds a caller waits for a free slot
+        method: werkzeug hash method for new hashes (e.g. "scrypt:32768:8:1");
+            stored hashes with other parameters are reported by needs_rehash
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float, method: str):
+        self.workers = workers
+        self.max_pending = max(max_pending, 1)
+        self.queue_timeout = queue_timeout
+        self.method = method
+        # Stored prefix of the method ("scrypt" is stored as "scrypt:32768:8:1")
+        self.hash_prefix = expand_hash_method(method)
+
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._counts = {
+            "pending": 0, "peak_pending": 0, "completed": 0, "rejected": 0, "rehashed": 0, "pool_restarts": 0,
+        }
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """Check a password against a stored hash (timing-safe comparison)."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether a stored hash was made with other parameters than the configured method."""
+        return _hash_prefix(password_hash) != self.hash_prefix
+
+    def record_rehash(self) -> None:
+        """Count a hash upgraded on login (see stats)."""
+        self._count("rehashed")
+
+    def stats(self) -> dict:
+        """
+        Pool counters of this process.
+
+        Returns:
+            dict: workers, max_pending, pending (queued + running), queued
+            (waiting for a worker), peak_pending, completed, rejected
+            (admission timeouts), rehashed and pool_restarts
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        counts["queued"] = max(counts["pending"] - self.workers, 0) if self.workers else 0
+        return {"workers": self.workers, "max_pending": self.max_pending, **counts}
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later call starts a new pool)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run(self, function: Callable, *args):
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self._count("rejected")
+            raise PasswordHasherBusyError()
+
+        try:
+            with self._lock:
+                self._counts["pending"] += 1
+                self._counts["peak_pending"] = max(self._counts["peak_pending"], self._counts["pending"])
+
+            if self.workers <= 0:
+                return function(*args)
+
+            executor = self._get_executor()
+            try:
+                return executor.submit(function, *args).result()
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed): the pool refuses all further
+                # work, so replace it and run the job once more on a fresh one
+                self._discard_executor(executor)
+                return self._get_executor().submit(function, *args).result()
+
+        finally:
+            with self._lock:
+                self._counts["pending"] -= 1
+                self._counts["completed"] += 1
+            self._slots.release()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a multi-threaded server process is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: Executor) -> None:
+        with self._lock:
+            # Other callers may have replaced it already
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._counts["pool_restarts"] += 1
+        executor.shutdown(wait=False)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+def expand_hash_method(method: str) -> str:
+    """
+    Method prefix werkzeug stores for a hash method, defaults filled in.
+
+    Mirrors werkzeug's parsing without hashing anything, e.g. "scrypt" ->
+    "scrypt:32768:8:1", "pbkdf2" -> "pbkdf2:sha256:<default iterations>".
+
+    Raises:
+        ValueError: Method werkzeug would reject
+    """
+    name, *args = method.split(":")
+    if name == "scrypt":
+        if not args:
+            return "scrypt:32768:8:1"
+        if len(args) != 3:
+            raise ValueError("'scrypt' takes 3 arguments.")
+        return "scrypt:" + ":".join(str(int(arg)) for arg in args)
+    if name == "pbkdf2":
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' takes 2 arguments.")
+        hash_name = args[0] if args else "sha256"
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{iterations}"
+    raise ValueError(f"Invalid hash method '{method}'.")
+
+def _hash_prefix(password_hash: str) -> str:
+    # werkzeug hashes look like "<method>:<params>$<salt>$<digest>"
+    return password_hash.split("$", 1)[0]
+
+# --- Password Hashing Design Notes ---
+# Processes, not threads: hashlib.scrypt keeps the GIL, a thread pool would not
+# take the work off the request worker
+# The pool is started lazily and reused; worker start-up cost is paid once
+# A pool broken by a dead worker is replaced on the next job (pool_restarts)
+# Hash parameters are tuned with PASSWORD_HASH_METHOD; logins upgrade older
+# hashes transparently, so a cost change needs no migration
@@ -0,0 +1,52 @@
+-- =========================
+-- MIGRATION 002
+-- Indexes for the hot query shapes
+-- =========================
+--
+-- Apply to an existing database (outside a transaction, CONCURRENTLY
+-- cannot run inside one):
+--     psql -h <host> -U <user> -d <db> -f db/migrations/002_query_shape_indexes.sql
+--
+-- Fresh databases get the same indexes from db/schema.sql.
+-- Idempotent: safe to run more than once.
+
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version TEXT PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+-- -------------------------
+-- Orders: tenant listings / date ranges, status filters, cross-tenant stats
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_company_created
+    ON orders (company_id, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_company_status
+    ON orders (company_id, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_created_at
+    ON orders (created_at);
+
+-- -------------------------
+-- Order items: lines of an order, cascades from items
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_items_order_id
+    ON order_items (order_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_items_item_id
+    ON order_items (item_id);
+
+-- -------------------------
+-- Users: tenant lists / online counts, role-scoped listings
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_company_status
+    ON users (company_id, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_role_id
+    ON users (role_id);
+
+-- -------------------------
+-- Items: low-stock filter (threshold must match item_db.LOW_STOCK_THRESHOLD)
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_low_stock
+    ON items (company_id, quantity)
+    WHERE is_active AND quantity <= 20;
+
+INSERT INTO schema_migrations (version) VALUES ('002')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,31 @@
+-- =========================
+-- MIGRATION 003
+-- Order status rollup for dashboard statistics
+-- =========================
+--
+-- Apply to an existing database:
+--     psql -h <host> -U <user> -d <db> -1 -f db/migrations/003_order_status_counts.sql
+--
+-- The backfill below can be repeated at any time with:
+--     python -m api.cli rebuild-order-stats
+
+CREATE TABLE IF NOT EXISTS order_status_counts (
+    company_id INT NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    order_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    order_count INT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (company_id, day, order_type, status)
+);
+
+-- Backfill from existing orders
+DELETE FROM order_status_counts;
+
+INSERT INTO order_status_counts (company_id, day, order_type, status, order_count)
+SELECT company_id, date(created_at), order_type, status, count(*)
+FROM orders
+GROUP BY company_id, date(created_at), order_type, status;
+
+INSERT INTO schema_migrations (version) VALUES ('003')
+ON CONFLICT (version) DO NOTHING;
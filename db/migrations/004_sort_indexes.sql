@@ -0,0 +1,31 @@
+-- =========================
+-- MIGRATION 004
+-- Indexes for client-selectable sort orders
+-- =========================
+--
+-- Apply to an existing database (outside a transaction, CONCURRENTLY
+-- cannot run inside one):
+--     psql -h <host> -U <user> -d <db> -f db/migrations/004_sort_indexes.sql
+--
+-- Fresh databases get the same indexes from db/schema.sql.
+-- Idempotent: safe to run more than once.
+--
+-- Each index ends with id (the pagination tie-breaker), so a sorted page
+-- of one tenant is read straight from the index in either direction.
+
+-- -------------------------
+-- Items: catalog sorted by name or price (sku is covered by uniq_company_sku)
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_company_name
+    ON items (company_id, name, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_company_price
+    ON items (company_id, price, id);
+
+-- -------------------------
+-- Users: user lists sorted by username
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_company_username
+    ON users (company_id, username, id);
+
+INSERT INTO schema_migrations (version) VALUES ('004')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,24 @@
+-- =========================
+-- MIGRATION 005
+-- Trigram index for fuzzy item search (POST /api/items/search with "q")
+-- =========================
+--
+-- Apply to an existing database (outside a transaction, CONCURRENTLY
+-- cannot run inside one; creating the extensions needs a role with CREATE
+-- privilege on the database):
+--     psql -h <host> -U <user> -d <db> -f db/migrations/005_item_search.sql
+--
+-- Fresh databases get the same index from db/schema.sql.
+-- Idempotent: safe to run more than once.
+--
+-- The indexed expression must stay identical to api.models.item.item_search_text,
+-- otherwise the planner cannot use the index.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_search
+    ON items USING gin (company_id, lower(name || ' ' || sku) gin_trgm_ops);
+
+INSERT INTO schema_migrations (version) VALUES ('005')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,34 @@
+-- =========================
+-- MIGRATION 006
+-- Refresh tokens for access token renewal without a password login
+-- =========================
+--
+-- Apply to an existing database:
+--     psql -h <host> -U <user> -d <db> -1 -f db/migrations/006_refresh_tokens.sql
+--
+-- Fresh databases get the same table from db/schema.sql.
+-- Idempotent: safe to run more than once.
+--
+-- Expired rows are removed with:
+--     python -m api.cli purge-refresh-tokens
+
+CREATE TABLE IF NOT EXISTS refresh_tokens (
+    id SERIAL PRIMARY KEY,
+
+    token_hash VARCHAR(64) NOT NULL UNIQUE,
+
+    user_id INT NOT NULL
+        REFERENCES users(id)
+        ON DELETE CASCADE,
+
+    session_id TEXT NOT NULL,
+
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_refresh_tokens_session_id ON refresh_tokens (session_id);
+
+INSERT INTO schema_migrations (version) VALUES ('006')
+ON CONFLICT (version) DO NOTHING;
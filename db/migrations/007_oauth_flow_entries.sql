@@ -0,0 +1,23 @@
+-- =========================
+-- MIGRATION 007
+-- Shared store for OAuth state and exchange codes (multiple workers / hosts)
+-- =========================
+--
+-- Apply to an existing database:
+--     psql -h <host> -U <user> -d <db> -1 -f db/migrations/007_oauth_flow_entries.sql
+--
+-- Fresh databases get the same table from db/schema.sql.
+-- Idempotent: safe to run more than once.
+--
+-- Used when OAUTH_FLOW_STORE=database; expired rows are swept by the API.
+
+CREATE TABLE IF NOT EXISTS oauth_flow_entries (
+    key VARCHAR(128) PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expires_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_oauth_flow_entries_expires_at ON oauth_flow_entries (expires_at);
+
+INSERT INTO schema_migrations (version) VALUES ('007')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,25 @@
+-- =========================
+-- MIGRATION 008
+-- orders.created_at becomes NOT NULL (keyset pagination sorts on it)
+-- =========================
+--
+-- Apply to an existing database:
+--     psql -h <host> -U <user> -d <db> -1 -f db/migrations/008_orders_created_at_not_null.sql
+--
+-- Keyset comparisons never match NULL, so orders without created_at would
+-- silently drop out of pages sorted by created_at. Old rows without a value
+-- get their completion time (or the migration time) first.
+-- Idempotent: safe to run more than once.
+--
+-- Backfilled orders move to another day in the status rollup; refresh it with:
+--     python -m api.cli rebuild-order-stats
+
+UPDATE orders
+SET created_at = COALESCE(completed_at, now())
+WHERE created_at IS NULL;
+
+ALTER TABLE orders ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE orders ALTER COLUMN created_at SET NOT NULL;
+
+INSERT INTO schema_migrations (version) VALUES ('008')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,40 @@
+-- =========================
+-- MIGRATION 009
+-- Pattern indexes for prefix filters (LIKE 'x%')
+-- =========================
+--
+-- Apply to an existing database (outside a transaction, CONCURRENTLY
+-- cannot run inside one):
+--     psql -h <host> -U <user> -d <db> -f db/migrations/009_prefix_filter_indexes.sql
+--
+-- Fresh databases get the same indexes from db/schema.sql.
+-- Idempotent: safe to run more than once.
+--
+-- A btree under the default collation cannot serve LIKE 'x%', so the sort and
+-- unique indexes do not cover prefix filters. The API rejects prefix filters
+-- on large tables unless one of these text_pattern_ops indexes exists.
+
+-- -------------------------
+-- Items: name / sku prefix within one tenant
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_company_name_pattern
+    ON items (company_id, name text_pattern_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_company_sku_pattern
+    ON items (company_id, sku text_pattern_ops);
+
+-- -------------------------
+-- Users: username / email prefix (superadmin lists span tenants)
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_pattern
+    ON users (username text_pattern_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_pattern
+    ON users (email text_pattern_ops);
+
+-- -------------------------
+-- Companies: name prefix
+-- -------------------------
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_companies_name_pattern
+    ON companies (name text_pattern_ops);
+
+INSERT INTO schema_migrations (version) VALUES ('009')
+ON CONFLICT (version) DO NOTHING;
@@ -3,6 +3,22 @@
 -- Single role per user
 -- =========================
 
+-- -------------------------
+-- Applied migrations (db/migrations/*.sql); this file is the latest version
+-- -------------------------
+CREATE TABLE schema_migrations (
+    version TEXT PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+INSERT INTO schema_migrations (version) VALUES ('001'), ('002'), ('003'), ('004'), ('005'), ('006'), ('007'), ('008'), ('009');
+
+-- -------------------------
+-- Extensions: trigram matching and btree columns in GIN indexes (item search)
+-- -------------------------
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
 -- -------------------------
 -- Companies
 -- -------------------------
@@ -12,6 +28,8 @@ CREATE TABLE companies (
     field TEXT
 );
 
+CREATE INDEX ix_companies_name_pattern ON companies(name text_pattern_ops);
+
 INSERT INTO companies (name, field)
 VALUES ('TechNova', 'Software Development');
 
@@ -49,6 +67,12 @@ CREATE TABLE users (
     role_id INT NOT NULL REFERENCES roles(id)
 );
 
+CREATE INDEX ix_users_company_status ON users(company_id, status);
+CREATE INDEX ix_users_role_id ON users(role_id);
+CREATE INDEX ix_users_company_username ON users(company_id, username, id);
+CREATE INDEX ix_users_username_pattern ON users(username text_pattern_ops);
+CREATE INDEX ix_users_email_pattern ON users(email text_pattern_ops);
+
 -- -------------------------
 -- OAuth accounts (external identity providers)
 -- -------------------------
@@ -72,6 +96,38 @@ CREATE TABLE user_oauth_accounts (
     UNIQUE (user_id, provider)
 );
 
+-- -------------------------
+-- Refresh tokens (rotating, stored as SHA-256 digests)
+-- -------------------------
+CREATE TABLE refresh_tokens (
+    id SERIAL PRIMARY KEY,
+
+    token_hash VARCHAR(64) NOT NULL UNIQUE,  -- hex digest, lookup key on refresh
+
+    user_id INT NOT NULL
+        REFERENCES users(id)
+        ON DELETE CASCADE,
+
+    session_id TEXT NOT NULL,                -- users.session_id at issue time
+
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP                     -- rotated, logged out or reused
+);
+
+CREATE INDEX ix_refresh_tokens_session_id ON refresh_tokens(session_id);
+
+-- -------------------------
+-- OAuth flows in progress (state, exchange codes) shared by all workers
+-- -------------------------
+CREATE TABLE oauth_flow_entries (
+    key VARCHAR(128) PRIMARY KEY,            -- "<kind>:<random token>"
+    payload TEXT NOT NULL,                   -- JSON document
+    expires_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX ix_oauth_flow_entries_expires_at ON oauth_flow_entries(expires_at);
+
 -- -------------------------
 -- Seed users
 -- -------------------------
@@ -132,6 +188,14 @@ CREATE TABLE items (
 );
 
 CREATE UNIQUE INDEX uniq_company_sku ON items(company_id, sku);
+CREATE INDEX ix_items_company_name ON items(company_id, name, id);
+CREATE INDEX ix_items_company_price ON items(company_id, price, id);
+CREATE INDEX ix_items_company_name_pattern ON items(company_id, name text_pattern_ops);
+CREATE INDEX ix_items_company_sku_pattern ON items(company_id, sku text_pattern_ops);
+CREATE INDEX ix_items_low_stock ON items(company_id, quantity)
+    WHERE is_active AND quantity <= 20;  -- item_db.LOW_STOCK_THRESHOLD
+CREATE INDEX ix_items_search ON items
+    USING gin (company_id, lower(name || ' ' || sku) gin_trgm_ops);  -- models.item.item_search_text
 
 -- -------------------------
 -- Orders
@@ -143,13 +207,17 @@ CREATE TABLE orders (
         CHECK (status IN ('pending', 'completed', 'cancelled')),
     order_type TEXT NOT NULL
         CHECK (order_type IN ('sale', 'restock')),
-    created_at TIMESTAMP DEFAULT now(),
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
     completed_at TIMESTAMP,
 
     user_id INT NOT NULL REFERENCES users(id),
     company_id INT NOT NULL REFERENCES companies(id) ON DELETE CASCADE
 );
 
+CREATE INDEX ix_orders_company_created ON orders(company_id, created_at);
+CREATE INDEX ix_orders_company_status ON orders(company_id, status);
+CREATE INDEX ix_orders_created_at ON orders(created_at);
+
 -- -------------------------
 -- Order items
 -- -------------------------
@@ -163,6 +231,22 @@ CREATE TABLE order_items (
     unit_price NUMERIC(10,2) NOT NULL CHECK (unit_price >= 0)
 );
 
+CREATE INDEX ix_order_items_order_id ON order_items(order_id);
+CREATE INDEX ix_order_items_item_id ON order_items(item_id);
+
+-- -------------------------
+-- Order status rollup (per company, creation day, type and status)
+-- -------------------------
+CREATE TABLE order_status_counts (
+    company_id INT NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    order_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    order_count INT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (company_id, day, order_type, status)
+);
+
 -- =========================
 -- Seed items
 -- =========================
@@ -208,4 +292,12 @@ INSERT INTO order_items (
 VALUES
 (1, 1, 1, 38999.00),  -- 1× Laptop
 (1, 2, 2, 2999.00),   -- 2× Keyboard
-(1, 5, 1, 1299.00);   -- 1× Mouse
\ No newline at end of file
+(1, 5, 1, 1299.00);   -- 1× Mouse
+
+-- =========================
+-- Backfill order status rollup for seeded orders
+-- =========================
+INSERT INTO order_status_counts (company_id, day, order_type, status, order_count)
+SELECT company_id, date(created_at), order_type, status, count(*)
+FROM orders
+GROUP BY company_id, date(created_at), order_type, status;
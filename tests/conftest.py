@@ -1,5 +1,11 @@
+import json
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import StaticPool, create_engine, event
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 from werkzeug.security import generate_password_hash
@@ -13,7 +19,20 @@ from api.models.item import Item
 from api.models.order import Order
 from api.models.order_item import OrderItem
 
-from api.dependencies import get_current_user, get_db
+from api.db.async_db import SyncSessionRunner
+from api.services.role_service import clear_role_catalog
+from api.dependencies import (
+    get_async_auth_db,
+    get_async_db,
+    get_async_read_db,
+    get_auth_db,
+    get_current_user,
+    get_current_user_async,
+    get_db,
+    get_read_db,
+    get_snapshot_db,
+    get_stream_db,
+)
 
 # -------------------------
 # Test client fixture
@@ -34,25 +53,65 @@ def override_get_db(db):
         yield db
     return _override
 
+@pytest.fixture
+def override_get_async_db(db):
+    # SQLite has no async driver here; async routes run the same repositories
+    # through the sync-session fallback used when DB_ASYNC_DRIVER is empty
+    async def _override():
+        yield SyncSessionRunner(db)
+    return _override
+
+@pytest.fixture
+def override_get_stream_db(db):
+    # Streams share the test session; it is closed by the db fixture
+    @contextmanager
+    def open_db():
+        yield db
+
+    def _override():
+        return open_db
+    return _override
+
 @pytest.fixture(autouse=True)
 def clear_dependency_overrides():
     yield
     app.dependency_overrides.clear()
 
+@pytest.fixture(autouse=True)
+def clear_role_catalog_cache():
+    # Every test builds its own roles table
+    yield
+    clear_role_catalog()
+
 @pytest.fixture
-def auth_client_factory(client, override_get_db):
+def auth_client_factory(client, override_get_db, override_get_async_db, override_get_stream_db):
     def _factory(user):
         app.dependency_overrides[get_current_user] = override_get_current_user(user)
+        app.dependency_overrides[get_current_user_async] = override_get_current_user(user)
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_auth_db] = override_get_db
+        app.dependency_overrides[get_async_auth_db] = override_get_async_db
+        app.dependency_overrides[get_read_db] = override_get_db
+        app.dependency_overrides[get_snapshot_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        app.dependency_overrides[get_async_read_db] = override_get_async_db
+        app.dependency_overrides[get_stream_db] = override_get_stream_db
         return client
     return _factory
 
 @pytest.fixture
-def client_with_db(client, db):
+def client_with_db(client, db, override_get_async_db, override_get_stream_db):
     def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_auth_db] = override_get_db
+    app.dependency_overrides[get_async_auth_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_snapshot_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    app.dependency_overrides[get_stream_db] = override_get_stream_db
 
     yield client
 
@@ -88,6 +147,24 @@ def db():
         db.close()
 
 
+# One database round trip (executemany batches are a single statement)
+RecordedStatement = namedtuple("RecordedStatement", "sql parameters executemany")
+
+
+@pytest.fixture
+def count_statements(db):
+    # Statements sent on the test engine; clear() before the measured call
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(RecordedStatement(statement, parameters, executemany))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
 # -------------------------
 # Company
 # -------------------------
@@ -274,3 +351,57 @@ def order_item(db, order, item):
     db.commit()
     db.refresh(order_item)
     return order_item
+
+
+# -------------------------
+# GitHub stub server
+# -------------------------
+class GitHubStub:
+    """Local stand-in for github.com and api.github.com (both on one port)."""
+
+    def __init__(self):
+        self.token_requests = 0
+        self.user_requests = 0
+        self.user_failures = 0          # Next n user requests answer 503
+        self.profile = {"id": 42, "login": "octo", "email": "octo@example.com"}
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.token_requests += 1
+                self._reply(200, {"access_token": "gh-token"})
+
+            def do_GET(self):
+                stub.user_requests += 1
+                if stub.user_failures:
+                    stub.user_failures -= 1
+                    self._reply(503, {"message": "unavailable"})
+                else:
+                    self._reply(200, stub.profile)
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+@pytest.fixture
+def github_stub():
+    stub = GitHubStub()
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        stub.server.shutdown()
+        stub.server.server_close()
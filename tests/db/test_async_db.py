@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from sqlalchemy.pool import StaticPool
+
+from api.db import paginate_items
+from api.db.async_db import SyncSessionRunner, count_users_async, paginate_items_async
+from api.db.db_engine import Base
+from api.models.item import Item
+
+
+def _add_items(db, company, count):
+    for index in range(count):
+        db.add(Item(
+            name=f"Async {index}",
+            sku=f"ASYNC-{index:03d}",
+            price=1,
+            quantity=index,
+            company_id=company.id,
+            is_active=True,
+        ))
+    db.commit()
+
+
+def test_async_page_matches_sync_page(db, company):
+    _add_items(db, company, 7)
+
+    sync_page = paginate_items(db, {}, company.id, 3, 0)
+    async_page = asyncio.run(
+        paginate_items_async(SyncSessionRunner(db), {}, company.id, 3, 0)
+    )
+
+    assert [item.id for item in async_page.rows] == [item.id for item in sync_page.rows]
+    assert async_page.total == sync_page.total == 7
+    assert async_page.next_cursor == sync_page.next_cursor
+
+
+def test_async_count_users(db, admin, manager):
+    runner = SyncSessionRunner(db)
+
+    assert asyncio.run(count_users_async(runner, company_id=admin.company_id)) == 2
+    assert asyncio.run(count_users_async(runner, online_only=True)) == 0
+
+
+def test_async_session_on_async_driver(company):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(Item(name="Async", sku="ASYNC-1", price=1, quantity=1,
+                             company_id=1, is_active=True))
+            await session.commit()
+
+            page = await paginate_items_async(session, {}, 1, 10, 0)
+
+        await engine.dispose()
+        return page
+
+    page = asyncio.run(scenario())
+
+    assert page.total == 1
+    assert page.rows[0].company_id == 1
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.db import filters as filters_module
+from api.db import paginate_items, paginate_order
+from api.db.item_db import ITEM_FILTERS
+from api.db.order_db import ORDER_FILTERS
+from api.db.user_db import USER_FILTERS
+from api.domain.exceptions import ValidationError
+from api.models.item import Item
+from api.models.order import Order
+
+
+def _add_items(db, company):
+    for index, sku in enumerate(["AB-1", "AB-2", "A%B-3", "CD-4"]):
+        db.add(Item(
+            name=f"Item {sku}",
+            sku=sku,
+            price=index + 1,
+            quantity=index * 10,
+            company_id=company.id,
+            is_active=True,
+        ))
+    db.commit()
+
+
+def _skus(page):
+    return sorted(item.sku for item in page.rows)
+
+
+def test_eq_shorthand_and_operators(db, company):
+    _add_items(db, company)
+
+    assert _skus(paginate_items(db, {"sku": "CD-4"}, company.id, 10, 0)) == ["CD-4"]
+    assert _skus(paginate_items(db, {"sku": {"in": ["AB-1", "CD-4"]}}, company.id, 10, 0)) == [
+        "AB-1", "CD-4",
+    ]
+    assert _skus(paginate_items(db, {"quantity": {"range": [10, 30]}}, company.id, 10, 0)) == [
+        "A%B-3", "AB-2",
+    ]
+    assert _skus(paginate_items(db, {"price": {"range": [None, "2.5"]}}, company.id, 10, 0)) == [
+        "AB-1", "AB-2",
+    ]
+
+
+def test_prefix_escapes_wildcards(db, company):
+    _add_items(db, company)
+
+    assert _skus(paginate_items(db, {"sku": {"prefix": "AB"}}, company.id, 10, 0)) == [
+        "AB-1", "AB-2",
+    ]
+    assert _skus(paginate_items(db, {"sku": {"prefix": "A%"}}, company.id, 10, 0)) == ["A%B-3"]
+
+
+def test_is_null_and_datetime_range(db, company, admin):
+    now = datetime(2024, 5, 1, 12, 0)
+    db.add_all([
+        Order(status="pending", order_type="sale", created_at=now,
+              user_id=admin.id, company_id=company.id),
+        Order(status="completed", order_type="sale", created_at=now - timedelta(days=3),
+              completed_at=now, user_id=admin.id, company_id=company.id),
+    ])
+    db.commit()
+
+    open_orders = paginate_order(db, {"completed_at": {"is_null": True}}, company.id, 10, 0)
+    recent = paginate_order(
+        db, {"created_at": {"range": ["2024-04-30T00:00:00", None]}}, company.id, 10, 0
+    )
+
+    assert [order.status for order in open_orders.rows] == ["pending"]
+    assert [order.status for order in recent.rows] == ["pending"]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"password_hash": "secret"},         # not whitelisted
+        {"status": {"prefix": "on"}},        # operator not allowed for field
+        {"id": "abc"},                       # not coercible
+        {"is_active": "yes"},                # bool expected
+        {"status": {"in": "online"}},        # list expected
+        {"status": {}},                      # no operator
+    ],
+)
+def test_invalid_filters_are_rejected(filters):
+    with pytest.raises(ValidationError):
+        USER_FILTERS.compile(filters)
+
+
+def test_index_coverage_is_derived_from_model():
+    assert ORDER_FILTERS.fields["created_at"].indexed
+    assert ORDER_FILTERS.fields["status"].indexed_scoped
+    assert not ORDER_FILTERS.fields["status"].indexed
+    assert ITEM_FILTERS.fields["sku"].indexed_scoped
+    # ix_items_low_stock is partial, so it does not cover quantity filters
+    assert not ITEM_FILTERS.fields["quantity"].indexed_scoped
+
+
+def test_unindexed_filters_rejected_on_large_tables(monkeypatch):
+    monkeypatch.setattr(filters_module, "FILTER_UNINDEXED_MAX_ROWS", 1000)
+
+    # Covered by ix_orders_company_status only when the query is tenant-scoped
+    assert ORDER_FILTERS.compile({"status": "pending"}, scoped=True, table_rows=10**6)
+    with pytest.raises(ValidationError):
+        ORDER_FILTERS.compile({"status": "pending"}, scoped=False, table_rows=10**6)
+
+    # Small (or unknown-size) tables accept any declared filter
+    assert ORDER_FILTERS.compile({"status": "pending"}, table_rows=500)
+    assert ORDER_FILTERS.compile({"order_type": "sale"}, table_rows=None)
+    with pytest.raises(ValidationError):
+        ORDER_FILTERS.compile({"order_type": "sale"}, scoped=True, table_rows=10**6)
+
+
+def test_prefix_coverage_requires_pattern_index(monkeypatch):
+    from sqlalchemy import Column, Index, Integer, String
+    from sqlalchemy.orm import declarative_base
+
+    from api.db.filters import EQ, PREFIX, FilterField, FilterSpec
+
+    class Probe(declarative_base()):
+        __tablename__ = "filter_probe"
+        __table_args__ = (
+            Index("ix_probe_plain", "plain"),
+            Index("ix_probe_pattern", "pattern", postgresql_ops={"pattern": "text_pattern_ops"}),
+            Index("ix_probe_binary", "binary"),
+        )
+        id = Column(Integer, primary_key=True)
+        plain = Column(String)
+        pattern = Column(String)
+        binary = Column(String(collation="C"))
+
+    spec = FilterSpec(Probe, [FilterField(name, EQ | PREFIX) for name in ("plain", "pattern", "binary")])
+    monkeypatch.setattr(filters_module, "FILTER_UNINDEXED_MAX_ROWS", 1000)
+
+    assert spec.compile({"plain": "a"}, table_rows=10**6)
+    with pytest.raises(ValidationError):
+        spec.compile({"plain": {"prefix": "a"}}, table_rows=10**6)
+    assert spec.compile({"pattern": {"prefix": "a"}}, table_rows=10**6)
+    assert spec.compile({"binary": {"prefix": "a"}}, table_rows=10**6)
+
+
+def test_declared_prefix_filters_are_index_backed():
+    assert "prefix" in ITEM_FILTERS.fields["sku"].indexed_scoped
+    assert "prefix" in ITEM_FILTERS.fields["name"].indexed_scoped
+    assert "prefix" in USER_FILTERS.fields["username"].indexed
+    assert "prefix" in USER_FILTERS.fields["email"].indexed
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from api.db.oauth_flow_db import DatabaseFlowStore
+from api.models.oauth_flow import OAuthFlowEntry
+from api.utils import auth_utils
+from api.utils.flow_store import FlowStore, MemoryFlowStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_store_values_are_single_use():
+    store = MemoryFlowStore()
+    store.put("state:a", {"user_id": 1}, ttl_seconds=60)
+
+    assert store.pop("state:a") == {"user_id": 1}
+    assert store.pop("state:a") is None
+
+
+def test_memory_store_sweeps_abandoned_entries():
+    clock = FakeClock()
+    store = MemoryFlowStore(clock=clock)
+    store.put("state:abandoned", {"user_id": None}, ttl_seconds=10)
+
+    clock.now = 11
+    store.put("state:new", {"user_id": None}, ttl_seconds=10)
+
+    assert len(store) == 1
+    assert store.pop("state:abandoned") is None
+
+
+def test_memory_store_evicts_entry_closest_to_expiry_when_full():
+    store = MemoryFlowStore(max_size=2, clock=FakeClock())
+    store.put("code:short", {}, ttl_seconds=5)
+    store.put("state:long", {}, ttl_seconds=600)
+
+    store.put("state:next", {}, ttl_seconds=600)
+
+    assert len(store) == 2
+    assert store.pop("code:short") is None
+    assert store.pop("state:long") == {}
+
+
+def test_database_store_is_shared_between_instances(db):
+    factory = sessionmaker(bind=db.get_bind())
+    started_on, callback_on = DatabaseFlowStore(factory), DatabaseFlowStore(factory)
+
+    started_on.put("state:a", {"user_id": 7}, ttl_seconds=60)
+
+    assert callback_on.pop("state:a") == {"user_id": 7}
+    assert started_on.pop("state:a") is None
+
+
+def test_database_store_rejects_and_purges_expired_entries(db):
+    store = DatabaseFlowStore(sessionmaker(bind=db.get_bind()))
+    db.add(OAuthFlowEntry(
+        key="code:old",
+        payload="{}",
+        expires_at=datetime.utcnow() - timedelta(seconds=1),
+    ))
+    db.commit()
+
+    assert store.pop("code:old") is None
+
+    db.add(OAuthFlowEntry(
+        key="code:old",
+        payload="{}",
+        expires_at=datetime.utcnow() - timedelta(seconds=1),
+    ))
+    db.commit()
+    assert store.purge() == 1
+
+
+def test_oauth_state_uses_configured_store(db, monkeypatch):
+    store = DatabaseFlowStore(sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(auth_utils, "_oauth_flow_store", store)
+
+    state = auth_utils.create_oauth_state(user_id=3)
+
+    assert db.query(OAuthFlowEntry).count() == 1
+    assert auth_utils.consume_oauth_state(state) == 3
+    assert auth_utils.consume_oauth_state(state) is None
+
+
+def test_incomplete_store_cannot_be_instantiated():
+    class PutOnlyStore(FlowStore):
+        def put(self, key, value, ttl_seconds):
+            pass
+
+    with pytest.raises(TypeError):
+        PutOnlyStore()
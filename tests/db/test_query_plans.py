@@ -0,0 +1,170 @@
+"""
+EXPLAIN regression suite for the statements issued by api/db.
+
+Each case runs a repository function, captures the SQL it sends and asks
+the planner how it would execute it. A full table scan of one of the large
+tables fails the test, so a query change that stops using an index (or a
+dropped index) is caught before it reaches production data volumes.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.db.item_db import apply_stock_adjustments, get_items_by_ids, paginate_items
+from api.db.order_db import (
+    count_orders,
+    count_orders_grouped_by_status,
+    get_order_with_lines,
+    paginate_order,
+)
+from api.db.order_items_db import get_order_items, paginate_order_items
+from api.db.user_db import count_users, paginate_users
+from api.domain import StockAdjustment
+
+LARGE_TABLES = {"orders", "order_items", "items", "users"}
+
+
+def _full_scans(db, captured):
+    scans = []
+    connection = db.connection()
+    for statement, parameters, executemany in captured:
+        if executemany or statement.lstrip().upper().startswith(("INSERT", "EXPLAIN")):
+            continue
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        ).all()
+        for row in plan:
+            detail = row[-1]
+            words = detail.split()
+            # "SCAN <table>" without an index is a sequential scan
+            if words[:1] == ["SCAN"] and words[1] in LARGE_TABLES and "INDEX" not in detail:
+                scans.append(f"{detail}  <-  {statement}")
+    return scans
+
+
+def _assert_no_full_scans(db, captured, call):
+    captured.clear()
+    call()
+    assert captured, "repository function issued no statements"
+    scans = _full_scans(db, captured)
+    assert not scans, "\n".join(scans)
+
+
+def test_paginate_orders_by_company_and_status(db, company, order, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_order(db, {"status": "pending"}, company.id, 10, 0),
+    )
+
+
+def test_paginate_items_by_company(db, company, item, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_items(db, {}, company.id, 10, 0),
+    )
+
+
+@pytest.mark.parametrize("field", ["name", "sku", "price"])
+def test_paginate_items_sorted(db, company, item, count_statements, field):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_items(db, {}, company.id, 10, 0, sort=[(field, "desc")]),
+    )
+
+
+def test_search_items(db, company, item, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_items(db, {}, company.id, 10, 0, q="dock usb"),
+    )
+
+
+def test_paginate_orders_newest_first(db, company, order, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_order(db, {}, company.id, 10, 0, sort=[("created_at", "desc")]),
+    )
+
+
+def test_paginate_low_stock_items(db, company, item, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_items(db, {"low_stock": True}, company.id, 10, 0),
+    )
+
+
+def test_paginate_order_items(db, company, order, order_item, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_order_items(db, order.id, company.id, 10, 0),
+    )
+
+
+def test_order_lines_lookups(db, order, order_item, count_statements):
+    db.expire_all()
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: (get_order_items(db, order.id), get_order_with_lines(db, order.id)),
+    )
+
+
+def test_paginate_users_by_company_and_status(db, company, admin, manager, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: paginate_users(db, {"status": "offline"}, {"manager"}, company.id, 10, 0),
+    )
+
+
+def test_count_online_users_of_company(db, company, admin, count_statements):
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: count_users(db, company_id=company.id, online_only=True),
+    )
+
+
+def test_order_counts_for_company_and_date_range(db, company, order, count_statements):
+    now = datetime.utcnow()
+    filters = {"from_ts": now - timedelta(days=7), "to_ts": now, "status": "pending"}
+
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: (
+            count_orders(db, company.id, filters),
+            count_orders_grouped_by_status(db, company.id, False, filters),
+        ),
+    )
+
+
+def test_cross_company_order_counts_for_date_range(db, order, count_statements):
+    now = datetime.utcnow()
+    filters = {"from_ts": now - timedelta(days=7), "to_ts": now}
+
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: count_orders_grouped_by_status(db, None, True, filters),
+    )
+
+
+def test_stock_lookups_and_adjustments(db, item, count_statements):
+    item_id = item.id
+
+    _assert_no_full_scans(
+        db,
+        count_statements,
+        lambda: (
+            get_items_by_ids(db, [item_id]),
+            apply_stock_adjustments(db, [StockAdjustment(item_id, -1)]),
+        ),
+    )
@@ -0,0 +1,142 @@
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine, text
+
+from api.db.db_engine import Base
+from api.db.replicas import DatabaseNode, ReplicaRouter
+from api.dependencies import db as db_dependency
+from api.models.company import Company
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _sqlite_node(path, name, is_primary=False):
+    engine = create_engine(f"sqlite:///{path}")
+    return DatabaseNode(name, engine, is_primary=is_primary)
+
+
+def _seed(node):
+    Base.metadata.create_all(bind=node.engine)
+    with node.engine.begin() as connection:
+        connection.execute(Company.__table__.insert().values(name=node.name, field="Testing"))
+
+
+def _served_by(db):
+    return db.execute(text("SELECT name FROM companies ORDER BY id LIMIT 1")).scalar()
+
+
+@pytest.fixture
+def nodes(tmp_path):
+    primary = _sqlite_node(tmp_path / "primary.db", "primary", is_primary=True)
+    replica_a = _sqlite_node(tmp_path / "replica_a.db", "replica_a")
+    replica_b = _sqlite_node(tmp_path / "replica_b.db", "replica_b")
+    for node in (primary, replica_a, replica_b):
+        _seed(node)
+    return primary, replica_a, replica_b
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def use_router(monkeypatch):
+    def _use(router):
+        monkeypatch.setattr(db_dependency, "replica_router", router)
+        return router
+    return _use
+
+
+def _read(pin_key=None):
+    credentials = (
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=pin_key) if pin_key else None
+    )
+    dependency = db_dependency.get_read_db(credentials)
+    db = next(dependency)
+    try:
+        return _served_by(db)
+    finally:
+        dependency.close()
+
+
+def test_reads_rotate_over_replicas(nodes, clock, use_router):
+    primary, replica_a, replica_b = nodes
+    use_router(ReplicaRouter(primary, [replica_a, replica_b], clock=clock))
+
+    served = [_read() for _ in range(4)]
+
+    assert served == ["replica_a", "replica_b", "replica_a", "replica_b"]
+
+
+def test_without_replicas_reads_use_primary(nodes, clock, use_router):
+    primary, _, _ = nodes
+    use_router(ReplicaRouter(primary, [], clock=clock))
+
+    assert _read() == "primary"
+
+
+def test_failed_replica_is_ejected_until_cooldown(nodes, tmp_path, clock, use_router):
+    primary, replica_a, _ = nodes
+    broken = _sqlite_node(tmp_path / "missing" / "replica.db", "broken")
+    router = use_router(
+        ReplicaRouter(primary, [broken, replica_a], eject_seconds=30, clock=clock)
+    )
+
+    assert _read() == "replica_a"  # broken fails over to the next replica
+    assert [node.name for node in router.healthy_replicas()] == ["replica_a"]
+    assert {_read() for _ in range(3)} == {"replica_a"}
+    assert router.stats()["ejections"] == 1
+
+    clock.now = 31
+    assert [node.name for node in router.healthy_replicas()] == ["broken", "replica_a"]
+
+
+def test_all_replicas_down_falls_back_to_primary(nodes, tmp_path, clock, use_router):
+    primary, _, _ = nodes
+    broken = _sqlite_node(tmp_path / "missing" / "replica.db", "broken")
+    use_router(ReplicaRouter(primary, [broken], clock=clock))
+
+    assert _read() == "primary"
+
+
+def test_client_reads_primary_after_write(nodes, clock, use_router):
+    primary, replica_a, _ = nodes
+    router = use_router(ReplicaRouter(primary, [replica_a], pin_seconds=5, clock=clock))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token-1")
+
+    # A committed write through get_db pins the client
+    dependency = db_dependency.get_db(credentials)
+    db = next(dependency)
+    db.bind = primary.engine
+    db.add(Company(name="new", field="Testing"))
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    assert router.is_pinned("token-1")
+    assert _read("token-1") == "primary"
+    assert _read("token-2") == "replica_a"  # other clients keep using replicas
+
+    clock.now = 6
+    assert _read("token-1") == "replica_a"
+
+
+def test_read_only_request_does_not_pin(nodes, clock, use_router):
+    primary, replica_a, _ = nodes
+    router = use_router(ReplicaRouter(primary, [replica_a], clock=clock))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token-1")
+
+    dependency = db_dependency.get_db(credentials)
+    db = next(dependency)
+    db.bind = primary.engine
+    _served_by(db)
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    assert not router.is_pinned("token-1")
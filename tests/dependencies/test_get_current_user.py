@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from api.db.async_db import SyncSessionRunner
+from api.db.user_db import change_user_is_active, clear_login_session, establish_login_session
+from api.dependencies import auth as auth_dependency
+from api.dependencies.auth import get_current_user, get_current_user_async
+from api.utils import create_access_token, principal_cache, principal_cache_stats
+from api.utils.cache_utils import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def count_user_loads(monkeypatch):
+    calls = []
+    original = auth_dependency.get_user_data_by_id
+
+    def _counting(db, user_id):
+        calls.append(user_id)
+        return original(db, user_id)
+
+    monkeypatch.setattr(auth_dependency, "get_user_data_by_id", _counting)
+    return calls
+
+
+def _login(db, user):
+    session_id = establish_login_session(user)
+    db.flush()
+    token = create_access_token(user.id, user.role.name, session_id=session_id)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_principal_snapshot_matches_user(db, admin):
+    credentials = _login(db, admin)
+
+    principal = get_current_user(credentials, db)
+
+    assert principal.id == admin.id
+    assert principal.role.name == "admin"
+    assert principal.role.rank == admin.role.rank
+    assert principal.company_id == admin.company_id
+    assert principal.is_active is True
+
+
+def test_second_request_is_served_from_cache(db, admin, count_user_loads):
+    credentials = _login(db, admin)
+
+    first = get_current_user(credentials, db)
+    second = get_current_user(credentials, db)
+
+    assert first == second
+    assert len(count_user_loads) == 1
+    stats = principal_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_logout_invalidates_cached_principal(db, admin):
+    credentials = _login(db, admin)
+    get_current_user(credentials, db)
+
+    clear_login_session(admin)
+    db.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(credentials, db)
+    assert exc.value.status_code == 401
+
+
+def test_disabling_user_invalidates_cached_principal(db, admin):
+    credentials = _login(db, admin)
+    get_current_user(credentials, db)
+
+    change_user_is_active(db, admin, False)
+    db.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(credentials, db)
+    assert exc.value.status_code == 401
+
+
+def test_uncommitted_logout_keeps_cached_principal(db, admin):
+    credentials = _login(db, admin)
+    db.commit()
+    get_current_user(credentials, db)
+
+    clear_login_session(admin)
+    db.rollback()
+
+    assert principal_cache_stats().size == 1
+
+
+def test_principal_is_evicted_only_after_commit(db, admin):
+    credentials = _login(db, admin)
+    get_current_user(credentials, db)
+
+    clear_login_session(admin)
+    db.flush()
+    assert principal_cache_stats().size == 1
+
+    db.commit()
+    assert principal_cache_stats().size == 0
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(ttl_seconds=5, clock=lambda: now[0])
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    now[0] = 6.0
+    assert cache.get("key") is None
+    assert cache.stats().misses == 1
+
+
+def test_ttl_cache_evicts_oldest_when_full():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+
+def test_async_dependency_shares_principal_cache(db, admin, count_user_loads):
+    credentials = _login(db, admin)
+
+    first = asyncio.run(get_current_user_async(credentials, SyncSessionRunner(db)))
+    second = get_current_user(credentials, db)
+
+    assert first == second
+    assert first.id == admin.id
+    assert len(count_user_loads) == 1
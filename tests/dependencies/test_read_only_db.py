@@ -0,0 +1,169 @@
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from api.db.db_engine import Base
+from api.db.replicas import DatabaseNode, ReplicaRouter
+from api.dependencies import db as db_dependency
+from api.dependencies.db import read_only_options, transaction_stats
+from api.models.company import Company
+
+
+@pytest.fixture
+def primary(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(Company.__table__.insert().values(name="Primary", field="Testing"))
+
+    node = DatabaseNode("primary", engine, is_primary=True)
+    monkeypatch.setattr(db_dependency, "replica_router", ReplicaRouter(node, []))
+    return node
+
+
+def _open(dependency_factory):
+    dependency = dependency_factory(None)
+    return dependency, next(dependency)
+
+
+def test_read_session_rejects_flushed_writes(primary):
+    dependency, db = _open(db_dependency.get_read_db)
+
+    db.add(Company(name="New", field="Testing"))
+    with pytest.raises(InvalidRequestError):
+        db.flush()
+
+    dependency.close()
+
+
+def test_read_session_rejects_dml_statements(primary):
+    dependency, db = _open(db_dependency.get_read_db)
+
+    with pytest.raises(InvalidRequestError):
+        db.execute(update(Company).values(field="Changed"))
+
+    dependency.close()
+
+
+def test_read_session_is_counted_and_never_commits(primary):
+    before = transaction_stats()
+
+    dependency, db = _open(db_dependency.get_read_db)
+    assert db.query(Company).count() == 1
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    after = transaction_stats()
+    assert after["read_only"] == before["read_only"] + 1
+    assert after["commits"] == before["commits"]
+
+
+def test_snapshot_session_is_counted(primary):
+    before = transaction_stats()
+
+    dependency, db = _open(db_dependency.get_snapshot_db)
+    assert db.info["read_only"] is True
+    dependency.close()
+
+    assert transaction_stats()["snapshot"] == before["snapshot"] + 1
+
+
+def test_read_only_options_per_dialect():
+    assert read_only_options("sqlite") == {}
+    assert read_only_options("postgresql") == {"postgresql_readonly": True}
+    assert read_only_options("postgresql", snapshot=True) == {
+        "postgresql_readonly": True,
+        "isolation_level": "SERIALIZABLE",
+        "postgresql_deferrable": True,
+    }
+    assert read_only_options("postgresql", snapshot=True, replica=True) == {
+        "postgresql_readonly": True,
+        "isolation_level": "REPEATABLE READ",
+    }
+
+
+def test_snapshot_session_on_replica_does_not_request_serializable(primary, tmp_path, monkeypatch):
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    replica = DatabaseNode("replica", replica_engine)
+    monkeypatch.setattr(db_dependency, "replica_router", ReplicaRouter(primary, [replica]))
+
+    requested = []
+    real_options = db_dependency.read_only_options
+
+    def postgresql_options(dialect_name, snapshot=False, replica=False):
+        # Record what PostgreSQL would be asked for; SQLite takes no options
+        requested.append(real_options("postgresql", snapshot, replica))
+        return real_options(dialect_name, snapshot, replica)
+
+    monkeypatch.setattr(db_dependency, "read_only_options", postgresql_options)
+
+    dependency, db = _open(db_dependency.get_snapshot_db)
+    assert db.get_bind() is replica_engine
+    dependency.close()
+
+    assert requested == [{"postgresql_readonly": True, "isolation_level": "REPEATABLE READ"}]
+
+
+def test_stream_session_lives_until_the_stream_ends(primary):
+    before = transaction_stats()
+    open_db = db_dependency.get_stream_db(None)
+
+    with open_db() as db:
+        assert db.info["read_only"]
+        assert db.query(Company).count() == 1
+
+    assert not db.in_transaction()
+    assert transaction_stats()["read_only"] == before["read_only"] + 1
+
+
+def test_auth_session_connects_only_when_queried(primary):
+    before = transaction_stats()
+
+    dependency = db_dependency.get_auth_db()
+    db = next(dependency)
+    assert db.info["read_only"] is True
+    dependency.close()
+    assert transaction_stats() == before
+
+    dependency = db_dependency.get_auth_db()
+    db = next(dependency)
+    assert db.query(Company).count() == 1
+    with pytest.raises(InvalidRequestError):
+        db.execute(update(Company).values(field="Changed"))
+    dependency.close()
+
+    after = transaction_stats()
+    assert after["read_only"] == before["read_only"] + 1
+    assert (after["read_write"], after["commits"]) == (before["read_write"], before["commits"])
+
+
+def test_write_session_is_counted_only_when_a_transaction_began(primary, monkeypatch):
+    monkeypatch.setattr(db_dependency, "SessionLocal", sessionmaker(bind=primary.engine))
+    before = transaction_stats()
+
+    dependency, db = _open(db_dependency.get_db)
+    with pytest.raises(StopIteration):
+        next(dependency)
+    assert transaction_stats() == before
+
+    dependency, db = _open(db_dependency.get_db)
+    db.query(Company).count()
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    after = transaction_stats()
+    assert (after["read_write"], after["commits"]) == (before["read_write"] + 1, before["commits"] + 1)
+
+
+def test_async_auth_session_runs_lookups_read_only(primary):
+    import asyncio
+
+    async def lookup():
+        dependency = db_dependency.get_async_auth_db()
+        db = await dependency.__anext__()
+        count = await db.run_sync(lambda session: session.query(Company).count())
+        await dependency.aclose()
+        return count, db.sync_session.info["read_only"]
+
+    assert asyncio.run(lookup()) == (1, True)
@@ -21,6 +21,18 @@ def test_quantity_rejects_negative():
         Quantity.from_raw(-1)
 
 
+@pytest.mark.parametrize("raw", ["100000000", "99999999.995", "1e40"])
+def test_money_rejects_values_beyond_column_range(raw):
+    with pytest.raises(ValidationError):
+        Money.from_raw(raw)
+
+
+def test_quantity_rejects_values_beyond_column_range():
+    assert Quantity.from_raw(2**31 - 1).value == 2**31 - 1
+    with pytest.raises(ValidationError):
+        Quantity.from_raw(2**31)
+
+
 def test_item_draft_generates_sku():
     item = Item.draft("Test Item", "10.00", 5, company_id=1)
     assert item.sku is not None
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import threading
+
+import httpx
+import pytest
+
+from api.integrations.github_client import GitHubClient, GitHubError
+
+
+def stub_client(stub, **kwargs):
+    return GitHubClient(
+        oauth_url=stub.url,
+        api_url=stub.url,
+        client_id="id",
+        client_secret="secret",
+        retry_backoff=0,
+        **kwargs,
+    )
+
+
+def test_exchanges_code_and_fetches_user(github_stub):
+    client = stub_client(github_stub)
+
+    async def scenario():
+        try:
+            token = await client.exchange_code_for_token("code")
+            return await client.fetch_user(token)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario())["login"] == "octo"
+    assert github_stub.token_requests == 1
+
+
+def test_user_request_is_retried_on_gateway_errors(github_stub):
+    github_stub.user_failures = 1
+    client = stub_client(github_stub, max_retries=1)
+
+    assert asyncio.run(client.fetch_user("gh-token"))["id"] == 42
+    assert github_stub.user_requests == 2
+
+
+def test_retries_are_bounded(github_stub):
+    github_stub.user_failures = 5
+    client = stub_client(github_stub, max_retries=1)
+
+    with pytest.raises(GitHubError):
+        asyncio.run(client.fetch_user("gh-token"))
+    assert github_stub.user_requests == 2
+
+
+def test_rejected_code_raises():
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"error": "bad_verification_code"})
+    )
+    client = GitHubClient(oauth_url="http://github.test", transport=transport)
+
+    with pytest.raises(GitHubError):
+        asyncio.run(client.exchange_code_for_token("used-code"))
+
+
+def test_sent_token_exchange_is_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = GitHubClient(
+        oauth_url="http://github.test",
+        max_retries=2,
+        retry_backoff=0,
+        transport=httpx.MockTransport(handler),
+    )
+
+    with pytest.raises(GitHubError):
+        asyncio.run(client.exchange_code_for_token("code"))
+    assert len(calls) == 1
+
+
+def test_authorize_url_uses_injected_base_url():
+    client = GitHubClient(oauth_url="http://github.test/", client_id="abc")
+
+    url = client.authorize_url("state-1", "http://app/callback", "read:user")
+
+    assert url.startswith("http://github.test/login/oauth/authorize?client_id=abc")
+    assert "state=state-1" in url
+
+
+def _ok_transport():
+    return httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 42}))
+
+
+def test_client_of_a_running_loop_is_closed_on_loop_change():
+    client = GitHubClient(api_url="http://github.test", transport=_ok_transport())
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(client.fetch_user("gh-token"), other_loop).result(5)
+        old = client._client
+
+        asyncio.run(client.fetch_user("gh-token"))
+
+        # The old client is closed on its own loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(5)
+        assert old.is_closed
+        assert client._client is not old
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(5)
+        other_loop.close()
+
+
+def test_client_of_a_finished_loop_is_reported(caplog):
+    client = GitHubClient(api_url="http://github.test", transport=_ok_transport())
+    asyncio.run(client.fetch_user("gh-token"))
+
+    with caplog.at_level(logging.WARNING, logger="api.integrations.github_client"):
+        asyncio.run(client.fetch_user("gh-token"))
+
+    assert "was not closed" in caplog.text
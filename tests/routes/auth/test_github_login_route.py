@@ -1,5 +1,59 @@
+import httpx
+
+from api.db.oauth_db import create_oauth_account
+from api.integrations.github_client import GitHubClient
+from api.services import auth_service
+from api.utils import create_oauth_state
+
+
 def test_github_login_redirect_url(client_with_db):
     response = client_with_db.get("/api/auth/github/login")
 
     assert response.status_code == 200
     assert "redirect_url" in response.json()
+
+
+def test_github_callback_logs_in_linked_user(client_with_db, db, admin, github_stub, monkeypatch):
+    monkeypatch.setattr(
+        auth_service,
+        "github_client",
+        GitHubClient(oauth_url=github_stub.url, api_url=github_stub.url),
+    )
+    create_oauth_account(
+        db,
+        user_id=admin.id,
+        provider="github",
+        provider_user_id="42",
+        provider_email="octo@example.com",
+    )
+    db.commit()
+
+    response = client_with_db.get(
+        "/api/auth/github/callback",
+        params={"code": "gh-code", "state": create_oauth_state(user_id=None)},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 307
+    assert "/auth/oauth-success?code=" in response.headers["location"]
+    assert admin.session_id is not None
+
+
+def test_github_callback_redirects_with_error_when_github_is_down(client_with_db, monkeypatch):
+    def unreachable(request):
+        raise httpx.ConnectError("down", request=request)
+
+    monkeypatch.setattr(
+        auth_service,
+        "github_client",
+        GitHubClient(retry_backoff=0, transport=httpx.MockTransport(unreachable)),
+    )
+
+    response = client_with_db.get(
+        "/api/auth/github/callback",
+        params={"code": "gh-code", "state": create_oauth_state(user_id=None)},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 307
+    assert "error=" in response.headers["location"]
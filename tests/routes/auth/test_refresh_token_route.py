@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+from api.db.refresh_token_db import get_refresh_token_by_hash
+from api.utils import create_access_token
+from api.utils.auth_utils import hash_refresh_token
+
+
+def login(client):
+    response = client.post(
+        "/api/auth/login",
+        json={"identifier": "admin_user", "password": "admin123"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def refresh(client, refresh_token):
+    return client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_refresh_issues_access_token_and_rotates(client_with_db, db, admin):
+    tokens = login(client_with_db)
+    assert tokens["refresh_token"]
+
+    response = refresh(client_with_db, tokens["refresh_token"])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["refresh_token"] != tokens["refresh_token"]
+    assert get_refresh_token_by_hash(db, hash_refresh_token(tokens["refresh_token"])).revoked_at
+
+    me = client_with_db.get(
+        "/api/users/me",
+        headers={"Authorization": f"Bearer {body['access_token']}"},
+    )
+    assert me.status_code == 200
+
+
+def test_only_token_digest_is_stored(client_with_db, db, admin):
+    tokens = login(client_with_db)
+
+    stored = get_refresh_token_by_hash(db, hash_refresh_token(tokens["refresh_token"]))
+
+    assert stored.session_id == admin.session_id
+    assert stored.token_hash != tokens["refresh_token"]
+
+
+def test_rotated_token_reuse_within_grace_is_tolerated(client_with_db, admin):
+    tokens = login(client_with_db)
+    assert refresh(client_with_db, tokens["refresh_token"]).status_code == 200
+
+    # e.g. two browser tabs refreshing at the same moment
+    assert refresh(client_with_db, tokens["refresh_token"]).status_code == 200
+
+
+def test_rotated_token_reuse_revokes_session(client_with_db, db, admin):
+    tokens = login(client_with_db)
+    latest = refresh(client_with_db, tokens["refresh_token"]).json()["refresh_token"]
+
+    stored = get_refresh_token_by_hash(db, hash_refresh_token(tokens["refresh_token"]))
+    stored.revoked_at = datetime.utcnow() - timedelta(minutes=5)
+    db.commit()
+
+    response = refresh(client_with_db, tokens["refresh_token"])
+
+    assert response.status_code == 401
+    assert admin.session_id is None
+    assert refresh(client_with_db, latest).status_code == 401
+
+
+def test_logout_revokes_refresh_tokens(client_with_db, admin):
+    tokens = login(client_with_db)
+
+    client_with_db.post(
+        "/api/auth/logout",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+
+    assert refresh(client_with_db, tokens["refresh_token"]).status_code == 401
+
+
+def test_unknown_refresh_token_is_rejected(client_with_db):
+    assert refresh(client_with_db, "not-a-token").status_code == 401
+
+
+def test_expired_access_token_keeps_session(client_with_db, admin):
+    tokens = login(client_with_db)
+    session_id = admin.session_id
+    expired = create_access_token(admin.id, "admin", session_id=session_id, expires_in=-10)
+
+    response = client_with_db.get("/api/users/me", headers={"Authorization": f"Bearer {expired}"})
+
+    assert response.status_code == 401
+    assert admin.session_id == session_id
+    assert refresh(client_with_db, tokens["refresh_token"]).status_code == 200
+
+
+def test_login_replaces_session_without_live_refresh_token(client_with_db, db, admin):
+    admin.session_id = "abandoned-session"
+    db.commit()
+
+    tokens = login(client_with_db)
+
+    assert admin.session_id != "abandoned-session"
+    assert tokens["refresh_token"]
+
+
+def test_login_refused_while_session_is_active(client_with_db, admin):
+    login(client_with_db)
+
+    response = client_with_db.post(
+        "/api/auth/login",
+        json={"identifier": "admin_user", "password": "admin123"},
+    )
+
+    assert response.status_code == 409
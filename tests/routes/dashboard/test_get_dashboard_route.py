@@ -0,0 +1,43 @@
+import pytest
+
+from api.services.dashboard_service import dashboard_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_dashboard_cache():
+    dashboard_cache.clear()
+    yield
+    dashboard_cache.clear()
+
+
+def test_admin_dashboard_contains_company_widgets(auth_client_factory, admin, item):
+    client = auth_client_factory(admin)
+
+    response = client.get("/api/dashboard")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["user_stats"]) == {"total_users", "online_users"}
+    assert set(body["order_counts"]) == {"pending", "completed", "cancelled"}
+    assert body["low_stock_items"]["total"] == 1
+    assert body["low_stock_items"]["data"][0]["name"] == item.name
+    assert body["companies"] is None
+
+
+def test_superadmin_dashboard_lists_companies(auth_client_factory, superadmin, company):
+    client = auth_client_factory(superadmin)
+
+    body = client.get("/api/dashboard").json()
+
+    assert body["companies"]["total"] >= 1
+    assert body["low_stock_items"] is None
+
+
+def test_dashboard_is_cached_per_tenant(auth_client_factory, admin, manager, item):
+    auth_client_factory(admin).get("/api/dashboard")
+    auth_client_factory(admin).get("/api/dashboard")
+    auth_client_factory(manager).get("/api/dashboard")
+
+    stats = dashboard_cache.stats()
+    assert stats.hits == 1
+    assert stats.size == 2
@@ -0,0 +1,56 @@
+import json
+
+from api.models.item import Item
+
+
+def test_export_csv_can_be_imported_again(auth_client_factory, admin, item):
+    client = auth_client_factory(admin)
+
+    response = client.get("/api/items/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="items.csv"'
+    assert response.text == (
+        "id,sku,name,price,quantity,is_active\n"
+        f"{item.id},TEST-001,Test Item,100.00,10,true\n"
+    )
+
+    reimport = client.post(
+        "/api/items/import",
+        content=response.content,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert reimport.json()["imported"] == 1
+
+
+def test_export_ndjson_lists_items_by_id(auth_client_factory, db, manager, company):
+    db.add_all(
+        Item(name=f"Item {n}", sku=f"EX-{n}", price="1.50", quantity=n, company_id=company.id)
+        for n in range(5)
+    )
+    db.commit()
+    client = auth_client_factory(manager)
+
+    response = client.get("/api/items/export", params={"format": "ndjson"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.content.splitlines()]
+    assert [row["sku"] for row in rows] == [f"EX-{n}" for n in range(5)]
+    assert rows[0]["price"] == "1.50"
+
+
+def test_export_rejects_unknown_format(auth_client_factory, admin):
+    client = auth_client_factory(admin)
+
+    response = client.get("/api/items/export", params={"format": "xlsx"})
+
+    assert response.status_code == 422
+
+
+def test_employee_cannot_export(auth_client_factory, employee):
+    client = auth_client_factory(employee)
+
+    response = client.get("/api/items/export")
+
+    assert response.status_code == 403
@@ -0,0 +1,25 @@
+def test_admin_can_import_csv(auth_client_factory, admin):
+    client = auth_client_factory(admin)
+
+    response = client.post(
+        "/api/items/import",
+        content=b"\xef\xbb\xbfname,sku,price,quantity\r\nRoute Item,RT-1,19.99,3\r\nBroken,RT-2,x,1\r\n",
+        headers={"Content-Type": "text/csv; charset=utf-8"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["processed"], body["imported"], body["failed"]) == (2, 1, 1)
+    assert body["errors"] == [{"line": 3, "error": "Invalid price", "sku": "RT-2"}]
+
+
+def test_import_rejects_unknown_format(auth_client_factory, admin):
+    client = auth_client_factory(admin)
+
+    response = client.post(
+        "/api/items/import",
+        content=b"<items/>",
+        headers={"Content-Type": "application/xml"},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,18 @@
+def test_superadmin_reads_worker_metrics(auth_client_factory, superadmin):
+    client = auth_client_factory(superadmin)
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {"read_write", "read_only", "snapshot", "commits", "rollbacks"} <= set(body["transactions"])
+    assert "healthy_replicas" in body["replicas"]
+    assert {"pending", "completed", "rehashed"} <= set(body["password_hashing"])
+    assert set(body["principal_cache"]) == {"hits", "misses", "invalidations", "size"}
+    assert set(body["dashboard_cache"]) == {"hits", "misses", "invalidations", "size"}
+
+
+def test_metrics_are_superadmin_only(auth_client_factory, admin):
+    client = auth_client_factory(admin)
+
+    assert client.get("/api/metrics").status_code == 403
@@ -11,3 +11,27 @@ def test_employee_can_create_order(auth_client_factory, employee, item):
 
     assert response.status_code == 200
     assert response.json()["message"] == "Order was successfully created."
+
+
+def test_bulk_complete_returns_outcomes(auth_client_factory, employee, order):
+    client = auth_client_factory(employee)
+
+    response = client.post("/api/orders/bulk/complete", json={"order_ids": [order.id, 999999]})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "succeeded": 1,
+        "failed": 1,
+        "results": [
+            {"order_id": order.id, "success": True, "status": "completed", "error": None},
+            {"order_id": 999999, "success": False, "status": None, "error": "Order not found"},
+        ],
+    }
+
+
+def test_bulk_cancel_requires_order_ids(auth_client_factory, employee):
+    client = auth_client_factory(employee)
+
+    response = client.post("/api/orders/bulk/cancel", json={"order_ids": []})
+
+    assert response.status_code == 422
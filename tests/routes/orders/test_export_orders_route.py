@@ -0,0 +1,27 @@
+import csv
+import io
+
+
+def test_export_orders_csv(auth_client_factory, admin, order):
+    client = auth_client_factory(admin)
+
+    response = client.get("/api/orders/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="orders.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["id"], row["status"], row["completed_at"]) for row in rows] == [
+        (str(order.id), "pending", "")
+    ]
+    assert rows[0]["created_at"] == order.created_at.isoformat()
+
+
+def test_export_orders_is_scoped_to_company(auth_client_factory, db, admin, order):
+    order.company_id = order.company_id + 1000
+    db.commit()
+    client = auth_client_factory(admin)
+
+    response = client.get("/api/orders/export", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.content == b""
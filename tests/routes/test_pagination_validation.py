@@ -19,3 +19,71 @@ def test_paginated_endpoints_reject_invalid_limit(
     response = client.post(endpoint, json={"limit": -1, "offset": 0})
 
     assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "endpoint, role",
+    [
+        ("/api/users/search", "admin"),
+        ("/api/items/search", "admin"),
+        ("/api/orders/search", "admin"),
+        ("/api/companies/search", "superadmin"),
+    ],
+)
+def test_paginated_endpoints_reject_malformed_cursor(
+    auth_client_factory,
+    request,
+    endpoint,
+    role,
+):
+    client = auth_client_factory(request.getfixturevalue(role))
+
+    response = client.post(endpoint, json={"limit": 10, "after": "not-a-cursor"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "endpoint, role, filters",
+    [
+        ("/api/users/search", "admin", {"password_hash": "x"}),
+        ("/api/items/search", "admin", {"quantity": {"like": 1}}),
+        ("/api/orders/search", "admin", {"created_at": {"range": ["yesterday", None]}}),
+        ("/api/companies/search", "superadmin", {"name": {"in": []}}),
+    ],
+)
+def test_paginated_endpoints_reject_unsupported_filters(
+    auth_client_factory,
+    request,
+    endpoint,
+    role,
+    filters,
+):
+    client = auth_client_factory(request.getfixturevalue(role))
+
+    response = client.post(endpoint, json={"limit": 10, "filters": filters})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "endpoint, role, sort",
+    [
+        ("/api/users/search", "admin", [{"field": "password_hash"}]),
+        ("/api/items/search", "admin", [{"field": "name", "direction": "up"}]),
+        ("/api/orders/search", "admin", [{"field": "completed_at", "direction": "desc"}]),
+        ("/api/companies/search", "superadmin", [{"field": "name"}, {"field": "name"}]),
+    ],
+)
+def test_paginated_endpoints_reject_unsupported_sort(
+    auth_client_factory,
+    request,
+    endpoint,
+    role,
+    sort,
+):
+    client = auth_client_factory(request.getfixturevalue(role))
+
+    response = client.post(endpoint, json={"limit": 10, "sort": sort})
+
+    assert response.status_code == 422
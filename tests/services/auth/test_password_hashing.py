@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from api.config import PASSWORD_HASH_METHOD
+from api.services.auth_service import verify_user
+from api.utils import PasswordHasherBusyError, password_hash_stats
+from api.utils import password_utils
+from api.utils.password_utils import PasswordHasher
+
+
+def test_login_upgrades_outdated_hash(db, admin):
+    admin.password_hash = generate_password_hash("admin123", method="pbkdf2:sha256:1000")
+    db.commit()
+    rehashed = password_hash_stats()["rehashed"]
+
+    verify_user("admin_user", "admin123", db)
+
+    assert admin.password_hash.startswith(PASSWORD_HASH_METHOD + "$")
+    assert password_hash_stats()["rehashed"] == rehashed + 1
+
+    verify_user("admin_user", "admin123", db)
+    assert password_hash_stats()["rehashed"] == rehashed + 1
+
+
+def test_pool_hashes_in_worker_process():
+    hasher = PasswordHasher(workers=1, max_pending=2, queue_timeout=5, method="pbkdf2:sha256:1000")
+    try:
+        password_hash = hasher.hash("secret")
+
+        assert hasher.verify("secret", password_hash)
+        assert not hasher.verify("wrong", password_hash)
+        assert not hasher.needs_rehash(password_hash)
+        assert hasher.stats()["completed"] == 3
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_pool_rejects_after_timeout(monkeypatch):
+    hasher = PasswordHasher(workers=0, max_pending=1, queue_timeout=0.05, method="pbkdf2:sha256:1000")
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash(password, method):
+        started.set()
+        release.wait(5)
+        return "hash"
+
+    monkeypatch.setattr(password_utils, "generate_password_hash", slow_hash)
+    worker = threading.Thread(target=hasher.hash, args=("secret",))
+    worker.start()
+    started.wait(5)
+
+    with pytest.raises(PasswordHasherBusyError):
+        hasher.hash("other")
+    stats = hasher.stats()
+
+    release.set()
+    worker.join()
+    assert (stats["pending"], stats["rejected"]) == (1, 1)
+    assert hasher.stats()["peak_pending"] == 1
+
+
+@pytest.mark.parametrize("method", ["pbkdf2", "pbkdf2:sha256", "scrypt"])
+def test_bare_method_does_not_rehash_its_own_hashes(method):
+    hasher = PasswordHasher(workers=0, max_pending=1, queue_timeout=5, method=method)
+
+    password_hash = hasher.hash("secret")
+
+    assert password_hash.split("$", 1)[0] != method  # werkzeug stores the expanded form
+    assert not hasher.needs_rehash(password_hash)
+    assert hasher.needs_rehash(generate_password_hash("secret", method="pbkdf2:sha256:1000"))
+
+
+@pytest.mark.parametrize(
+    "method",
+    ["scrypt", "scrypt:16384:8:1", "pbkdf2", "pbkdf2:sha512", "pbkdf2:sha256:1000"],
+)
+def test_expanded_method_matches_stored_prefix(method):
+    stored = generate_password_hash("secret", method=method).split("$", 1)[0]
+
+    assert password_utils.expand_hash_method(method) == stored
+
+
+def test_invalid_method_fails_at_construction():
+    with pytest.raises(ValueError):
+        PasswordHasher(workers=0, max_pending=1, queue_timeout=5, method="md5")
+
+
+def test_pool_recovers_from_killed_worker():
+    hasher = PasswordHasher(workers=1, max_pending=2, queue_timeout=5, method="pbkdf2:sha256:1000")
+    try:
+        hasher.hash("secret")
+        for process in list(hasher._executor._processes.values()):
+            process.kill()
+            process.join()
+
+        password_hash = hasher.hash("secret")
+
+        assert hasher.verify("secret", password_hash)
+        assert hasher.stats()["pool_restarts"] == 1
+    finally:
+        hasher.shutdown()
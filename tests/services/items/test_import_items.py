@@ -0,0 +1,174 @@
+import pytest
+
+from api.domain import ForbiddenError, ValidationError
+from api.models.item import Item
+from api.services.item_service import import_items
+from api.utils.import_utils import iter_records
+
+
+def _chunks(text, size=7):
+    data = text.encode("utf-8")
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+def _import(db, user, text, fmt="csv"):
+    records = iter_records(_chunks(text), fmt, required=("name", "price", "quantity"))
+    return import_items(db=db, current_user=user, records=records)
+
+
+def _catalog(db, company):
+    return {
+        item.sku: (item.name, str(item.price), item.quantity)
+        for item in db.query(Item).filter(Item.company_id == company.id)
+    }
+
+
+def test_csv_import_upserts_on_sku(db, admin, company):
+    _import(db, admin, "name,sku,price,quantity\nDock,DCK-1,10,5\n")
+
+    report = _import(
+        db,
+        admin,
+        "name,sku,price,quantity\n"
+        "\"Dock, USB-C\",DCK-1,12.50,7\n"
+        "Cable,CBL-1,3,100\n",
+    )
+
+    assert (report.processed, report.imported, report.failed) == (2, 2, 0)
+    catalog = _catalog(db, company)
+    assert catalog["DCK-1"] == ("Dock, USB-C", "12.50", 7)
+    assert catalog["CBL-1"][0] == "Cable"
+
+
+def test_invalid_rows_are_reported_and_skipped(db, admin, company):
+    report = _import(
+        db,
+        admin,
+        "name,sku,price,quantity\n"
+        "Good,G-1,1,1\n"
+        ",G-2,1,1\n"
+        "Bad price,G-3,abc,1\n"
+        "Negative,G-4,1,-5\n"
+        "Bad sku,G 5,1,1\n",
+    )
+
+    assert (report.processed, report.imported, report.failed) == (5, 1, 4)
+    assert [(error.line, error.sku) for error in report.errors] == [
+        (3, "G-2"), (4, "G-3"), (5, "G-4"), (6, "G 5"),
+    ]
+    assert set(_catalog(db, company)) == {"G-1"}
+
+
+def test_ndjson_import_and_duplicate_skus(db, admin, company):
+    report = _import(
+        db,
+        admin,
+        '{"name": "Shelf", "sku": "SH-1", "price": 20, "quantity": 2}\n'
+        "not json\n"
+        '{"name": "Shelf XL", "sku": "SH-1", "price": "25.5", "quantity": 1}\n'
+        '{"name": "No sku", "price": 1, "quantity": 1}',
+        fmt="ndjson",
+    )
+
+    assert (report.processed, report.imported, report.failed) == (4, 2, 1)
+    assert report.errors[0].line == 2
+    catalog = _catalog(db, company)
+    assert catalog["SH-1"] == ("Shelf XL", "25.50", 1)  # last row for a SKU wins
+    assert len(catalog) == 2
+
+
+def test_import_writes_in_batches(db, admin, company, monkeypatch):
+    from api.services import item_service
+
+    calls = []
+    original = item_service.db_upsert_items
+    monkeypatch.setattr(item_service, "IMPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(
+        item_service, "db_upsert_items", lambda db, rows: calls.append(len(rows)) or original(db, rows)
+    )
+
+    lines = "".join(f"Item {index},SKU-{index},1,1\n" for index in range(5))
+    report = _import(db, admin, "name,sku,price,quantity\n" + lines)
+
+    assert calls == [2, 2, 1]
+    assert report.imported == 5
+
+
+def test_missing_header_column_rejects_file(db, admin):
+    with pytest.raises(ValidationError):
+        _import(db, admin, "name,sku\nDock,DCK-1\n")
+
+
+def test_employee_cannot_import(db, employee):
+    with pytest.raises(ForbiddenError):
+        _import(db, employee, "name,price,quantity\nDock,1,1\n")
+
+
+def test_generated_sku_never_overwrites_existing_item(db, admin, company, monkeypatch):
+    from api.domain import SkuGenerator
+
+    _import(db, admin, "name,sku,price,quantity\nDock,DOCK-000001,10,5\n")
+    generated = iter(["DOCK-000001", "DOCK-000002"])
+    monkeypatch.setattr(SkuGenerator, "generate", staticmethod(lambda name: next(generated)))
+
+    report = _import(db, admin, "name,price,quantity\nDock,99,1\n")
+
+    assert (report.imported, report.failed) == (1, 0)
+    catalog = _catalog(db, company)
+    assert catalog["DOCK-000001"] == ("Dock", "10.00", 5)
+    assert catalog["DOCK-000002"] == ("Dock", "99.00", 1)
+
+
+def test_row_without_free_generated_sku_is_reported(db, admin, company, monkeypatch):
+    from api.domain import SkuGenerator
+
+    _import(db, admin, "name,sku,price,quantity\nDock,DOCK-000001,10,5\n")
+    monkeypatch.setattr(SkuGenerator, "generate", staticmethod(lambda name: "DOCK-000001"))
+
+    report = _import(db, admin, "name,price,quantity\nDock,99,1\n")
+
+    assert (report.imported, report.failed) == (0, 1)
+    assert report.errors[0].line == 2
+    assert _catalog(db, company)["DOCK-000001"] == ("Dock", "10.00", 5)
+
+
+def test_out_of_range_values_are_reported_next_to_valid_rows(db, admin, company):
+    report = _import(
+        db,
+        admin,
+        "name,sku,price,quantity\n"
+        "Good,OK-1,1,1\n"
+        "Pricey,BIG-1,100000000,1\n"
+        "Hoard,BIG-2,1,2147483648\n"
+        "Also good,OK-2,99999999.99,2147483647\n",
+    )
+
+    assert (report.processed, report.imported, report.failed) == (4, 2, 2)
+    assert [(error.line, error.sku) for error in report.errors] == [(3, "BIG-1"), (4, "BIG-2")]
+    assert set(_catalog(db, company)) == {"OK-1", "OK-2"}
+
+
+def test_rejected_batch_is_retried_row_by_row(db, admin, company, monkeypatch):
+    from sqlalchemy.exc import IntegrityError
+
+    from api.services import item_service
+
+    original = item_service.db_upsert_items
+
+    def upsert(db, rows):
+        if any(row["sku"] == "BAD-1" for row in rows):
+            raise IntegrityError("INSERT INTO items ...", {}, Exception("value out of range"))
+        return original(db, rows)
+
+    _import(db, admin, "name,sku,price,quantity\nKept,KEPT-1,1,1\n")
+    monkeypatch.setattr(item_service, "db_upsert_items", upsert)
+
+    report = _import(
+        db,
+        admin,
+        "name,sku,price,quantity\nA,OK-1,1,1\nB,BAD-1,1,1\nC,OK-2,1,1\n",
+    )
+
+    assert (report.imported, report.failed) == (2, 1)
+    assert (report.errors[0].line, report.errors[0].sku) == (3, "BAD-1")
+    assert set(_catalog(db, company)) == {"KEPT-1", "OK-1", "OK-2"}
@@ -1,3 +1,5 @@
+import pytest
+
 from api.domain.mappers.item_mapper import item_domain_to_row
 from api.services.item_service import paginate_items
 
@@ -34,3 +36,172 @@ def test_paginate_items_other_company_excluded(db, admin, item, company2):
     )
 
     assert result.total == 0
+
+
+def _add_items(db, company, quantities):
+    from api.models.item import Item
+
+    for index, quantity in enumerate(quantities):
+        db.add(
+            Item(
+                name=f"Cursor Item {index}",
+                sku=f"CUR-{index:03d}",
+                price=10,
+                quantity=quantity,
+                company_id=company.id,
+                is_active=True,
+            )
+        )
+    db.flush()
+
+
+def test_paginate_items_cursor_walks_all_pages(db, admin, company):
+    _add_items(db, company, [5, 3, 5, 1, 3])
+
+    seen = []
+    after = None
+    while True:
+        result = paginate_items(
+            db=db,
+            current_user=admin,
+            limit=2,
+            offset=0,
+            filters={"low_stock": True},
+            after=after,
+        )
+        assert result.total == 5
+        seen.extend(result.data)
+        after = result.next_cursor
+        if after is None:
+            break
+
+    assert len({item.id for item in seen}) == 5
+    assert [item.quantity.value for item in seen] == [1, 3, 3, 5, 5]
+
+
+def test_paginate_items_cursor_for_other_sort_is_rejected(db, admin, company):
+    from api.domain import ValidationError
+
+    _add_items(db, company, [1, 2, 3])
+    first = paginate_items(db=db, current_user=admin, limit=1, offset=0, filters={})
+
+    with pytest.raises(ValidationError):
+        paginate_items(
+            db=db,
+            current_user=admin,
+            limit=1,
+            offset=0,
+            filters={"low_stock": True},
+            after=first.next_cursor,
+        )
+
+
+def test_paginate_items_total_and_page_in_one_statement(db, admin, company, count_statements):
+    _add_items(db, company, [1, 2, 3, 4, 5])
+    count_statements.clear()
+
+    first = paginate_items(db=db, current_user=admin, limit=2, offset=0, filters={})
+    second = paginate_items(
+        db=db, current_user=admin, limit=2, offset=0, filters={}, after=first.next_cursor
+    )
+
+    assert len(count_statements) == 2
+    assert first.total == second.total == 5
+    assert first.total_is_estimate is False
+
+
+def test_paginate_items_total_past_last_page(db, admin, company):
+    _add_items(db, company, [1, 2])
+
+    result = paginate_items(db=db, current_user=admin, limit=10, offset=50, filters={})
+
+    assert result.data == []
+    assert result.total == 2
+
+
+def test_paginate_items_uses_planner_estimate_above_threshold(db, admin, company, monkeypatch):
+    from api.db import pagination
+
+    _add_items(db, company, [1, 2])
+    monkeypatch.setattr(pagination, "PAGINATION_APPROX_TOTAL_THRESHOLD", 1000)
+    monkeypatch.setattr(pagination, "estimate_total", lambda query: 2_500_000)
+
+    result = paginate_items(db=db, current_user=admin, limit=1, offset=0, filters={})
+
+    assert result.total == 2_500_000
+    assert result.total_is_estimate is True
+    assert len(result.data) == 1
+
+
+def test_paginate_items_sorted_with_id_tie_breaker(db, admin, company):
+    from api.models.item import Item
+
+    for index, price in enumerate([30, 10, 30, 20, 10]):
+        db.add(Item(name=f"Sorted {index}", sku=f"SRT-{index}", price=price,
+                    quantity=1, company_id=company.id, is_active=True))
+    db.flush()
+
+    seen = []
+    after = None
+    while True:
+        result = paginate_items(
+            db=db,
+            current_user=admin,
+            limit=2,
+            offset=0,
+            filters={},
+            after=after,
+            sort=[("price", "desc")],
+        )
+        seen.extend(result.data)
+        after = result.next_cursor
+        if after is None:
+            break
+
+    keys = [(item.price.value, item.id) for item in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert len(keys) == 5
+
+
+def test_paginate_items_rejects_unknown_sort_and_foreign_cursor(db, admin, company):
+    from api.domain import ValidationError
+
+    _add_items(db, company, [1, 2, 3])
+    ascending = paginate_items(
+        db=db, current_user=admin, limit=1, offset=0, filters={}, sort=[("name", "asc")]
+    )
+
+    with pytest.raises(ValidationError):
+        paginate_items(db=db, current_user=admin, limit=1, offset=0, filters={},
+                       sort=[("quantity", "asc")])
+
+    with pytest.raises(ValidationError):
+        paginate_items(db=db, current_user=admin, limit=1, offset=0, filters={},
+                       sort=[("name", "desc")], after=ascending.next_cursor)
+
+
+@pytest.mark.parametrize(
+    "dialect_module, placeholder",
+    [("psycopg2", "%(company_id_1)s"), ("asyncpg", "$1")],
+)
+def test_planner_estimate_statement_uses_driver_placeholders(db, admin, dialect_module, placeholder):
+    import importlib
+
+    from api.db.pagination import ExplainJson
+    from api.models.item import Item
+
+    dialect = importlib.import_module(f"sqlalchemy.dialects.postgresql.{dialect_module}").dialect()
+    query = db.query(Item).filter(Item.company_id == admin.company_id)
+
+    compiled = ExplainJson(query.statement).compile(dialect=dialect)
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert placeholder in str(compiled)
+    assert list(compiled.params.values()) == [admin.company_id]
+
+
+def test_planner_estimate_is_skipped_off_postgresql(db):
+    from api.db.pagination import estimate_total
+    from api.models.item import Item
+
+    assert estimate_total(db.query(Item)) is None
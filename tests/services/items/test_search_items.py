@@ -0,0 +1,67 @@
+from api.models.item import Item
+from api.services.item_service import paginate_items
+
+
+def _add(db, company, rows):
+    for name, sku in rows:
+        db.add(Item(name=name, sku=sku, price=10, quantity=5,
+                    company_id=company.id, is_active=True))
+    db.flush()
+
+
+def _search(db, user, q, **kwargs):
+    return paginate_items(
+        db=db, current_user=user, limit=kwargs.pop("limit", 10), offset=0, filters={}, q=q, **kwargs
+    )
+
+
+def test_search_matches_all_words_in_any_order(db, admin, company):
+    _add(db, company, [
+        ("USB-C Dock", "DCK-100"),
+        ("Docking station USB 3.0", "DCK-200"),
+        ("USB cable", "CBL-1"),
+        ("Loading dock ramp", "RMP-1"),
+    ])
+
+    result = _search(db, admin, "dock usb")
+
+    assert {item.sku for item in result.data} == {"DCK-100", "DCK-200"}
+    assert result.total == 2
+
+
+def test_search_ranks_exact_sku_and_prefix_first(db, admin, company):
+    _add(db, company, [
+        ("Cable for ab-12 adapter", "CBL-9"),
+        ("Adapter", "AB-12"),
+        ("AB-12 spare", "SPR-1"),
+    ])
+
+    result = _search(db, admin, "ab-12")
+
+    assert [item.sku for item in result.data] == ["AB-12", "SPR-1", "CBL-9"]
+
+
+def test_search_cursor_walks_ranked_pages(db, admin, company):
+    _add(db, company, [(f"Widget {index}", f"W-{index}") for index in range(5)] + [("Blue", "WIDGET")])
+
+    seen = []
+    after = None
+    while True:
+        result = _search(db, admin, "widget", limit=2, after=after)
+        seen.extend(item.sku for item in result.data)
+        after = result.next_cursor
+        if after is None:
+            break
+
+    assert seen[0] == "WIDGET"
+    assert sorted(seen[1:]) == [f"W-{index}" for index in range(5)]
+
+
+def test_search_treats_wildcards_literally_and_respects_tenant(db, admin, company, company2):
+    _add(db, company, [("100% cotton", "TX-1"), ("1000 cotton", "TX-2")])
+    _add(db, company2, [("100% cotton", "TX-1")])
+
+    result = _search(db, admin, "100%")
+
+    assert [item.sku for item in result.data] == ["TX-1"]
+    assert result.data[0].company_id == company.id
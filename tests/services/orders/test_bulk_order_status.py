@@ -0,0 +1,96 @@
+import pytest
+
+from api.models import Item, Order
+from api.services.order_service import (
+    cancel_order,
+    cancel_orders,
+    complete_orders,
+    count_orders_by_status,
+    create_order,
+)
+
+
+@pytest.fixture
+def second_item(db, company):
+    item = Item(
+        name="Second Item",
+        sku="TEST-002",
+        price=50,
+        quantity=1,
+        company_id=company.id,
+        is_active=True,
+    )
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def _create(db, employee, order_type, lines):
+    create_order(
+        db=db,
+        current_user=employee,
+        order_type=order_type,
+        items=[{"item_id": item.id, "quantity": quantity} for item, quantity in lines],
+    )
+    return db.query(Order).order_by(Order.id.desc()).first()
+
+
+def test_complete_orders_reports_every_order(db, employee, item, company2):
+    restock = _create(db, employee, "restock", [(item, 3)])
+    sale = _create(db, employee, "sale", [(item, 1)])
+    cancelled = _create(db, employee, "sale", [(item, 1)])
+    cancel_order(db, cancelled.id, employee)
+    foreign = Order(status="pending", order_type="sale", user_id=employee.id, company_id=company2.id)
+    db.add(foreign)
+    db.flush()
+
+    result = complete_orders(db, employee, [restock.id, sale.id, cancelled.id, foreign.id, 999999, sale.id])
+
+    assert [(o.order_id, o.succeeded) for o in result.outcomes] == [
+        (restock.id, True),
+        (sale.id, True),
+        (cancelled.id, False),
+        (foreign.id, False),
+        (999999, False),
+    ]
+    assert (result.succeeded, result.failed) == (2, 3)
+    assert result.outcomes[2].error == "Order is already cancelled"
+    assert result.outcomes[4].error == "Order not found"
+
+    db.refresh(item)
+    assert item.quantity == 10 - 2 + 1 + 3  # two sales taken, one cancelled, restock added
+    assert (restock.status, sale.status, foreign.status) == ("completed", "completed", "pending")
+    # Dashboard counters cover sales only
+    assert count_orders_by_status(db, employee).as_dict() == {
+        "pending": 0,
+        "completed": 1,
+        "cancelled": 1,
+    }
+
+
+def test_cancel_orders_skips_orders_without_stock(db, employee, item, second_item):
+    fits = _create(db, employee, "restock", [(item, 4)])
+    short = _create(db, employee, "restock", [(second_item, 3)])
+    partly_short = _create(db, employee, "restock", [(item, 2), (second_item, 5)])
+
+    result = cancel_orders(db, employee, [fits.id, short.id, partly_short.id])
+
+    assert [o.succeeded for o in result.outcomes] == [True, False, False]
+    assert result.outcomes[1].error == "Insufficient stock for 'Second Item'"
+    db.refresh(item)
+    db.refresh(second_item)
+    assert item.quantity == 6  # partly_short's adjustment was reverted
+    assert second_item.quantity == 1
+    assert (fits.status, short.status, partly_short.status) == ("cancelled", "pending", "pending")
+
+
+def test_bulk_statements_do_not_grow_with_order_count(db, employee, item, count_statements):
+    def run(count):
+        orders = [_create(db, employee, "restock", [(item, 1)]) for _ in range(count)]
+        count_statements.clear()
+        complete_orders(db, employee, [order.id for order in orders])
+        db.flush()
+        return len(count_statements)
+
+    assert run(2) == run(10)
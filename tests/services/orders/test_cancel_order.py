@@ -41,3 +41,44 @@ def test_cancel_order_twice(db, order, employee):
 def test_cancel_order_not_found(db, employee):
     with pytest.raises(NotFoundError):
         cancel_order(db, 999, employee)
+
+
+def test_cancel_order_query_count_independent_of_lines(db, employee, company, count_statements):
+    from api.models import Item
+
+    def _order_with_lines(line_count):
+        items = [
+            Item(
+                name=f"Line Item {line_count}-{index}",
+                sku=f"LINE-{line_count}-{index}",
+                price=10,
+                quantity=50,
+                company_id=company.id,
+                is_active=True,
+            )
+            for index in range(line_count)
+        ]
+        db.add_all(items)
+        db.flush()
+        create_order(
+            db=db,
+            current_user=employee,
+            order_type="sale",
+            items=[{"item_id": item.id, "quantity": 1} for item in items],
+        )
+        order_id = db.query(Order.id).order_by(Order.id.desc()).limit(1).scalar()
+        db.commit()
+        db.expire_all()
+        employee.role  # Keep the principal's role loaded outside the measurement
+        return order_id
+
+    def _count_cancel(order_id):
+        count_statements.clear()
+        cancel_order(db, order_id, employee)
+        return len(count_statements)
+
+    single = _count_cancel(_order_with_lines(1))
+    many = _count_cancel(_order_with_lines(15))
+
+    assert single == many
+    assert many <= 5  # order, lines + items, company, stock update, status rollup
@@ -1,4 +1,11 @@
-from api.services.order_service import count_orders_by_status
+from api.db.order_stats_db import rebuild_order_status_counts
+from api.models import Order, OrderStatusCount
+from api.services.order_service import (
+    cancel_order,
+    complete_order,
+    count_orders_by_status,
+    create_order,
+)
 
 
 def test_count_orders_by_status_returns_all_keys(db, employee, order):
@@ -8,6 +15,60 @@ def test_count_orders_by_status_returns_all_keys(db, employee, order):
 
 
 def test_count_orders_by_status_counts_pending(db, employee, order):
+    rebuild_order_status_counts(db)
+
     result = count_orders_by_status(db, employee)
 
     assert result.as_dict()["pending"] >= 1
+
+
+def _create_sale(db, employee, item):
+    create_order(
+        db=db,
+        current_user=employee,
+        order_type="sale",
+        items=[{"item_id": item.id, "quantity": 1}],
+    )
+    return db.query(Order).order_by(Order.id.desc()).first()
+
+
+def test_order_changes_update_status_counts(db, employee, item):
+    first = _create_sale(db, employee, item)
+    second = _create_sale(db, employee, item)
+    _create_sale(db, employee, item)
+
+    cancel_order(db, first.id, employee)
+    complete_order(db, second.id, employee)
+
+    result = count_orders_by_status(db, employee)
+
+    assert result.as_dict() == {"pending": 1, "completed": 1, "cancelled": 1}
+
+
+def test_rebuild_matches_incremental_counts(db, employee, item):
+    first = _create_sale(db, employee, item)
+    _create_sale(db, employee, item)
+    cancel_order(db, first.id, employee)
+
+    def snapshot():
+        return sorted(
+            (row.company_id, row.day, row.order_type, row.status, row.order_count)
+            for row in db.query(OrderStatusCount)
+            if row.order_count
+        )
+
+    incremental = snapshot()
+    rebuild_order_status_counts(db)
+    db.expire_all()
+
+    assert snapshot() == incremental
+
+
+def test_count_orders_by_status_scoped_to_company(db, employee, admin, item, company2):
+    _create_sale(db, employee, item)
+    admin.company_id = company2.id
+    db.flush()
+
+    result = count_orders_by_status(db, admin)
+
+    assert result.as_dict() == {"pending": 0, "completed": 0, "cancelled": 0}
@@ -52,3 +52,61 @@ def test_create_order_empty_fields(db, employee):
             order_type="",
             items=[],
         )
+
+
+def _make_items(db, company, count):
+    from api.models import Item
+
+    items = [
+        Item(
+            name=f"Bulk Item {index}",
+            sku=f"BULK-{index:03d}",
+            price=10,
+            quantity=100,
+            company_id=company.id,
+            is_active=True,
+        )
+        for index in range(count)
+    ]
+    db.add_all(items)
+    db.commit()
+    return [item.id for item in items]
+
+
+def _count_create_order_statements(db, employee, item_ids, count_statements):
+    count_statements.clear()
+    create_order(
+        db=db,
+        current_user=employee,
+        order_type="sale",
+        items=[{"item_id": item_id, "quantity": 1} for item_id in item_ids],
+    )
+    return len(count_statements)
+
+
+def test_create_order_round_trips_do_not_grow_with_lines(db, employee, company, count_statements):
+    item_ids = _make_items(db, company, 40)
+    _count_create_order_statements(db, employee, item_ids[:1], count_statements)  # Warm up lazy loads
+
+    small = _count_create_order_statements(db, employee, item_ids[1:3], count_statements)
+    large = _count_create_order_statements(db, employee, item_ids[3:], count_statements)
+
+    assert small == large
+
+
+def test_create_order_inserts_every_line(db, employee, company):
+    from api.models import Order, OrderItem
+
+    item_ids = _make_items(db, company, 5)
+
+    create_order(
+        db=db,
+        current_user=employee,
+        order_type="restock",
+        items=[{"item_id": item_id, "quantity": 3} for item_id in item_ids],
+    )
+
+    order = db.query(Order).order_by(Order.id.desc()).first()
+    lines = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
+    assert sorted(line.item_id for line in lines) == sorted(item_ids)
+    assert all(line.quantity == 3 for line in lines)
@@ -0,0 +1,76 @@
+import pytest
+
+from api.db.item_db import apply_stock_adjustments
+from api.domain import InsufficientStockError, StockAdjustment
+from api.models import Item, Order
+from api.services.order_service import cancel_order, create_order
+
+
+@pytest.fixture
+def second_item(db, company):
+    item = Item(
+        name="Second Item",
+        sku="TEST-002",
+        price=50,
+        quantity=1,
+        company_id=company.id,
+        is_active=True,
+    )
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def test_adjustments_applied_in_one_statement(db, item, second_item, count_statements):
+    adjustments = [StockAdjustment(item.id, -4), StockAdjustment(second_item.id, 5)]
+    count_statements.clear()
+
+    applied = apply_stock_adjustments(db, adjustments)
+
+    assert len(count_statements) == 1
+    assert applied == {item.id: 6, second_item.id: 6}
+    assert item.quantity == 6
+    assert second_item.quantity == 6
+
+
+def test_adjustments_report_lines_that_would_oversell(db, item, second_item):
+    applied = apply_stock_adjustments(
+        db,
+        [StockAdjustment(item.id, -1), StockAdjustment(second_item.id, -2)],
+    )
+
+    assert applied == {item.id: 9}
+    db.refresh(second_item)
+    assert second_item.quantity == 1
+
+
+def test_repeated_item_deltas_are_combined(db, item):
+    applied = apply_stock_adjustments(
+        db,
+        [StockAdjustment(item.id, -6), StockAdjustment(item.id, -6)],
+    )
+
+    assert applied == {}
+    db.refresh(item)
+    assert item.quantity == 10
+
+
+def test_cancel_restock_after_stock_was_sold_is_rejected(db, employee, item):
+    create_order(
+        db=db,
+        current_user=employee,
+        order_type="restock",
+        items=[{"item_id": item.id, "quantity": 5}],
+    )
+    restock = db.query(Order).order_by(Order.id.desc()).first()
+
+    # Stock sold elsewhere meanwhile; removing the restocked units would go negative
+    item.quantity = 3
+    db.flush()
+
+    with pytest.raises(InsufficientStockError) as exc:
+        cancel_order(db, restock.id, employee)
+
+    assert exc.value.item_ids == [item.id]
+    assert "Test Item" in str(exc.value)
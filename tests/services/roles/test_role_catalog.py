@@ -0,0 +1,57 @@
+from api.models.role import Role
+from api.services import role_service
+from api.services.role_service import (
+    get_role_catalog,
+    get_subroles_for_role,
+    reload_role_catalog,
+    resolve_assignable_role,
+)
+
+
+def count_role_loads(monkeypatch):
+    loads = []
+    original = role_service.get_all_roles
+
+    def counting(db):
+        loads.append(1)
+        return original(db)
+
+    monkeypatch.setattr(role_service, "get_all_roles", counting)
+    return loads
+
+
+def test_catalog_is_loaded_once(db, admin, role_manager, role_employee, monkeypatch):
+    loads = count_role_loads(monkeypatch)
+
+    resolve_assignable_role(db=db, role_name="manager", current_user=admin)
+    get_subroles_for_role(db, "admin", None)
+    resolve_assignable_role(db=db, role_name="employee", current_user=admin)
+
+    assert len(loads) == 1
+
+
+def test_subroles_are_ordered_by_rank(db, role_superadmin, role_admin, role_manager, role_employee):
+    names = [role.name for role in get_subroles_for_role(db, "admin", None)]
+
+    assert names == ["admin", "manager", "employee"]
+    assert get_role_catalog(db).subrole_names("manager") == {"manager", "employee"}
+
+
+def test_reload_picks_up_new_roles(db, role_admin):
+    assert get_role_catalog(db).get("auditor") is None
+
+    db.add(Role(name="auditor", rank=5))
+    db.commit()
+
+    assert get_role_catalog(db).get("auditor") is None
+    assert reload_role_catalog(db).get("auditor").rank == 5
+    assert get_role_catalog(db).get("auditor") is not None
+
+
+def test_empty_roles_table_is_not_cached(db, monkeypatch):
+    loads = count_role_loads(monkeypatch)
+
+    get_role_catalog(db)
+    get_role_catalog(db)
+
+    assert len(loads) == 2
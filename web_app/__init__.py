@@ -41,7 +41,9 @@ def set_language():
 from web_app.routes.auth import auth_bp
 from web_app.routes.companies import companies_bp
 from web_app.routes.context import context_bp
+from web_app.routes.dashboard import dashboard_bp
 from web_app.routes.items import items_bp
+from web_app.routes.metrics import metrics_bp
 from web_app.routes.orders import orders_bp
 from web_app.routes.users import users_bp
 
@@ -51,6 +53,8 @@ app.register_blueprint(users_bp)
 app.register_blueprint(companies_bp)
 app.register_blueprint(items_bp)
 app.register_blueprint(orders_bp)
+app.register_blueprint(dashboard_bp)
+app.register_blueprint(metrics_bp)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000)
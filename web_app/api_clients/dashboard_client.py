@@ -0,0 +1,10 @@
+from flask import jsonify
+from web_app.api_clients.utils import api_get, APIClientError
+
+
+def get_dashboard():
+    try:
+        res = api_get("/api/dashboard")
+        return res.json()
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
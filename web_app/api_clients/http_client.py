@@ -0,0 +1,179 @@
+"""
+Process-wide pooled HTTP client for web_app → API calls.
+
+Every proxied call goes through one requests.Session per worker process, so
+TCP connections to the API are kept alive and reused instead of being opened
+per call. Calls are bounded by connect/read timeouts, and idempotent verbs are
+retried a bounded number of times on connection errors and gateway responses.
+
+Usage:
+    res = get_http_session().request("GET", url, timeout=request_timeout())
+    http_pool_stats()  # {"pools": [...], "requests": ..., "errors": ...}
+"""
+
+# Import standard library modules
+import os
+import threading
+from typing import Optional, Tuple
+
+# Import HTTP client components
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Import pool, timeout and retry configuration
+from web_app.config import (
+    API_CONNECT_TIMEOUT,
+    API_MAX_RETRIES,
+    API_POOL_CONNECTIONS,
+    API_POOL_MAXSIZE,
+    API_READ_TIMEOUT,
+    API_RETRY_BACKOFF,
+)
+
+# Verbs that may be repeated without changing the outcome (POST is never retried
+# once sent; a failed connect is still retried because nothing reached the API)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Gateway statuses worth retrying: API restarting or overloaded
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_counters = {"requests": 0, "errors": 0, "timeouts": 0}
+
+
+def build_retry() -> Retry:
+    """Build the retry policy applied by the pooled adapter."""
+    return Retry(
+        total=API_MAX_RETRIES,
+        connect=API_MAX_RETRIES,
+        read=API_MAX_RETRIES,
+        status=API_MAX_RETRIES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        status_forcelist=RETRY_STATUSES,
+        backoff_factor=API_RETRY_BACKOFF,
+        raise_on_status=False,  # Hand the last response back to api_request
+        respect_retry_after_header=True,
+    )
+
+
+def build_session() -> requests.Session:
+    """
+    Create a session whose HTTP(S) adapters keep a bounded keep-alive pool.
+
+    Returns:
+        requests.Session: Session with pooled adapters and retry policy
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=API_POOL_CONNECTIONS,
+        pool_maxsize=API_POOL_MAXSIZE,
+        max_retries=build_retry(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the pooled session of the current process.
+
+    The session is created lazily and re-created after a fork (gunicorn
+    preload), so workers never share sockets inherited from the master.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _lock:
+        if _session is None or _session_pid != pid:
+            _session = build_session()
+            _session_pid = pid
+        return _session
+
+
+def request_timeout() -> Tuple[float, float]:
+    """(connect, read) timeout passed with every request."""
+    return (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+
+
+def send(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session with default timeouts.
+
+    Args:
+        method: HTTP method
+        url: Absolute URL
+        **kwargs: Passed to requests.Session.request
+
+    Raises:
+        requests.RequestException: Network error, timeout or exhausted retries
+    """
+    kwargs.setdefault("timeout", request_timeout())
+    _count("requests")
+    try:
+        return get_http_session().request(method.upper(), url, **kwargs)
+    except requests.Timeout:
+        _count("timeouts")
+        _count("errors")
+        raise
+    except requests.RequestException:
+        _count("errors")
+        raise
+
+
+def http_pool_stats() -> dict:
+    """
+    Snapshot of the connection pools and request counters of this process.
+
+    Returns:
+        dict: requests/errors/timeouts counters and one entry per pooled host
+        with opened connections, served requests and idle keep-alive sockets
+    """
+    with _lock:
+        counters = dict(_counters)
+        session = _session if _session_pid == os.getpid() else None
+
+    pools = []
+    if session is not None:
+        for adapter in {id(a): a for a in session.adapters.values()}.values():
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None:
+                continue
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                pools.append({
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "connections_opened": pool.num_connections,
+                    "requests": pool.num_requests,
+                    "idle": idle,
+                    "maxsize": pool.pool.maxsize if pool.pool else 0,
+                })
+
+    return {**counters, "pools": pools}
+
+
+def reset_http_session() -> None:
+    """Close pooled connections and reset counters (used in tests and on shutdown)."""
+    global _session, _session_pid
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
+        for name in _counters:
+            _counters[name] = 0
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _counters[name] += 1
@@ -1,5 +1,14 @@
 from flask import jsonify
-from web_app.api_clients.utils import api_get, api_post, api_put, api_patch, APIClientError
+from web_app.api_clients.utils import (
+    api_get,
+    api_get_stream,
+    api_post,
+    api_post_stream,
+    api_put,
+    api_patch,
+    stream_response,
+    APIClientError,
+)
 
 
 def paginate_item(data):
@@ -19,6 +28,22 @@ def create_item(data):
         return jsonify({"error": e.message}), e.status_code
 
 
+def import_items(stream, content_type):
+    try:
+        res = api_post_stream("/api/items/import", stream, content_type)
+        return (res.text, res.status_code, res.headers.items())
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+
+def export_items(fmt):
+    try:
+        res = api_get_stream("/api/items/export", params={"format": fmt})
+        return stream_response(res)
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+
 def edit_item(item_id: int, data):
     try:
         res = api_put(f"/api/items/{item_id}", data)
@@ -0,0 +1,15 @@
+from flask import jsonify
+from web_app.api_clients.http_client import http_pool_stats
+from web_app.api_clients.utils import api_get, APIClientError
+
+
+def get_metrics():
+    try:
+        res = api_get("/api/metrics")
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
+    # The API authorises the caller (superadmin only); web_app adds its own pool
+    return jsonify({
+        "api": res.json(),
+        "web_app": {"http_pool": http_pool_stats()},
+    })
@@ -1,5 +1,5 @@
 from flask import jsonify
-from web_app.api_clients.utils import api_get, api_post, APIClientError
+from web_app.api_clients.utils import api_get, api_get_stream, api_post, stream_response, APIClientError
 
 
 def paginate_order(data):
@@ -12,6 +12,14 @@ def paginate_order_items(order_id, data):
     return (res.text, res.status_code, res.headers.items())
 
 
+def export_orders(fmt):
+    try:
+        res = api_get_stream("/api/orders/export", params={"format": fmt})
+        return stream_response(res)
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+
 def orders_this_week():
     try:
         res = api_get("/api/orders/stats")
@@ -46,3 +54,19 @@ def complete_order(order_id: int):
         return res.json()
     except APIClientError as e:
         return jsonify({"error": e.message}), e.status_code
+
+
+def complete_orders(data):
+    try:
+        res = api_post("/api/orders/bulk/complete", data)
+        return res.json()
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+
+def cancel_orders(data):
+    try:
+        res = api_post("/api/orders/bulk/cancel", data)
+        return res.json()
+    except APIClientError as e:
+        return jsonify({"error": e.message}), e.status_code
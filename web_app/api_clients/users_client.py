@@ -24,6 +24,7 @@ def login_user(identifier, password):
 
         user_data = res.json()
         session["token"] = user_data["access_token"]
+        session["refresh_token"] = user_data.get("refresh_token")
         build_user_session(user_data)
 
         return jsonify({
@@ -45,6 +46,7 @@ def exchange_oauth_code(code: str):
     res = api_post("/api/auth/oauth/exchange", {"code": code})
     user_data = res.json()
     session["token"] = user_data["access_token"]
+    session["refresh_token"] = user_data.get("refresh_token")
     build_user_session(user_data)
 
 
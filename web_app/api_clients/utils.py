@@ -1,8 +1,15 @@
 # Import Flask components for JSON responses, session management, and template rendering
-from flask import jsonify, session, render_template
+from flask import Response, jsonify, session, render_template
 from functools import wraps  # Decorator utility for preserving function metadata
+import base64  # Reads the exp claim of access tokens
+import json
+import time
 import requests  # HTTP client library for API communication
 from web_app.config import API_URL  # Backend API base URL configuration
+from web_app.api_clients.http_client import send  # Pooled keep-alive session with timeouts/retries
+
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes relayed per chunk when proxying downloads
+TOKEN_REFRESH_MARGIN = 30  # Seconds before expiry at which raw-body requests refresh first
 
 # --- Custom Exception Classes ---
 
@@ -25,16 +32,21 @@ class APIUnauthorizedError(APIClientError):
 
 # --- Core API Communication Functions ---
 
-def api_request(method, endpoint, data=None, params=None):
+def api_request(method, endpoint, data=None, params=None, body=None, content_type=None, stream=False):
     """
     Generic HTTP request handler for backend API communication.
-    Handles authentication, error processing, and session management.
+    Handles authentication, error processing, and session management;
+    an expired access token is renewed via the refresh token and the
+    request retried once.
     
     Args:
         method (str): HTTP method (GET, POST, PUT, DELETE, etc.)
         endpoint (str): API endpoint path (with or without leading slash)
         data (dict, optional): JSON payload for POST/PUT requests
         params (dict, optional): URL query parameters for GET requests
+        body (file-like or iterable, optional): Raw body streamed instead of JSON data
+        content_type (str, optional): Content-Type of the raw body
+        stream (bool): Leave the response body unread (iterate it with iter_content)
         
     Returns:
         requests.Response: HTTP response object from the backend API
@@ -47,29 +59,47 @@ def api_request(method, endpoint, data=None, params=None):
     endpoint = endpoint if endpoint.startswith("/") else f"/{endpoint}"
     url = f"{API_URL}{endpoint}"
     
-    # Set default headers for JSON communication
-    headers = {"Content-Type": "application/json"}
+    # Set default headers for JSON communication (raw bodies keep their own type)
+    headers = {"Content-Type": content_type if body is not None else "application/json"}
 
-    # Add authentication token if user is logged in
-    token = session.get("token")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    def send_request():
+        # Add authentication token if user is logged in
+        token = session.get("token")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
 
-    try:
-        # Make HTTP request with configured parameters
-        res = requests.request(
-            method.upper(),
+        # Make HTTP request over the pooled session (default connect/read timeouts)
+        return send(
+            method,
             url,
             json=data,           # Automatically serialize dict to JSON
+            data=body,           # Raw body is streamed, never buffered whole
             params=params,       # URL query parameters
             headers=headers,
-            # timeout=5          # Uncommented for production use
+            stream=stream,       # Body downloaded lazily (large exports)
         )
 
+    try:
+        # Raw bodies are consumed by the first attempt and cannot be resent:
+        # renew an (almost) expired access token before sending them
+        if body is not None and _token_expiring(session.get("token")):
+            _refresh_session_token()
+
+        res = send_request()
+
+        # Expired access token: renew it with the refresh token and retry once
+        if res.status_code == 401 and _refresh_session_token():
+            res.close()
+            if body is not None:
+                # Session is valid again, only this upload has to be repeated
+                raise APIClientError("Session renewed, please send the file again", 401)
+            res = send_request()
+
         # Handle authentication failures
         if res.status_code == 401:
             # Clear invalid session data
             session.pop("token", None)
+            session.pop("refresh_token", None)
             session.pop("user", None)
             
             # Raise specific auth error
@@ -87,13 +117,64 @@ def api_request(method, endpoint, data=None, params=None):
 
         return res
         
-    except APIUnauthorizedError:
-        # Re-raise auth errors without modification
+    except APIClientError:
+        # Re-raise auth and renewal errors without modification
         raise
     except requests.RequestException as e:
-        # Handle network errors, timeouts, connection issues
+        # Handle network errors, connection issues and exhausted retries
+        if isinstance(e, requests.Timeout):
+            raise APIClientError("API request timed out", 504)
         raise APIClientError(str(e), 502)
 
+def _token_expiring(token):
+    """
+    Whether an access token expires within TOKEN_REFRESH_MARGIN seconds.
+    
+    Reads the exp claim without verifying the signature (the API verifies
+    it); tokens that cannot be read are treated as valid.
+    """
+    if not token:
+        return False
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return claims["exp"] - time.time() < TOKEN_REFRESH_MARGIN
+    except (IndexError, KeyError, TypeError, ValueError):
+        return False
+
+def _refresh_session_token():
+    """
+    Exchange the session's refresh token for a new access token.
+    
+    Returns:
+        bool: True if session["token"] was renewed; False if there is no
+        refresh token or the API rejected it (the user must log in again)
+        
+    Note: A cheap token lookup on the API instead of a password login
+    """
+    refresh_token = session.get("refresh_token")
+    if not refresh_token:
+        return False
+
+    try:
+        res = send(
+            "post",
+            f"{API_URL}/api/auth/refresh",
+            json={"refresh_token": refresh_token},
+            headers={"Content-Type": "application/json"},
+        )
+    except requests.RequestException:
+        return False
+
+    if res.status_code != 200:
+        session.pop("refresh_token", None)
+        return False
+
+    tokens = res.json()
+    session["token"] = tokens["access_token"]
+    session["refresh_token"] = tokens["refresh_token"]  # Rotated; the old one is spent
+    return True
+
 def api_get(endpoint, params=None):
     """
     Convenience wrapper for GET requests to the backend API.
@@ -120,6 +201,58 @@ def api_post(endpoint, data=None):
     """
     return api_request("post", endpoint, data=data)
 
+def api_post_stream(endpoint, body, content_type):
+    """
+    POST a raw body (e.g. an uploaded file) to the backend API without buffering it.
+    
+    Args:
+        endpoint (str): API endpoint path
+        body (file-like): Stream read chunk by chunk while sending
+        content_type (str): Content-Type forwarded to the API
+        
+    Returns:
+        requests.Response: HTTP response object
+    """
+    return api_request("post", endpoint, body=body, content_type=content_type)
+
+def api_get_stream(endpoint, params=None):
+    """
+    GET a large response (e.g. an export) without downloading it up front.
+    
+    Args:
+        endpoint (str): API endpoint path
+        params (dict, optional): URL query parameters
+        
+    Returns:
+        requests.Response: Response whose body is still on the wire; pass it
+        to stream_response or close it
+    """
+    return api_request("get", endpoint, params=params, stream=True)
+
+def stream_response(res):
+    """
+    Relay a streamed API response to the browser chunk by chunk.
+    
+    Args:
+        res (requests.Response): Response from api_get_stream
+        
+    Returns:
+        flask.Response: Streaming response with the API's content type and
+        download name; the upstream connection is released when the relay ends
+    """
+    def relay():
+        try:
+            yield from res.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        finally:
+            res.close()
+
+    headers = {
+        name: res.headers[name]
+        for name in ("Content-Type", "Content-Disposition")
+        if name in res.headers
+    }
+    return Response(relay(), status=res.status_code, headers=headers)
+
 def api_put(endpoint, data=None):
     """Convenience wrapper for PUT requests to the backend API."""
     return api_request("put", endpoint, data=data)
@@ -7,6 +7,14 @@ API_URL = os.environ.get("API_URL")
 FLASK_SECRET_KEY = os.environ.get("FLASK_SECRET_KEY")
 CANONICAL_HOST = os.environ.get("CANONICAL_HOST", "localhost:8000")
 
+# Pooled HTTP client used for every call to the API
+API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "4"))    # Distinct hosts kept pooled
+API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "32"))           # Keep-alive connections per host
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "3.05"))  # Seconds to establish TCP connection
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", "30"))         # Seconds to wait for response bytes
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "2"))              # Retries for idempotent verbs only
+API_RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", "0.2"))      # Exponential backoff base (seconds)
+
 
 def validate_config() -> None:
     if IS_PRODUCTION:
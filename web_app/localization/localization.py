@@ -1,88 +1,123 @@
 # Import standard library modules for JSON handling and file system operations
 import json
 import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+# Import HTML-safe JSON serializer (same escaping as the Jinja2 |tojson filter)
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+
+# Language used when the session carries no (or an unknown) language
+DEFAULT_LANGUAGE = "en"
+
+
+@dataclass(frozen=True)
+class TranslationCatalog:
+    """
+    Immutable translations of one language.
+
+    Catalogs are built once at startup and shared by all requests and threads;
+    a request only selects the catalog of its language, so no request can
+    observe another request's language.
+
+    Attributes:
+        lang: Language code (e.g. 'en', 'cz')
+        translations: Read-only mapping {"key": "translated_text"}
+        js_translations: translations pre-serialized for the
+            <script id="js-translations"> block (HTML-safe JSON)
+    """
+    lang: str
+    translations: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    js_translations: Markup = Markup("{}")
+
+    @classmethod
+    def build(cls, lang, translations):
+        """Freeze translations and pre-render their JSON for templates."""
+        return cls(
+            lang=lang,
+            translations=MappingProxyType(dict(translations)),
+            js_translations=htmlsafe_json_dumps(translations),
+        )
+
+    def t(self, key):
+        """
+        Translate a given key.
+
+        Args:
+            key (str): Translation key to look up
+
+        Returns:
+            str: Translated text if key exists, otherwise the key itself as fallback
+
+        The fallback behavior ensures the application continues to function
+        even with missing translations, displaying the key instead of crashing.
+        """
+        return self.translations.get(key, key)
+
 
 class Translator:
     """
-    Multi-language translation manager for internationalization (i18n) support.
-    Handles loading, caching, and retrieving translated text from JSON language files.
+    Multi-language translation registry for internationalization (i18n) support.
+    Loads every {lang}.json of the localization directory once and hands out
+    immutable per-language catalogs without any file I/O per request.
     """
-    
-    def __init__(self, lang="en"):
+
+    def __init__(self, base_path=None):
         """
-        Initialize the translator with a default language.
-        
+        Load all language files found in base_path.
+
         Args:
-            lang (str): Language code (e.g., 'en', 'fr', 'de'). Defaults to English.
+            base_path (str, optional): Directory containing {lang}.json files.
+                Defaults to the directory of this module.
         """
         # Get the absolute path of the localization directory
-        self.base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        # Store current language preference
-        self.lang = lang
-        
-        # Initialize empty dictionary to store translation key-value pairs
-        self.translations = {}
-        
-        # Load initial translations for the specified language
-        self.load_translations(lang)
-
-    def load_translations(self, lang):
+        self.base_path = base_path or os.path.dirname(os.path.abspath(__file__))
+
+        # Build one immutable catalog per language file
+        self.catalogs = MappingProxyType(self.load_catalogs())
+
+        # Unknown languages fall back to the default catalog (or an empty one)
+        self.fallback = self.catalogs.get(DEFAULT_LANGUAGE) or TranslationCatalog(DEFAULT_LANGUAGE)
+
+    def load_catalogs(self):
         """
-        Load translation data from a JSON file for the specified language.
-        
-        Args:
-            lang (str): Language code to load translations for
-        
-        Expected file format: {lang}.json (e.g., en.json, fr.json)
+        Read and parse every language file.
+
+        Expected file format: {lang}.json (e.g., en.json, cz.json)
         File should contain key-value pairs: {"key": "translated_text"}
+
+        Returns:
+            dict: {lang: TranslationCatalog}
         """
-        # Construct path to language-specific JSON file
-        path = os.path.join(self.base_path, f"{lang}.json")
-        
-        try:
+        catalogs = {}
+        for filename in sorted(os.listdir(self.base_path)):
+            lang, ext = os.path.splitext(filename)
+            if ext != ".json":
+                continue
+
             # Open and parse JSON translation file with UTF-8 encoding
-            with open(path, encoding='utf-8') as jsonfile:
-                self.translations = json.load(jsonfile)
-        except FileNotFoundError:
-            # Gracefully handle missing language files by using empty translations
-            # This prevents crashes when requested language files don't exist
-            self.translations = {}
-            print(f"Warning: Translation file '{lang}.json' not found. Using fallback.")
-
-    def set_language(self, lang):
-        """
-        Change the current language and reload translations.
-        
-        Args:
-            lang (str): New language code to switch to
-        
-        This method allows dynamic language switching during runtime.
-        """
-        # Update current language setting
-        self.lang = lang
-        
-        # Load translations for the new language
-        self.load_translations(lang)
+            with open(os.path.join(self.base_path, filename), encoding='utf-8') as jsonfile:
+                catalogs[lang] = TranslationCatalog.build(lang, json.load(jsonfile))
+        return catalogs
 
-    def t(self, key):
+    def get(self, lang):
         """
-        Translate a given key to the current language.
-        
+        Select the catalog for a language (no I/O).
+
         Args:
-            key (str): Translation key to look up
-            
+            lang (str): Language code from the user's session
+
         Returns:
-            str: Translated text if key exists, otherwise returns the key itself as fallback
-            
-        The fallback behavior ensures the application continues to function
-        even with missing translations, displaying the key instead of crashing.
+            TranslationCatalog: Catalog of lang, or the default language catalog
+            when lang has no translation file
         """
-        return self.translations.get(key, key)
+        return self.catalogs.get(lang, self.fallback)
 
 # --- File Structure Expected ---
 # localization/
 # ├── localization.py (this file)
 # ├── en.json (English translations)
-# ├── fr.json (French translations)
-# └── de.json (German translations, etc.)
\ No newline at end of file
+# ├── cz.json (Czech translations)
+# └── de.json (German translations, etc.)
@@ -7,7 +7,7 @@ from web_app.localization.localization import Translator
 # Create Blueprint for global context management (no URL prefix - applies to all routes)
 context_bp = Blueprint("context", __name__)
 
-# Initialize global translator instance for handling internationalization
+# Load every language catalog once at startup (immutable, shared across threads)
 translator = Translator()
 
 @context_bp.before_app_request
@@ -21,8 +21,8 @@ def load_global_context():
     # Get user's language preference from session, default to English
     g.lang = session.get("lang", "en")
     
-    # Configure translator with user's preferred language
-    translator.set_language(g.lang)
+    # Select the preloaded catalog for this request (no file I/O, no shared state)
+    g.translations = translator.get(g.lang)
 
     # --- User context setup ---
     # Store user's role from session for authorization checks
@@ -43,7 +43,7 @@ def inject_globals():
     """
     return dict(
         # Translation function - allows templates to use {{ t('key') }} for localized text
-        t=lambda key: translator.t(key),
+        t=g.translations.t,
         
         # User role - enables role-based conditional rendering in templates
         role=g.role,
@@ -54,6 +54,6 @@ def inject_globals():
         # Company ID - enables company-specific template behavior
         company_id=g.company_id,
         
-        # JavaScript translations - provides client-side access to translation data
-        js_translations=translator.translations
+        # JavaScript translations - JSON pre-rendered once per language
+        js_translations=g.translations.js_translations
     )
\ No newline at end of file
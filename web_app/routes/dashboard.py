@@ -0,0 +1,25 @@
+# Import Flask components for web routing
+from flask import Blueprint
+
+# Import custom authentication decorator for route protection
+from web_app.api_clients.utils import token_required
+
+# Import dashboard API client function with proxy naming to avoid conflicts
+from web_app.api_clients.dashboard_client import (
+    get_dashboard as proxy_get_dashboard,  # All dashboard widgets in one call
+)
+
+# Create Blueprint for dashboard data with '/dashboard' URL prefix
+dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/dashboard')
+
+# --- API Endpoints ---
+
+@dashboard_bp.route("/snapshot")
+@token_required  # Requires valid API token for access
+def get_dashboard():
+    """
+    Get every dashboard widget (user stats, order counts, online users,
+    companies or low-stock items depending on role) in a single request.
+    Replaces separate calls per widget on dashboard load.
+    """
+    return proxy_get_dashboard()  # Forward request to API client
@@ -10,6 +10,8 @@ from web_app.api_clients.items_client import (
     get_item as proxy_get_item,                         # Fetch individual item data
     edit_item as proxy_edit_item,                       # Update item information
     paginate_item as proxy_paginate_item,               # Get paginated item list
+    import_items as proxy_import_items,                 # Bulk import from CSV/NDJSON
+    export_items as proxy_export_items,                 # Streamed CSV/NDJSON export
     toggle_item_is_active as proxy_toggle_item_is_active # Enable/disable items (naming inconsistency - should be toggle_item_is_active)
 )
 
@@ -44,6 +46,24 @@ def create_item():
     data = request.get_json()  # Extract JSON data from request body
     return proxy_create_item(data)  # Forward request to API client
 
+@items_bp.route("/import", methods=["POST"])
+@token_required  # Requires valid API token for access
+def import_items():
+    """
+    Bulk import items from a CSV or NDJSON file sent as the raw request body.
+    The body is streamed through to the API, so large files are never held in memory.
+    """
+    return proxy_import_items(request.stream, request.content_type)
+
+@items_bp.route("/export")
+@token_required  # Requires valid API token for access
+def export_items():
+    """
+    Download the item catalog as CSV (default) or NDJSON (?format=ndjson).
+    The API response is relayed chunk by chunk, so exports of any size use constant memory.
+    """
+    return proxy_export_items(request.args.get("format", "csv"))
+
 @items_bp.route("/get/<int:item_id>")
 @token_required  # Requires valid API token for access
 def get_item(item_id):
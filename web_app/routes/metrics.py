@@ -0,0 +1,25 @@
+# Import Flask components for web routing
+from flask import Blueprint
+
+# Import custom authentication decorator for route protection
+from web_app.api_clients.utils import token_required
+
+# Import metrics API client function with proxy naming to avoid conflicts
+from web_app.api_clients.metrics_client import (
+    get_metrics as proxy_get_metrics,  # API worker counters + web_app HTTP pool
+)
+
+# Create Blueprint for monitoring data with '/metrics' URL prefix
+metrics_bp = Blueprint('metrics', __name__, url_prefix='/metrics')
+
+# --- API Endpoints ---
+
+@metrics_bp.route("")
+@token_required  # Requires valid API token for access
+def get_metrics():
+    """
+    Counters of the API worker that answered (transactions, replica routing,
+    password hashing pool, caches) and of this web_app worker's HTTP pool.
+    Superadmin only; the API rejects other roles.
+    """
+    return proxy_get_metrics()  # Forward request to API client
@@ -11,6 +11,9 @@ from web_app.api_clients.orders_client import (
     create_order as proxy_create_order,                  # Create new order functionality
     cancel_order as proxy_cancel_order,                  # Cancel existing order
     complete_order as proxy_complete_order,              # Mark order as completed
+    export_orders as proxy_export_orders,                # Streamed CSV/NDJSON export
+    complete_orders as proxy_complete_orders,            # Complete many orders at once
+    cancel_orders as proxy_cancel_orders,                # Cancel many orders at once
     orders_this_week as proxy_orders_this_week           # Get weekly order statistics
 )
 
@@ -61,6 +64,15 @@ def paginate_order_items(order_id: int):
     data = request.get_json() or {}  # Get JSON data or empty dict if none provided
     return proxy_paginate_order_items(order_id, data)  # Forward to API client with order ID
 
+@orders_bp.route("/export")
+@token_required  # Requires valid API token for access
+def export_orders():
+    """
+    Download the company's orders as CSV (default) or NDJSON (?format=ndjson).
+    The API response is relayed chunk by chunk, so even millions of orders use constant memory.
+    """
+    return proxy_export_orders(request.args.get("format", "csv"))
+
 @orders_bp.route("/create", methods=["POST"])
 @token_required  # Requires valid API token for access
 def create_order():
@@ -96,6 +108,26 @@ def complete_order(order_id: int):
     """
     return proxy_complete_order(order_id)  # Forward completion request to API client
 
+@orders_bp.route("/bulk/complete", methods=["POST"])
+@token_required  # Requires valid API token for access
+def complete_orders():
+    """
+    Complete many orders in one request.
+    Accepts JSON payload {"order_ids": [...]}; returns the outcome of every order.
+    """
+    data = request.get_json() or {}  # Get JSON data or empty dict if none provided
+    return proxy_complete_orders(data)  # Forward bulk completion to API client
+
+@orders_bp.route("/bulk/cancel", methods=["POST"])
+@token_required  # Requires valid API token for access
+def cancel_orders():
+    """
+    Cancel many orders in one request.
+    Accepts JSON payload {"order_ids": [...]}; returns the outcome of every order.
+    """
+    data = request.get_json() or {}  # Get JSON data or empty dict if none provided
+    return proxy_cancel_orders(data)  # Forward bulk cancellation to API client
+
 @orders_bp.route("/order_counts")
 @token_required  # Requires valid API token for access
 def orders_this_week():
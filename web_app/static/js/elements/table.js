@@ -38,26 +38,32 @@ export function createPaginatedTable({
   tableName,
   actions,
   filters = {},
-  pageSize = 5
+  sort = [],           // [{ field, direction }] whitelisted per entity by the API
+  pageSize = 5,
+  initialData = null   // first page already fetched (e.g. dashboard snapshot)
 }) {
   let currentPage = 0;
 
   async function loadPage(page = 0) {
     currentPage = page;
 
+    const preloaded = page === 0 ? initialData : null;
+    initialData = null;  // later visits to page 0 fetch fresh data
+
     await renderTableFromFetcher({
       container,
       title,
       schema,
       actions,
-      fetcher: () =>
+      fetcher: () => preloaded ? Promise.resolve(preloaded) :
         apiFetch(`/${tableName}/paginate`, {
           method: "POST",
           headers: { "Content-Type": "application/json" },
           body: JSON.stringify({
             limit: pageSize,
             offset: page * pageSize,
-            filters
+            filters,
+            sort
           })
         }),
       afterRender: renderPagination
@@ -102,21 +108,24 @@ export async function createTableFromPaginate({
   tableName,
   actions,
   filters = {},
-  limit = 5
+  sort = [],
+  limit = 5,
+  initialData = null   // rows already fetched (e.g. dashboard snapshot)
 }) {
   await renderTableFromFetcher({
     container,
     title,
     schema,
     actions,
-    fetcher: () =>
+    fetcher: () => initialData ? Promise.resolve(initialData) :
       apiFetch(`/${tableName}/paginate`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
           limit,
           offset: 0,
-          filters
+          filters,
+          sort
         })
       })
   });
@@ -19,7 +19,20 @@ document.getElementById("logout-link")?.addEventListener("click", (e) => {
 // =====================================
 // Dashboard Logic
 // =====================================
-document.addEventListener("DOMContentLoaded", () => {
+// All widgets come from one snapshot request (/dashboard/snapshot)
+document.addEventListener("DOMContentLoaded", async () => {
+  let snapshot = null;
+  try {
+    snapshot = await apiFetch("/dashboard/snapshot");
+  } catch (err) {
+    console.error("Failed to load dashboard:", err);
+  }
+
+  renderTables(snapshot);
+  renderStats(snapshot);
+});
+
+function renderTables(snapshot) {
   const user_container = document.getElementById("users-table");
   const company_container = document.getElementById("companies-table");
   const low_item_stock_container = document.getElementById("low-item-stock-table")
@@ -40,6 +53,7 @@ document.addEventListener("DOMContentLoaded", () => {
       filters: {
         status: "online",
       },
+      initialData: snapshot?.online_users,
       actions: () => ""     // no action column in dashboard
     });
   }
@@ -55,6 +69,7 @@ document.addEventListener("DOMContentLoaded", () => {
       tableName: "companies",
       pageSize: 5,
       filters: {},
+      initialData: snapshot?.companies,
       actions: () => ""
     });
   }
@@ -69,26 +84,25 @@ document.addEventListener("DOMContentLoaded", () => {
       filters: {
         low_stock: true
       },
+      initialData: snapshot?.low_stock_items,
       actions: () => ""
     });
   }
-});
+}
 
 // =====================================
-// User Statistics (superadmin only)
+// Statistics cards
 // =====================================
-async function loadUserStats() {
+function renderStats(snapshot) {
   const container = document.getElementById("stats-container");
   if (!container) return;
 
   container.innerHTML = "";
 
   // --- Online users donut ---
-  try {
-    const res = await apiFetch("/users/get_user_stats");
-
-    const total = res.total_users ?? 0;
-    const online = res.online_users ?? 0;
+  if (snapshot?.user_stats) {
+    const total = snapshot.user_stats.total_users ?? 0;
+    const online = snapshot.user_stats.online_users ?? 0;
 
     createDonutStat({
       container,
@@ -98,9 +112,7 @@ async function loadUserStats() {
       label: t("users online"),
       color: "#28a745"
     });
-  } catch (err) {
-    console.error("Failed to load user stats:", err);
-
+  } else {
     createStatCard({
       container,
       title: t("Online Users"),
@@ -111,31 +123,27 @@ async function loadUserStats() {
     });
   }
 
-  // --- Orders made (static / later API) ---
-
-  const res = await fetch("/orders/order_counts");
-  const data = await res.json();
+  // --- Sale orders this week ---
+  const counts = snapshot?.order_counts ?? {};
 
   createStatCard({
     container,
     title: t("Pending sale orders"),
-    value: data.pending,
+    value: counts.pending ?? "—",
     description: t("this week")
   });
 
   createStatCard({
     container,
     title: t("Completed sale orders"),
-    value: data.completed,
+    value: counts.completed ?? "—",
     description: t("this week")
   });
 
   createStatCard({
     container,
     title: t("Cancelled sale orders"),
-    value: data.cancelled,
+    value: counts.cancelled ?? "—",
     description: t("this week")
   });
 }
-
-document.addEventListener("DOMContentLoaded", loadUserStats);
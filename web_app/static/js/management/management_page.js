@@ -46,6 +46,7 @@ export function initManagementPage(config) {
         tableName: table.tableName,
         pageSize: table.pageSize ?? 10,
         filters: table.filters ?? {},
+        sort: table.sort ?? [],
         actions: table.actions
       });
     }
@@ -43,6 +43,7 @@ initManagementPage({
     tableName: "orders",
     pageSize: 5,
     filters: {},
+    sort: [{ field: "created_at", direction: "desc" }],  // Newest orders first
     actions: renderOrderActions
   }
 });